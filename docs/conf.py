@@ -1,6 +1,7 @@
 """Sphinx configuration for adk-fluent documentation."""
 
 import datetime
+import os
 import re
 import warnings
 from pathlib import Path
@@ -92,16 +93,21 @@ myst_substitutions = {
 }
 myst_fence_as_directive = ["mermaid"]
 
-# Intersphinx — cross-reference to Python stdlib docs
+# Intersphinx — cross-reference to Python stdlib docs.
+# Sphinx >= 7.2 fetches these inventories concurrently (see pyproject docs extra).
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3", None),
 }
 
+# Single canonical config: forks and mirrors point "view/edit source" links at
+# their own repository via DOCS_SOURCE_REPO instead of keeping a second conf.py.
+_source_repository = os.environ.get("DOCS_SOURCE_REPO", "https://github.com/vamsiramakrishnan/adk-fluent")
+
 # Theme — Furo with custom brand colors and typography
 html_theme = "furo"
 html_title = "adk-fluent"
 html_theme_options = {
-    "source_repository": "https://github.com/vamsiramakrishnan/adk-fluent",
+    "source_repository": _source_repository,
     "source_branch": "master",
     "source_directory": "docs/",
     "announcement": (
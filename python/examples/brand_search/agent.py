@@ -78,21 +78,20 @@ comparison_root = (
     Agent("comparison_root_agent", MODEL)
     .describe("A helpful agent to compare titles")
     .instruct(COMPARISON_ROOT_PROMPT)
-    .sub_agents([comparison_generator.build(), comparison_critic.build()])
+    .sub_agent(comparison_generator)
+    .sub_agent(comparison_critic)
 )
 
 # --- Root agent ---
+# Sub-agents are passed as builders via .sub_agent(): each is built exactly
+# once, inside its parent's .build(), rather than eagerly at module level.
 
 root_agent = (
     Agent("brand_search_optimization", MODEL)
     .describe("A helpful assistant for brand search optimization.")
     .instruct(ROOT_PROMPT)
-    .sub_agents(
-        [
-            keyword_finding.build(),
-            search_results.build(),
-            comparison_root.build(),
-        ]
-    )
+    .sub_agent(keyword_finding)
+    .sub_agent(search_results)
+    .sub_agent(comparison_root)
     .build()
 )
@@ -98,10 +98,16 @@ report_composer = (
 # >> creates Pipeline (SequentialAgent)
 # * until(...) creates Loop that exits when predicate is satisfied,
 #   replacing the manual EscalationChecker BaseAgent entirely
+# .proceed_if() skips the follow-up search once the evaluator passes; the
+#   loop only checks until() after the whole body has run
 
-refinement_loop = (research_evaluator >> enhanced_search) * until(
-    lambda s: s.get("research_evaluation", {}).get("grade") == "pass",
-    max=MAX_ITERATIONS,
+
+def research_passed(s):
+    return s.get("research_evaluation", {}).get("grade") == "pass"
+
+
+refinement_loop = (research_evaluator >> enhanced_search.proceed_if(lambda s: not research_passed(s))) * until(
+    research_passed, max=MAX_ITERATIONS
 )
 
 research_pipeline = (
@@ -4,6 +4,7 @@ Contains all domain logic that is shared between the native ADK and fluent API
 versions of the Deep Search multi-agent research system.
 """
 
+import itertools
 import re
 from collections.abc import AsyncGenerator
 from typing import Literal
@@ -310,63 +311,69 @@ creating, refining, and executing structured research plans.
 # Callbacks
 # =====================================================================
 
+# A citation tag plus any whitespace between it and following punctuation,
+# so the link and the punctuation are joined in the same pass
+_CITE_RE = re.compile(r'<cite\s+source\s*=\s*["\']?\s*(src-\d+)\s*["\']?\s*/>(?:\s*([.,;:]))?')
+
 
 def collect_research_sources_callback(callback_context):
     """Extract grounding metadata from session events into structured state.
 
-    Walks all session events, pulling grounding_chunks (URLs / titles) and
-    grounding_supports (claim-to-source mappings with confidence scores)
-    into two state dictionaries:
+    Walks the session events added since the previous call, pulling
+    grounding_chunks (URLs / titles) and grounding_supports (claim-to-source
+    mappings with confidence scores) into two state dictionaries:
 
     - ``url_to_short_id``: maps canonical URL -> "src-N"
     - ``sources``: maps "src-N" -> {title, url, domain, supported_claims}
+
+    The number of events already walked is kept in ``sources_scanned_events``,
+    so repeated calls (once per loop iteration) never record a claim twice.
     """
     session = callback_context._invocation_context.session
     url_to_short_id = callback_context.state.get("url_to_short_id", {})
     sources = callback_context.state.get("sources", {})
-    id_counter = len(url_to_short_id) + 1
+    scanned = callback_context.state.get("sources_scanned_events", 0)
+    id_counter = itertools.count(len(url_to_short_id) + 1)
 
-    for event in session.events:
-        if not (event.grounding_metadata and event.grounding_metadata.grounding_chunks):
+    for event in session.events[scanned:]:
+        metadata = event.grounding_metadata
+        if not (metadata and metadata.grounding_chunks):
             continue
 
         chunks_info: dict[int, str] = {}
-        for idx, chunk in enumerate(event.grounding_metadata.grounding_chunks):
+        for idx, chunk in enumerate(metadata.grounding_chunks):
             if not chunk.web:
                 continue
             url = chunk.web.uri
-            title = chunk.web.title if chunk.web.title != chunk.web.domain else chunk.web.domain
-            if url not in url_to_short_id:
-                short_id = f"src-{id_counter}"
+            short_id = url_to_short_id.get(url)
+            if short_id is None:
+                short_id = f"src-{next(id_counter)}"
                 url_to_short_id[url] = short_id
                 sources[short_id] = {
                     "short_id": short_id,
-                    "title": title,
+                    "title": chunk.web.title if chunk.web.title != chunk.web.domain else chunk.web.domain,
                     "url": url,
                     "domain": chunk.web.domain,
                     "supported_claims": [],
                 }
-                id_counter += 1
-            chunks_info[idx] = url_to_short_id[url]
-
-        if event.grounding_metadata.grounding_supports:
-            for support in event.grounding_metadata.grounding_supports:
-                confidence_scores = support.confidence_scores or []
-                chunk_indices = support.grounding_chunk_indices or []
-                for i, chunk_idx in enumerate(chunk_indices):
-                    if chunk_idx in chunks_info:
-                        short_id = chunks_info[chunk_idx]
-                        confidence = confidence_scores[i] if i < len(confidence_scores) else 0.5
-                        text_segment = support.segment.text if support.segment else ""
-                        sources[short_id]["supported_claims"].append(
-                            {
-                                "text_segment": text_segment,
-                                "confidence": confidence,
-                            }
-                        )
+            chunks_info[idx] = short_id
+
+        for support in metadata.grounding_supports or ():
+            confidence_scores = support.confidence_scores or []
+            text_segment = support.segment.text if support.segment else ""
+            for i, chunk_idx in enumerate(support.grounding_chunk_indices or ()):
+                if chunk_idx in chunks_info:
+                    confidence = confidence_scores[i] if i < len(confidence_scores) else 0.5
+                    sources[chunks_info[chunk_idx]]["supported_claims"].append(
+                        {
+                            "text_segment": text_segment,
+                            "confidence": confidence,
+                        }
+                    )
 
     callback_context.state["url_to_short_id"] = url_to_short_id
     callback_context.state["sources"] = sources
+    callback_context.state["sources_scanned_events"] = len(session.events)
 
 
 def citation_replacement_callback(callback_context):
@@ -379,21 +386,17 @@ def citation_replacement_callback(callback_context):
     final_report = callback_context.state.get("final_cited_report", "")
     sources = callback_context.state.get("sources", {})
 
+    # Render each source's link once; the same src-N is usually cited many times
+    links = {
+        short_id: f" [{source_info.get('title', source_info.get('domain', short_id))}]({source_info['url']})"
+        for short_id, source_info in sources.items()
+    }
+
     def tag_replacer(match):
-        short_id = match.group(1)
-        source_info = sources.get(short_id)
-        if not source_info:
-            return ""
-        display_text = source_info.get("title", source_info.get("domain", short_id))
-        return f" [{display_text}]({source_info['url']})"
-
-    processed_report = re.sub(
-        r'<cite\s+source\s*=\s*["\']?\s*(src-\d+)\s*["\']?\s*/>',
-        tag_replacer,
-        final_report,
-    )
-    # Clean up whitespace before punctuation introduced by citation insertion
-    processed_report = re.sub(r"\s+([.,;:])", r"\1", processed_report)
+        # Unknown source ids are dropped, keeping any punctuation that followed
+        return links.get(match.group(1), "") + (match.group(2) or "")
+
+    processed_report = _CITE_RE.sub(tag_replacer, final_report)
 
     callback_context.state["final_report_with_citations"] = processed_report
     return genai_types.Content(parts=[genai_types.Part(text=processed_report)])
@@ -261,6 +261,7 @@ __all__ = [
     "TimedAgent",
     "BackgroundTask",
     "tap",
+    "tap_log",
     "expect",
     "map_over",
     "gate",
@@ -889,6 +890,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "TimedAgent": ("._primitive_builders", "TimedAgent"),
     "BackgroundTask": ("._primitive_builders", "BackgroundTask"),
     "tap": ("._primitive_builders", "tap"),
+    "tap_log": ("._primitive_builders", "tap_log"),
     "expect": ("._primitive_builders", "expect"),
     "map_over": ("._primitive_builders", "map_over"),
     "gate": ("._primitive_builders", "gate"),
@@ -261,6 +261,7 @@ from ._primitive_builders import PrimitiveBuilderBase as PrimitiveBuilderBase
 from ._primitive_builders import TimedAgent as TimedAgent
 from ._primitive_builders import BackgroundTask as BackgroundTask
 from ._primitive_builders import tap as tap
+from ._primitive_builders import tap_log as tap_log
 from ._primitive_builders import expect as expect
 from ._primitive_builders import map_over as map_over
 from ._primitive_builders import gate as gate
@@ -1205,6 +1206,7 @@ __all__ = [
     "TimedAgent",
     "BackgroundTask",
     "tap",
+    "tap_log",
     "expect",
     "map_over",
     "gate",
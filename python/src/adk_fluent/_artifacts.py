@@ -729,18 +729,28 @@ class A:
         Uses Python's built-in markdown if available, falls back to minimal conversion.
         Usage: A.from_markdown("report") >> A.publish("report.html", from_key="report")
         """
+        # One Markdown converter per transform, built on first call and
+        # reset between documents — markdown.markdown() would rebuild the
+        # parser and its extension registry on every invocation.
+        # None = not yet resolved, False = markdown not installed.
+        converter: Any = None
 
         def _md_to_html(state: dict) -> dict:
+            nonlocal converter
             text = state[key]
-            try:
-                import markdown
-
-                return {key: markdown.markdown(text)}
-            except ImportError:
+            if converter is None:
+                try:
+                    import markdown
+
+                    converter = markdown.Markdown()
+                except ImportError:
+                    converter = False
+            if converter is False:
                 # Minimal fallback: wrap in <pre> if markdown not installed
                 import html
 
                 return {key: f"<pre>{html.escape(text)}</pre>"}
+            return {key: converter.reset().convert(text)}
 
         return STransform(
             _md_to_html,
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio as _asyncio
 import itertools
-from collections.abc import Callable
-from typing import Any, Self
+import sys
+import types as _types
+from collections import defaultdict as _defaultdict
+from collections.abc import Callable, Sequence
+from typing import Any, Never, Self
 
 __all__ = [
     "BuilderBase",
@@ -162,19 +164,24 @@ def _resolve_guard_tuple(spec: tuple) -> Callable:
         return _guard_length
 
     if kind == "guard:output":
-        schema_cls = config
+        import json as _json
 
-        async def _guard_output(*, callback_context, llm_response, **_kw):
-            import json as _json
+        from pydantic import ValidationError
 
-            from pydantic import ValidationError
+        schema_cls = config
+        # Pydantic models parse and validate JSON in one pass in pydantic-core;
+        # other schema classes go through json.loads + model_validate.
+        validate_json = getattr(schema_cls, "model_validate_json", None)
 
+        async def _guard_output(*, callback_context, llm_response, **_kw):
             text = _extract_response_text(llm_response)
             if text is None:
                 return None
             try:
-                data = _json.loads(text)
-                schema_cls.model_validate(data)
+                if validate_json is not None:
+                    validate_json(text)
+                else:
+                    schema_cls.model_validate(_json.loads(text))
             except (_json.JSONDecodeError, ValidationError) as exc:
                 from adk_fluent._exceptions import GuardViolation
 
@@ -421,6 +428,44 @@ def _propagate_middlewares(left: Any, right: Any, result: Any) -> None:
         result._middlewares = merged
 
 
+def _splice_children(builder: Any, cls: type) -> list | None:
+    """Children of an operator-made ``cls`` builder that holds nothing but its children, else None.
+
+    ``a >> (b >> c)`` and ``a | (b | c)`` would otherwise nest one
+    Pipeline/FanOut inside another. A right operand that ``>>``/``|``
+    created and named, with no config of its own, no callbacks and no
+    middleware, runs the same when its children are spliced into the outer
+    builder; only its generated name is lost. A builder the user named
+    (``Pipeline("review")``) is a stage of its own and always stays nested,
+    as does anything with more configuration.
+    """
+    if type(builder) is not cls or getattr(builder, "_middlewares", None):
+        return None
+    name = builder._config.get("name")
+    if name is None or name != getattr(builder, "_operator_name", None):
+        return None
+    if any(key != "name" for key in builder._config):
+        return None
+    if any(builder._callbacks.values()) or any(v for k, v in builder._lists.items() if k != "sub_agents"):
+        return None
+    return builder._lists.get("sub_agents") or None
+
+
+# Builder class -> whether its sub_agents run in sequence (Pipeline, Loop),
+# so adjacent ``>> fn`` steps may be fused. Filled lazily by _fuses_fn_steps.
+_FUSES_FN_STEPS: dict[type, bool] = {}
+
+
+def _fuses_fn_steps(cls: type) -> bool:
+    """Whether *cls* is a Pipeline or Loop builder; the workflow import runs once per class."""
+    fuses = _FUSES_FN_STEPS.get(cls)
+    if fuses is None:
+        from adk_fluent.workflow import Loop, Pipeline
+
+        fuses = _FUSES_FN_STEPS[cls] = issubclass(cls, (Pipeline, Loop))
+    return fuses
+
+
 def _count_components(component: Any) -> int:
     """Count total components in a UIComponent tree."""
     count = 1
@@ -461,6 +506,7 @@ def _compose_callbacks(fns: list) -> Callable:
     if len(resolved) == 1:
         return resolved[0]
 
+    import asyncio as _asyncio
     import inspect
 
     # Classify each callable as sync/async ONCE at compose time. The
@@ -531,6 +577,25 @@ from adk_fluent._exceptions import BuilderError as BuilderError  # noqa: E402
 from adk_fluent._exceptions import ADKFluentError as ADKFluentError  # noqa: E402
 
 
+# Leaf types that ``copy.deepcopy`` returns unchanged (see ``copy._deepcopy_atomic``).
+_ATOMIC_LEAF_TYPES: frozenset[type] = frozenset(
+    {
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        type,
+        range,
+        _types.FunctionType,
+        _types.BuiltinFunctionType,
+        _types.CodeType,
+    }
+)
+
+
 def _attr_is_close(a: str, b: str) -> bool:
     """Check if two attribute names are within edit distance 1 (typo detection)."""
     if abs(len(a) - len(b)) > 1:
@@ -556,12 +621,19 @@ class BuilderBase:
     All generated builders inherit from this class.
     """
 
+    # Core storage lives in slots: every builder sets these, and ``>>`` /
+    # ``|`` chains allocate many short-lived builders. ``__dict__`` stays
+    # for the per-class extras (primitive ``_CUSTOM_ATTRS``, plugins).
+    __slots__ = ("_config", "_callbacks", "_lists", "_frozen", "_middlewares", "__dict__", "__weakref__")
+
     _ALIASES: dict[str, str]
     _CALLBACK_ALIASES: dict[str, str]
     _ADDITIVE_FIELDS: set[str]
     _ADK_TARGET_CLASS: type | None = None
     _KNOWN_PARAMS: set[str] | None = None
     _AUTO_KNOWN_PARAMS_CACHE: set[str] | None = None
+    # Name ``>>`` / ``|`` gave this composite; lets a later operator splice it
+    _operator_name: str | None = None
 
     @classmethod
     def _auto_known_params(cls) -> set[str]:
@@ -596,11 +668,12 @@ class BuilderBase:
         One method, one truth. Never write ``self._config = ...`` / ``self._callbacks = ...``
         / ``self._lists = ...`` by hand — call this instead.
         """
-        from collections import defaultdict
-
+        if type(name) is str:
+            # Names key topology maps and ADK's find_agent() scans; equal names share one object
+            name = sys.intern(name)
         self._config = {"name": name, **config_extras}
-        self._callbacks = defaultdict(list)
-        self._lists = defaultdict(list)
+        self._callbacks = _defaultdict(list)
+        self._lists = _defaultdict(list)
         self._frozen = False
 
     def build(self) -> Any:
@@ -646,16 +719,32 @@ class BuilderBase:
     # the per-builder overhead to one memo update. Atomic leaf values
     # (strings, frozensets, types, callables) still hit
     # ``copy._deepcopy_atomic`` fast paths.
+    #
+    # The three containers are rebuilt directly rather than handed to
+    # ``copy.deepcopy``: ``defaultdict`` has no deepcopy fast path and goes
+    # through the slow ``__reduce_ex__``/``_reconstruct`` route, and most
+    # leaves (names, prompts, callables, schema classes) are atomic anyway.
+    # Only non-atomic leaves are deep-copied, through the shared memo.
     def __deepcopy__(self, memo: dict) -> BuilderBase:
         import copy as _copy
+        from collections import defaultdict
+
+        def _leaf(v: Any) -> Any:
+            return v if type(v) in _ATOMIC_LEAF_TYPES else _copy.deepcopy(v, memo)
+
+        def _list_map(src: dict[str, Any]) -> defaultdict[str, Any]:
+            out: defaultdict[str, Any] = defaultdict(list)
+            for k, items in src.items():
+                out[k] = [_leaf(v) for v in items] if type(items) is list else _copy.deepcopy(items, memo)
+            return out
 
         new = object.__new__(type(self))
         memo[id(self)] = new
         # Single shared memo across all three containers — sub-builders
         # referenced from multiple fields are copied once.
-        new._config = _copy.deepcopy(self._config, memo)
-        new._callbacks = _copy.deepcopy(self._callbacks, memo)
-        new._lists = _copy.deepcopy(self._lists, memo)
+        new._config = {k: _leaf(v) for k, v in self._config.items()}
+        new._callbacks = _list_map(self._callbacks)
+        new._lists = _list_map(self._lists)
         # Middlewares are stateful-but-shared; operator paths already
         # treat them as references. Preserve that here.
         mw = getattr(self, "_middlewares", None)
@@ -666,11 +755,33 @@ class BuilderBase:
         new._frozen = False
         return new
 
+    def __copy__(self) -> Self:
+        """Shallow fork: fresh ``_config`` / ``_callbacks`` / ``_lists`` containers.
+
+        Values -- callables, prompts, sub-builders -- are shared by
+        reference. Appending to or setting on the copy never touches the
+        original, but mutating a shared sub-builder does; use ``clone()``
+        when the copy must be fully independent. Builder-specific instance
+        attributes (a gate's predicate, a tap's function) are carried over.
+        """
+        from collections import defaultdict
+
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new._config = dict(self._config)
+        new._callbacks = defaultdict(list, {k: list(v) for k, v in self._callbacks.items()})
+        new._lists = defaultdict(list, {k: list(v) for k, v in self._lists.items()})
+        mw = getattr(self, "_middlewares", None)
+        if mw is not None:
+            new._middlewares = list(mw)
+        new._frozen = False
+        return new
+
     # ------------------------------------------------------------------
     # Shared __getattr__: dynamic field forwarding
     # ------------------------------------------------------------------
 
-    def __getattr__(self, name: str):
+    def __getattr__(self, name: str) -> Callable[[Never], Self]:
         """Forward unknown attribute access to a config-setter for chaining.
 
         Validates field names against the ADK target class (Pydantic mode)
@@ -689,14 +800,7 @@ class BuilderBase:
 
         # Check if it's a callback alias
         if name in _CALLBACK_ALIASES:
-            cb_field = _CALLBACK_ALIASES[name]
-
-            def _cb_setter(fn: Callable) -> Self:
-                target = self._maybe_fork_for_mutation()
-                target._callbacks[cb_field].append(fn)
-                return target
-
-            return _cb_setter
+            return self._install_forwarder(name, _CALLBACK_ALIASES[name], additive=True)
 
         # Validate field name
         _ADK_TARGET_CLASS = self.__class__._ADK_TARGET_CLASS
@@ -741,16 +845,43 @@ class BuilderBase:
                 )
         # else: composite/standalone/primitive — accept any field
 
-        # Return a setter that stores value and returns self for chaining
-        def _setter(value: Any) -> Self:
-            target = self._maybe_fork_for_mutation()
-            if field_name in _ADDITIVE_FIELDS:
+        # Only install names checked against a field table: on builders that
+        # accept anything, a typo must not become a permanent class attribute.
+        validated = _ADK_TARGET_CLASS is not None or _KNOWN_PARAMS is not None or "build" in self.__class__.__dict__
+        return self._install_forwarder(name, field_name, additive=field_name in _ADDITIVE_FIELDS, install=validated)
+
+    def _install_forwarder(
+        self, name: str, field_name: str, *, additive: bool, install: bool = True
+    ) -> Callable[[Any], Self]:
+        """Install a real setter method for a forwarded field and return it bound.
+
+        ``__getattr__`` only runs after normal lookup fails, and then pays for
+        alias resolution, field validation and a fresh closure on every call.
+        Once ``name`` has been validated for this class, a method with
+        ``field_name`` baked in is set on the class so later chains resolve it
+        as an ordinary attribute. Subclasses may carry different alias tables,
+        so an inherited forwarder defers back to ``__getattr__`` for them.
+        Builders that accept any field pass ``install=False`` and only get
+        the bound setter.
+        """
+        owner = self.__class__
+
+        def _forwarded(builder: Any, value: Any) -> Any:
+            if builder.__class__ is not owner:
+                return BuilderBase.__getattr__(builder, name)(value)
+            target = builder._maybe_fork_for_mutation()
+            if additive:
                 target._callbacks[field_name].append(value)
             else:
                 target._config[field_name] = value
             return target
 
-        return _setter
+        _forwarded.__name__ = name
+        _forwarded.__qualname__ = f"{owner.__qualname__}.{name}"
+        _forwarded.__doc__ = f"Set the ``{field_name}`` field (forwarded)."
+        if install:
+            setattr(owner, name, _forwarded)
+        return _forwarded.__get__(self, owner)
 
     # ------------------------------------------------------------------
     # __dir__: REPL autocomplete support
@@ -849,14 +980,7 @@ class BuilderBase:
 
     def _fork_for_operator(self) -> Self:
         """Create an operator-safe fork. Shares sub-builders (safe: operators never mutate children)."""
-        new = object.__new__(type(self))
-        new._config = dict(self._config)
-        new._callbacks = {k: list(v) for k, v in self._callbacks.items()}
-        new._lists = {k: list(v) for k, v in self._lists.items()}
-        mw = getattr(self, "_middlewares", None)
-        if mw is not None:
-            new._middlewares = list(mw)
-        return new
+        return self.__copy__()
 
     def __rshift__(self, other) -> BuilderBase:
         """Create or extend a Pipeline: a >> b >> c.
@@ -867,7 +991,18 @@ class BuilderBase:
         - dict (shorthand for deterministic Route)
         - Route (deterministic branching)
         """
-        self._freeze()
+        return self._rshift(other)
+
+    def _rshift(self, other, *, in_place: bool = False) -> BuilderBase:
+        """Shared ``>>`` implementation.
+
+        ``in_place=True`` lets a caller that exclusively owns ``self`` — an
+        intermediate Pipeline inside ``chain()`` — append to it instead of
+        forking, so folding K steps is O(K) rather than O(K^2) list copies.
+        Plain ``>>`` always forks: the left operand may still be referenced.
+        """
+        if not in_place:
+            self._freeze()
         from adk_fluent._primitive_builders import _fn_step
         from adk_fluent._routing import Route
         from adk_fluent.workflow import Pipeline
@@ -910,17 +1045,22 @@ class BuilderBase:
 
         my_name = self._config.get("name", "")
         other_name = other._config.get("name", "") if hasattr(other, "_config") else ""
+        # A bare right-hand Pipeline (``a >> (b >> c)``) is spliced, not nested
+        steps = _splice_children(other, Pipeline) or [other]
         if isinstance(self, Pipeline):
             # Clone, then append — original Pipeline unchanged
-            clone = self._fork_for_operator()
-            clone.step(other)  # type: ignore[arg-type]  # accepts BuilderBase; auto-built at build()
-            clone._config["name"] = f"{my_name}_then_{other_name}"
+            clone = self if in_place else self._fork_for_operator()
+            for step in steps:
+                clone.step(step)  # type: ignore[arg-type]  # accepts BuilderBase; auto-built at build()
+            clone._config["name"] = clone._operator_name = f"{my_name}_then_{other_name}"
             result = clone
         else:
             name = f"{my_name}_then_{other_name}"
             p = Pipeline(name)
+            p._operator_name = name
             p.step(self)  # type: ignore[arg-type]  # accepts BuilderBase; auto-built at build()
-            p.step(other)  # type: ignore[arg-type]
+            for step in steps:
+                p.step(step)  # type: ignore[arg-type]
             result = p
 
         # Propagate middleware from operands to result
@@ -946,17 +1086,22 @@ class BuilderBase:
 
         my_name = self._config.get("name", "")
         other_name = other._config.get("name", "")
+        # A bare right-hand FanOut (``a | (b | c)``) is spliced, not nested
+        branches = _splice_children(other, FanOut) or [other]
         if isinstance(self, FanOut):
             # Clone, then add branch — original FanOut unchanged
             clone = self._fork_for_operator()
-            clone.branch(other)  # type: ignore[arg-type]  # accepts BuilderBase; auto-built at build()
-            clone._config["name"] = f"{my_name}_and_{other_name}"
+            for branch in branches:
+                clone.branch(branch)  # type: ignore[arg-type]  # accepts BuilderBase; auto-built at build()
+            clone._config["name"] = clone._operator_name = f"{my_name}_and_{other_name}"
             result = clone
         else:
             name = f"{my_name}_and_{other_name}"
             f = FanOut(name)
+            f._operator_name = name
             f.branch(self)  # type: ignore[arg-type]  # accepts BuilderBase; auto-built at build()
-            f.branch(other)  # type: ignore[arg-type]
+            for branch in branches:
+                f.branch(branch)  # type: ignore[arg-type]
             result = f
 
         # Propagate middleware from operands to result
@@ -1146,21 +1291,27 @@ class BuilderBase:
             # Strict mode (errors + advisories)
             pipeline.validate(strict=True)
         """
+        from adk_fluent._helpers import _ir_memo_scope
+
         name = self._config.get("name", "?")
         cls_name = self.__class__.__name__
 
-        # Phase 1: Build check
-        try:
-            self.build()
-        except Exception as exc:
-            raise ValueError(f"Validation failed for {cls_name}('{name}'): {exc}") from exc
+        # One memo scope for both phases: the contract pass reuses the
+        # subtree the build already lowered instead of walking it again.
+        with _ir_memo_scope() as memo:
+            # Phase 1: Build check
+            try:
+                self.build()
+            except Exception as exc:
+                raise ValueError(f"Validation failed for {cls_name}('{name}'): {exc}") from exc
 
-        # Phase 2: Contract analysis on IR tree
-        try:
-            ir = self.to_ir()
-        except (NotImplementedError, AttributeError):
-            # Some builders (single agents) may not support IR — that's OK
-            return self
+            # Phase 2: Contract analysis on IR tree
+            cached = memo.get(id(self))
+            try:
+                ir = cached[1] if cached is not None and cached[0] is self else self.to_ir()
+            except (NotImplementedError, AttributeError):
+                # Some builders (single agents) may not support IR — that's OK
+                return self
 
         try:
             from adk_fluent.testing.contracts import check_contracts
@@ -1824,13 +1975,15 @@ class BuilderBase:
     def to_yaml(self) -> str:
         """Serialize builder state to YAML string.
 
-        Requires the ``pyyaml`` package (``pip install pyyaml``).
+        Requires the ``pyyaml`` package (``pip install pyyaml``). Uses the
+        libyaml-backed ``CDumper`` when PyYAML was built with it.
         """
         try:
             import yaml
         except ImportError as e:
             raise ImportError("to_yaml() requires the 'pyyaml' package. Install it with: pip install pyyaml") from e
-        return yaml.dump(self.to_dict(), default_flow_style=False)
+        dumper = getattr(yaml, "CDumper", yaml.Dumper)
+        return yaml.dump(self.to_dict(), Dumper=dumper, default_flow_style=False)
 
     # ------------------------------------------------------------------
     # Task 6: with_() — Immutable Variants
@@ -1855,8 +2008,17 @@ class BuilderBase:
 
     def _prepare_build_config(self) -> dict[str, Any]:
         """Prepare config dict for building: strip internal fields, auto-build sub-builders, merge callbacks and lists."""
+        from adk_fluent._helpers import _ir_memo_scope
+
+        # Outermost build opens the scope: IR lowered for contract checks is shared with nested builds
+        with _ir_memo_scope():
+            return self._prepare_build_config_in_scope()
+
+    def _prepare_build_config_in_scope(self) -> dict[str, Any]:
+        """Body of :meth:`_prepare_build_config`, run inside the IR memo scope."""
         # Auto-wire data flow if .wired() was called
-        if self._config.get("_auto_wire"):
+        auto_wire = self._config.get("_auto_wire")
+        if auto_wire:
             self.auto_wire()
 
         # UI auto-wire: stamp tools/guards/middleware onto the builder BEFORE
@@ -1871,6 +2033,14 @@ class BuilderBase:
                 ui_spec.validate()
             _apply_ui_auto_wire(self, ui_spec)
 
+        if auto_wire or ui_spec is not None:
+            from adk_fluent._helpers import _build_ir_memo
+
+            # Auto-wiring rewrites sub-builders; nodes lowered before it are stale
+            memo = _build_ir_memo.get()
+            if memo:
+                memo.clear()
+
         # Run IR-first contract checking (appendix_f Q1, Q3)
         self._run_build_contracts()
 
@@ -1885,16 +2055,14 @@ class BuilderBase:
         if output_schema is not None:
             config["output_schema"] = output_schema
 
-        # Auto-convert PTransform objects to strings
+        # Auto-convert PTransform objects to strings and auto-build any
+        # BuilderBase values, in one pass (only existing keys are reassigned)
         from adk_fluent._prompt import PTransform
 
-        for key, value in list(config.items()):
+        for key, value in config.items():
             if isinstance(value, PTransform):
                 config[key] = str(value)
-
-        # Auto-build any BuilderBase values in config
-        for key, value in list(config.items()):
-            if isinstance(value, BuilderBase):
+            elif isinstance(value, BuilderBase):
                 config[key] = value.build()
 
         # Merge accumulated callbacks
@@ -1902,10 +2070,21 @@ class BuilderBase:
             if fns:
                 config[field] = _compose_callbacks(list(fns))
 
+        # .fused() sequential containers run adjacent ``>> fn`` steps as one agent
+        fuse_fn_steps = (
+            self._config.get("_fuse_fn_steps", False)
+            and bool(self._lists.get("sub_agents"))
+            and _fuses_fn_steps(type(self))
+        )
+
         # Merge accumulated lists (auto-building items, skip internal _ keys)
         for field, items in self._lists.items():
             if field.startswith("_"):
                 continue
+            if fuse_fn_steps and field == "sub_agents":
+                from adk_fluent._primitive_builders import _fuse_fn_steps
+
+                items = _fuse_fn_steps(items)
             resolved = []
             for item in items:
                 if isinstance(item, BuilderBase) or hasattr(item, "build") and callable(item.build):
@@ -1996,7 +2175,6 @@ class BuilderBase:
                 config["instruction"] = compiled
 
         # UI spec: compile A2UI surface into tools + prompt + callbacks
-        ui_spec = self._config.get("_ui_spec")
         if ui_spec is not None:
             from adk_fluent._ui_compile import compile_ui_for_agent
 
@@ -2088,23 +2266,22 @@ class BuilderBase:
 
         Uses ADK's before_agent_callback mechanism. If the predicate returns
         False, the agent is skipped and the pipeline continues to the next step.
+        Callbacks run in registration order, so register the gate first when
+        other ``before_agent`` callbacks should not run for a skipped agent.
 
         Usage:
             enricher.proceed_if(lambda s: s.get("valid") == "yes")
         """
 
+        from google.genai import types
+
         def _gate_cb(callback_context):
-            state = callback_context.state
             try:
-                if not predicate(state):
-                    from google.genai import types
-
-                    return types.Content(role="model", parts=[])
+                if predicate(callback_context.state):
+                    return None
             except (KeyError, TypeError, ValueError):
-                from google.genai import types
-
-                return types.Content(role="model", parts=[])
-            return None
+                pass
+            return types.Content(role="model", parts=[])
 
         self._callbacks["before_agent_callback"].append(_gate_cb)
         return self
@@ -2162,7 +2339,9 @@ class BuilderBase:
 
         Args:
             responses: One of:
-                - ``list[str]``: cycle through responses (applied to this agent)
+                - ``list[str]``: cycle through responses (applied to this agent).
+                  Any other iterable, including an endless generator, is
+                  consumed lazily, one item per call.
                 - ``callable(llm_request) -> str``: dynamic mock (applied to this agent)
                 - ``dict[str, str | list[str]]``: mock specific agents by name.
                   Keys are agent names, values are response strings or lists.
@@ -2185,22 +2364,33 @@ class BuilderBase:
         if isinstance(responses, dict):
             return self._mock_by_name(responses)
 
+        from google.adk.models.llm_response import LlmResponse
+        from google.genai import types
+
         if callable(responses) and not isinstance(responses, list):
             fn = responses
 
             def _mock_cb(callback_context, llm_request):
-                from google.adk.models.llm_response import LlmResponse
-                from google.genai import types
-
                 text = fn(llm_request)
                 return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=str(text))]))
+        elif isinstance(responses, Sequence):
+            # Stringify once; each call picks the next text by index. A fresh
+            # LlmResponse is still built per call since ADK and downstream
+            # callbacks may mutate the response they are handed.
+            texts = tuple(str(t) for t in responses)
+            if not texts:
+                raise ValueError("mock() needs at least one response.")
+            n_texts = len(texts)
+            calls = itertools.count()
+
+            def _mock_cb(callback_context, llm_request):
+                text = texts[next(calls) % n_texts]
+                return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=text)]))
         else:
+            # Iterators and generators may be unbounded; draw from them lazily.
             response_iter = itertools.cycle(responses)
 
             def _mock_cb(callback_context, llm_request):
-                from google.adk.models.llm_response import LlmResponse
-                from google.genai import types
-
                 text = next(response_iter)
                 return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=str(text))]))
 
@@ -3174,6 +3364,31 @@ class BuilderBase:
         self._config["_auto_wire"] = True
         return self
 
+    def fused(self) -> Self:
+        """Run each run of adjacent ``>> fn`` steps as a single agent.
+
+        By default every ``>> fn`` step (including ``S.*`` transforms)
+        builds into its own agent. With ``.fused()``, a Pipeline or Loop
+        builds consecutive plain function steps into one agent that calls
+        them in order, saving an agent hop and its event per step.
+
+        The built tree changes shape: the fused agent replaces its members
+        in ``sub_agents`` and is named after them joined by ``__``
+        (``double__incr``), so that name is what event authors, traces and
+        ``find_agent()`` see. Only this container's own steps are fused.
+        Has no effect on other builders.
+
+        Usage::
+
+            pipeline = (Agent("a") >> double >> incr >> Agent("b")).fused()
+
+        Returns:
+            Self for chaining.
+        """
+        self = self._maybe_fork_for_mutation()
+        self._config["_fuse_fn_steps"] = True
+        return self
+
     def llm_anatomy(self) -> str:
         """Show exactly what will be sent to the LLM for this agent.
 
@@ -3260,10 +3475,29 @@ class BuilderBase:
         interop_issues = check_output_interop(self._config)
 
         # ── IR contract checks (runs on compound builders only) ──
+        # check_contracts() only inspects the children of sequence /
+        # parallel / loop nodes, so a builder without sub-agents can never
+        # yield an issue -- skip lowering it to IR (leaf agents are the bulk
+        # of every build).
         ir_issues: list = []
-        if hasattr(self, "to_ir"):
+        has_children = bool(self._lists.get("sub_agents") or self._config.get("sub_agents"))
+        if has_children and hasattr(self, "to_ir"):
+            from adk_fluent._helpers import _build_ir_memo
+
+            memo = _build_ir_memo.get()
+            cached = memo.get(id(self)) if memo is not None else None
+            # .wired() / UI auto-wiring mutate this builder after the parent lowered it
+            if cached is not None and (
+                cached[0] is not self or self._config.get("_auto_wire") or self._config.get("_ui_spec") is not None
+            ):
+                cached = None
             try:
-                ir = self.to_ir()
+                if cached is not None:
+                    ir = cached[1]
+                else:
+                    ir = self.to_ir()
+                    if memo is not None:
+                        memo[id(self)] = (self, ir)
                 from adk_fluent.testing.contracts import check_contracts
 
                 ir_issues = check_contracts(ir)
@@ -3303,20 +3537,11 @@ class BuilderBase:
 
     def use(self, preset: Any) -> Self:
         """Apply a Preset object that bundles multiple builder settings (model, instruction, tools, callbacks, etc.) onto this builder. Presets are reusable configuration bundles."""
-        aliases = getattr(self.__class__, "_ALIASES", {})
-        cb_aliases = getattr(self.__class__, "_CALLBACK_ALIASES", {})
-
-        # Apply preset fields
-        for key, value in preset._fields.items():
-            field_name = aliases.get(key, key)
-            self._config[field_name] = value
-
-        # Apply preset callbacks
-        for key, fns in preset._callbacks.items():
-            # Resolve through callback aliases
-            cb_field = cb_aliases.get(key, key)
-            for fn in fns:
-                self._callbacks[cb_field].append(fn)
+        values, preset_callbacks = preset._resolve_for(type(self))
+        self._config.update(values)
+        callbacks = self._callbacks
+        for field_name, fns in preset_callbacks:
+            callbacks[field_name].extend(fns)
 
         return self
 
@@ -26,6 +26,7 @@ Usage:
 from __future__ import annotations
 
 import re
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Literal
@@ -1013,7 +1014,7 @@ class C:
     @staticmethod
     def from_state(*keys: str) -> CFromState:
         """Read named keys from session state as context."""
-        return CFromState(keys=keys)
+        return CFromState(keys=tuple(sys.intern(k) for k in keys))
 
     @staticmethod
     def template(text: str) -> CTemplate:
@@ -1313,7 +1314,8 @@ def _compile_context_spec(
     # left as literal ``{key}`` to match the legacy re.sub behaviour.
     #
     # Slow path: if the instruction is a callable (dynamic), we resolve
-    # it per turn but still use the module-level precompiled pattern.
+    # it per turn; _compile_template is memoized, so a provider returning
+    # the same text each turn is only scanned once.
     from adk_fluent._context_providers import _compile_template, _render_template
 
     raw_instruction = developer_instruction
@@ -9,6 +9,7 @@ Do NOT import from this module directly. Use C.xxx() factories instead.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
@@ -38,6 +39,7 @@ _PLACEHOLDER_RE = re.compile(r"\{(\w+)(\??)}")
 _NO_SEGMENTS: tuple = ()
 
 
+@functools.lru_cache(maxsize=256)
 def _compile_template(template: str) -> tuple | None:
     """Pre-compile a template string into a flat tuple of render segments.
 
@@ -46,6 +48,10 @@ def _compile_template(template: str) -> tuple | None:
     of alternating literal strings and ``(key, optional)`` pairs. The
     render loop in :func:`_render_template` walks this tuple with no
     regex work and no per-call allocation beyond the output list.
+
+    Memoized: dynamic (callable) instructions are compiled per turn, and
+    they usually return the same handful of strings, so repeat turns skip
+    the regex scan. The result is immutable, so sharing it is safe.
     """
     if not template or "{" not in template:
         return None
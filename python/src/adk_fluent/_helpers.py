@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import asyncio
+import contextlib
 import copy
 import re as _re
 import sys
 import time
-from contextlib import asynccontextmanager
+from collections.abc import Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from typing import Any
+from weakref import WeakKeyDictionary
 
 __all__ = [
     "deep_clone_builder",
@@ -154,16 +157,74 @@ def _add_tools(builder, tools_arg, *, replace: bool = True):
 # ---------------------------------------------------------------------------
 
 
+# Sub-builder -> IR node memo, active for the duration of one top-level
+# build() (or validate()). A parent lowers its whole subtree for contract
+# checking before building its children, so each child's own check -- and
+# any later lowering in the same call -- can reuse its node instead of
+# lowering the same subtree again. Entries keep the builder alongside the
+# node so an ``id()`` is never matched against a new object. Builders are
+# mutable, so the memo never outlives the call that opened it.
+_build_ir_memo: ContextVar[dict[int, tuple[Any, Any]] | None] = ContextVar("_build_ir_memo", default=None)
+
+
+@contextmanager
+def _ir_memo_scope() -> Iterator[dict[int, tuple[Any, Any]]]:
+    """Open an IR memo scope unless one is already active; yield the active memo."""
+    memo = _build_ir_memo.get()
+    if memo is not None:
+        yield memo
+        return
+    memo = {}
+    token = _build_ir_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _build_ir_memo.reset(token)
+
+
+# Field names per ``.produces()`` / ``.consumes()`` schema class. Every
+# lowering and contract check asks for them; a model's fields are fixed once
+# the class exists. Weak keys so models defined at runtime can still be
+# collected.
+_SCHEMA_FIELD_NAMES: WeakKeyDictionary[Any, frozenset[str]] = WeakKeyDictionary()
+
+
+def _schema_field_names(schema: Any) -> frozenset[str]:
+    """Field names of a Pydantic model class, or empty for anything else."""
+    if schema is None:
+        return frozenset()
+    try:
+        return _SCHEMA_FIELD_NAMES[schema]
+    except (KeyError, TypeError):
+        pass
+    fields = getattr(schema, "model_fields", None)
+    names = frozenset(fields) if fields else frozenset()
+    # Not weakref-able or not hashable -- just skip caching
+    with contextlib.suppress(TypeError):
+        _SCHEMA_FIELD_NAMES[schema] = names
+    return names
+
+
 def _collect_children(builder):
     """Collect and recursively convert sub_agents from builder config and lists."""
     from adk_fluent._base import BuilderBase
 
     children_raw = list(builder._config.get("sub_agents", []))
     children_raw.extend(builder._lists.get("sub_agents", []))
+    memo = _build_ir_memo.get()
     result = []
     for c in children_raw:
         if isinstance(c, BuilderBase) or hasattr(c, "to_ir") and callable(c.to_ir):
-            result.append(c.to_ir())
+            if memo is None:
+                ir = c.to_ir()
+            else:
+                hit = memo.get(id(c))
+                if hit is not None and hit[0] is c:
+                    ir = hit[1]
+                else:
+                    ir = c.to_ir()
+                    memo[id(c)] = (c, ir)
+            result.append(ir)
         else:
             result.append(c)
     return tuple(result)
@@ -194,8 +255,8 @@ def _agent_to_ir(builder):
         instr = builder._config.get("instruction")
         if isinstance(instr, _PT):
             prompt_spec = instr
-    writes_keys = frozenset(produces_schema.model_fields.keys()) if produces_schema else frozenset()
-    reads_keys = frozenset(consumes_schema.model_fields.keys()) if consumes_schema else frozenset()
+    writes_keys = _schema_field_names(produces_schema)
+    reads_keys = _schema_field_names(consumes_schema)
     if tool_schema is not None and hasattr(tool_schema, "reads_keys"):
         reads_keys = reads_keys | tool_schema.reads_keys()
     if tool_schema is not None and hasattr(tool_schema, "writes_keys"):
@@ -345,6 +406,9 @@ def add_agent_tool(builder, agent):
 
     The LLM can invoke the wrapped agent by name. This enables the
     coordinator pattern where a parent agent delegates to specialists.
+
+    The specialist is built here, once, and the ``AgentTool`` itself is
+    stored; every later ``.build()`` of the coordinator reuses it.
     """
     from google.adk.tools.agent_tool import AgentTool
 
@@ -534,27 +598,36 @@ async def run_one_shot_async(builder, prompt: str) -> str:
     Supports structured output and debug tracing.
     Routes to the appropriate engine based on builder/global config.
     """
+    engine = _resolve_engine(builder)
+    runner = None if engine is not None and engine != "adk" else _one_shot_runner(builder)
+    return await _run_one_shot_with(builder, prompt, runner)
+
+
+def _one_shot_runner(builder):
+    """Build *builder* and wrap it in an ``InMemoryRunner`` for one-shot calls."""
+    from google.adk.runners import InMemoryRunner
+
+    agent = builder.build()
+    return InMemoryRunner(agent=agent, app_name=f"_ask_{agent.name}")
+
+
+async def _run_one_shot_with(builder, prompt: str, runner) -> str:
+    """Run one prompt on *runner* (a fresh session each call), or via the engine when *runner* is None."""
     debug = builder._config.get("_debug", False)
     agent_name = builder._config.get("name", "?")
 
-    engine = _resolve_engine(builder)
-
     t0 = time.monotonic()
     if debug:
         _debug_log(agent_name, f"Sending prompt ({len(prompt)} chars)")
 
     # Non-ADK engine path: use five-layer architecture
-    if engine is not None and engine != "adk":
+    if runner is None:
         last_text, _events = await _run_via_engine(builder, prompt)
     else:
         # Default ADK path
-        from google.adk.runners import InMemoryRunner
         from google.genai import types
 
-        agent = builder.build()
-        app_name = f"_ask_{agent.name}"
-        runner = InMemoryRunner(agent=agent, app_name=app_name)
-        session = await runner.session_service.create_session(app_name=app_name, user_id="_ask_user")
+        session = await runner.session_service.create_session(app_name=runner.app_name, user_id="_ask_user")
         content = types.Content(role="user", parts=[types.Part(text=prompt)])
 
         last_text = ""
@@ -591,18 +664,28 @@ async def run_one_shot_async(builder, prompt: str) -> str:
 
 
 async def run_map_async(builder, prompts, *, concurrency=5):
-    """Run agent against multiple prompts concurrently with bounded concurrency."""
+    """Run agent against multiple prompts concurrently with bounded concurrency.
+
+    On the default ADK engine the agent is built and its runner created
+    once for the whole batch; each prompt still runs in its own session.
+    """
+    import asyncio
+
+    engine = _resolve_engine(builder)
+    runner = None if engine is not None and engine != "adk" else _one_shot_runner(builder)
     semaphore = asyncio.Semaphore(concurrency)
 
     async def _one(prompt):
         async with semaphore:
-            return await run_one_shot_async(builder, prompt)
+            return await _run_one_shot_with(builder, prompt, runner)
 
     return await asyncio.gather(*[_one(p) for p in prompts])
 
 
 def _run_sync(coro):
     """Run a coroutine synchronously. Raises RuntimeError inside async contexts."""
+    import asyncio
+
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
@@ -765,17 +848,54 @@ def run_inline_test(builder, prompt: str, *, contains=None, matches=None, equals
 
 
 class ChatSession:
-    """Interactive chat session wrapping ADK Runner + Session."""
+    """Interactive chat session wrapping ADK Runner + Session.
+
+    Sessions opened via ``.session()`` start deferred: the Runner and the
+    ADK session are only created on the first :meth:`send`, so entering
+    and leaving without sending costs no runner setup.
+    """
+
+    __slots__ = ("_runner", "_session", "_user_id", "_agent", "_app_name", "_start_lock")
 
     def __init__(self, runner, session, user_id: str):
+        import asyncio
+
         self._runner = runner
         self._session = session
         self._user_id = user_id
+        self._agent: Any = None
+        self._app_name: str | None = None
+        self._start_lock = asyncio.Lock()
+
+    @classmethod
+    def _deferred(cls, agent, app_name: str, user_id: str) -> ChatSession:
+        """Create a session whose Runner is built on first use."""
+        chat = cls(None, None, user_id)
+        chat._agent = agent
+        chat._app_name = app_name
+        return chat
+
+    async def _ensure_started(self) -> None:
+        if self._session is not None:
+            return
+        # Concurrent first sends must share one runner and session, or the
+        # conversation history splits between them.
+        async with self._start_lock:
+            if self._session is not None:
+                return
+            from google.adk.runners import InMemoryRunner
+
+            assert self._app_name is not None, "deferred ChatSession requires an app_name"
+            self._runner = InMemoryRunner(agent=self._agent, app_name=self._app_name)
+            self._session = await self._runner.session_service.create_session(
+                app_name=self._app_name, user_id=self._user_id
+            )
 
     async def send(self, text: str) -> str:
         """Send a message and return the response text."""
         from google.genai import types
 
+        await self._ensure_started()
         content = types.Content(role="user", parts=[types.Part(text=text)])
         last_text = ""
         async for event in self._runner.run_async(
@@ -792,17 +912,17 @@ class ChatSession:
 
 @asynccontextmanager
 async def create_session(builder):
-    """Create an interactive session context manager."""
-    from google.adk.runners import InMemoryRunner
+    """Create an interactive session context manager.
 
+    The agent is built on entry so configuration errors surface immediately;
+    the Runner and ADK session are deferred until the first ``send()``.
+    """
     agent = builder.build()
     app_name = f"_session_{agent.name}"
     user_id = "_session_user"
-    runner = InMemoryRunner(agent=agent, app_name=app_name)
-    session = await runner.session_service.create_session(app_name=app_name, user_id=user_id)
 
     try:
-        yield ChatSession(runner, session, user_id)
+        yield ChatSession._deferred(agent, app_name, user_id)
     finally:
         pass  # InMemoryRunner has no cleanup needed
 
@@ -812,6 +932,11 @@ async def create_session(builder):
 # ======================================================================
 
 
+# State key prefix per scope. One lookup both validates the scope and
+# yields the prefix.
+_SCOPE_PREFIXES = {"session": "", "temp": "temp:", "user": "user:", "app": "app:"}
+
+
 class StateKey:
     """Typed state key descriptor for ergonomic state access in callbacks and tools.
 
@@ -824,20 +949,21 @@ class StateKey:
         call_count.increment(ctx)  # Convenience for numeric types
     """
 
-    _VALID_SCOPES = frozenset({"temp", "user", "app", "session"})
+    __slots__ = ("_name", "_scope", "_type", "_default", "_full_key")
+
+    _VALID_SCOPES = frozenset(_SCOPE_PREFIXES)
 
     def __init__(self, name: str, *, scope: str = "session", type: type = str, default: Any = None):
-        if scope not in self._VALID_SCOPES:
-            raise ValueError(f"Invalid scope '{scope}'. Must be one of: {', '.join(sorted(self._VALID_SCOPES))}")
+        prefix = _SCOPE_PREFIXES.get(scope)
+        if prefix is None:
+            raise ValueError(f"Invalid scope '{scope}'. Must be one of: {', '.join(sorted(_SCOPE_PREFIXES))}")
         self._name = name
         self._scope = scope
         self._type = type
         self._default = default
-        # Build the full key with prefix
-        if scope == "session":
-            self._full_key = name
-        else:
-            self._full_key = f"{scope}:{name}"
+        # Build the full key with prefix once; interned so state lookups
+        # compare by identity against other interned keys.
+        self._full_key = sys.intern(prefix + name)
 
     @property
     def key(self) -> str:
@@ -854,44 +980,48 @@ class StateKey:
         """The scope: 'temp', 'user', 'app', or 'session'."""
         return self._scope
 
+    @staticmethod
+    def _state(ctx: Any) -> Any:
+        """Resolve the dict-like state behind *ctx*."""
+        state: Any = ctx.state if hasattr(ctx, "state") else ctx
+        if callable(state) and not isinstance(state, dict):
+            state = state()  # ReadonlyContext.state() is a method
+        return state
+
     def get(self, ctx: Any) -> Any:
         """Get the value from context state. Returns default if not set.
 
         Works with CallbackContext, ToolContext, or any object with a .state dict-like attribute.
         """
-        state: Any = ctx.state if hasattr(ctx, "state") else ctx
-        if callable(state) and not isinstance(state, dict):
-            state = state()  # ReadonlyContext.state() is a method
-        return state.get(self._full_key, self._default)
+        return self._state(ctx).get(self._full_key, self._default)
 
     def set(self, ctx: Any, value: Any) -> None:
         """Set the value in context state.
 
         Works with CallbackContext, ToolContext, or any object with a .state dict-like attribute.
         """
-        state: Any = ctx.state if hasattr(ctx, "state") else ctx
-        if callable(state) and not isinstance(state, dict):
-            state = state()
-        state[self._full_key] = value
+        self._state(ctx)[self._full_key] = value
 
     def increment(self, ctx, amount: int = 1) -> Any:
         """Increment a numeric state value. Returns the new value."""
-        current = self.get(ctx)
+        state = self._state(ctx)
+        current = state.get(self._full_key, self._default)
         if current is None:
             current = self._default if self._default is not None else 0
         new_value = current + amount
-        self.set(ctx, new_value)
+        state[self._full_key] = new_value
         return new_value
 
     def append(self, ctx, item: Any) -> None:
         """Append to a list state value. Creates the list if not set."""
-        current = self.get(ctx)
+        state = self._state(ctx)
+        current = state.get(self._full_key, self._default)
         if current is None:
             current = []
         if not isinstance(current, list):
             current = [current]
         current.append(item)
-        self.set(ctx, current)
+        state[self._full_key] = current
 
     def __repr__(self) -> str:
         return f"StateKey('{self._name}', scope='{self._scope}', type={self._type.__name__})"
@@ -78,10 +78,11 @@ class FallbackNode:
 
 @dataclass(frozen=True, slots=True)
 class RaceNode:
-    """Run children concurrently. First to finish wins."""
+    """Run children concurrently. First to finish (and pass ``accept``) wins."""
 
     name: str
     children: tuple = ()
+    accept: Callable | None = None
 
 
 @dataclass(frozen=True, slots=True)
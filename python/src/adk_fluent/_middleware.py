@@ -220,11 +220,15 @@ class M:
         return MComposite([TimeoutMiddleware(seconds=seconds)], kind="timeout")
 
     @staticmethod
-    def cache(ttl: float = 300, key_fn: Any = None) -> MComposite:
-        """Cache LLM responses keyed by request content."""
+    def cache(ttl: float = 300, key_fn: Any = None, *, path: str | None = None) -> MComposite:
+        """Cache LLM responses keyed by request content.
+
+        Pass ``path`` (e.g. ``"~/.adk_fluent/cache.db"``) to persist responses
+        on disk so repeated runs reuse them.
+        """
         from adk_fluent.middleware import ModelCacheMiddleware
 
-        return MComposite([ModelCacheMiddleware(ttl=ttl, key_fn=key_fn)], kind="cache")
+        return MComposite([ModelCacheMiddleware(ttl=ttl, key_fn=key_fn, path=path)], kind="cache")
 
     @staticmethod
     def fallback_model(model: str = "gemini-2.0-flash") -> MComposite:
@@ -8,6 +8,7 @@ access) so it does not use this module.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 __all__ = ["evaluate_predicate"]
@@ -66,3 +67,40 @@ def evaluate_predicate(
             )
             return False
     return bool(predicate)
+
+
+class _StateCheck:
+    """Predicate ``op(state.get(key, default), value)`` with inspectable operands.
+
+    ``gate.eq()`` / ``gate.gt()`` and friends emit these instead of lambdas
+    so :class:`GateAgent` can evaluate the comparison inline rather than
+    calling back into a Python closure on every check. With ``coerce``, the
+    state value is converted first (``float`` for ordering comparisons, as
+    ``Route.gt`` does). Still callable, so every other consumer treats it
+    like any predicate.
+    """
+
+    __slots__ = ("key", "op", "value", "default", "coerce")
+
+    def __init__(
+        self,
+        key: str,
+        op: Callable[[Any, Any], Any],
+        value: Any,
+        default: Any = None,
+        coerce: Callable[[Any], Any] | None = None,
+    ):
+        self.key = key
+        self.op = op
+        self.value = value
+        self.default = default
+        self.coerce = coerce
+
+    def __call__(self, state: Any) -> bool:
+        actual = state.get(self.key, self.default)
+        if self.coerce is not None:
+            actual = self.coerce(actual)
+        return bool(self.op(actual, self.value))
+
+    def __repr__(self) -> str:
+        return f"_StateCheck({self.key!r}, {self.op.__name__}, {self.value!r})"
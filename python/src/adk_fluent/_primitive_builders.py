@@ -8,16 +8,22 @@ Extracted from ``_base.py`` to keep it focused on ``BuilderBase``.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import itertools
+import operator
+import sys
 from collections.abc import Callable
 from typing import Any, ClassVar, Self
 
 from adk_fluent._base import BuilderBase, fluent
+from adk_fluent._predicate_utils import _StateCheck
 
 __all__ = [
     "PrimitiveBuilderBase",
     # Builders
     "_FnStepBuilder",
+    "_FusedFnStepBuilder",
     "_CaptureBuilder",
     "_ArtifactBuilder",
     "_FallbackBuilder",
@@ -32,6 +38,7 @@ __all__ = [
     "_WatchBuilder",
     # Factory functions
     "tap",
+    "tap_log",
     "expect",
     "map_over",
     "gate",
@@ -76,6 +83,14 @@ class PrimitiveBuilderBase(BuilderBase):
             setattr(clone, attr, val)
         return clone
 
+    def __copy__(self) -> Self:
+        clone = super().__copy__()
+        for attr in self._CUSTOM_ATTRS:
+            val = getattr(self, attr)
+            if isinstance(val, list):
+                setattr(clone, attr, list(val))
+        return clone
+
 
 # ======================================================================
 # Primitive: _fn_step (pure function wrapper)
@@ -138,6 +153,45 @@ class _FnStepBuilder(PrimitiveBuilderBase):
         )
 
 
+class _FusedFnStepBuilder(PrimitiveBuilderBase):
+    """Build-time fusion of consecutive ``>> fn`` steps (see :func:`_fuse_fn_steps`)."""
+
+    _CUSTOM_ATTRS = ("_fns",)
+
+    def build(self):
+        from adk_fluent._primitives import FusedFnAgent
+
+        return FusedFnAgent(name=self._config["name"], fns=self._fns)
+
+
+def _fuse_fn_steps(items: list) -> list:
+    """Collapse runs of adjacent plain ``>> fn`` steps into one fused step.
+
+    Only exact ``_FnStepBuilder`` items are fused; their ``build()`` ignores
+    any other builder state, so the fused agent behaves the same as the run
+    it replaces. The fused step is named after its members joined by ``__``.
+    """
+    fused: list = []
+    run: list[_FnStepBuilder] = []
+
+    def _flush():
+        if len(run) > 1:
+            name = "__".join(step._config["name"] for step in run)
+            fused.append(_FusedFnStepBuilder(name, _fns=tuple(step._fn for step in run)))
+        else:
+            fused.extend(run)
+        run.clear()
+
+    for item in items:
+        if type(item) is _FnStepBuilder:
+            run.append(item)
+        else:
+            _flush()
+            fused.append(item)
+    _flush()
+    return fused
+
+
 class _CaptureBuilder(PrimitiveBuilderBase):
     """Builder wrapper for S.capture() in the expression language."""
 
@@ -238,6 +292,9 @@ def tap(fn: Callable) -> BuilderBase:
 
     Usage:
         pipeline = writer >> tap(lambda s: print(s["draft"])) >> reviewer
+
+    For high-volume logging, :func:`tap_log` batches the text ``fn``
+    returns instead of printing on every call.
     """
     name = getattr(fn, "__name__", "_tap")
     if not name.isidentifier():
@@ -245,6 +302,88 @@ def tap(fn: Callable) -> BuilderBase:
     return _TapBuilder(name, _fn=fn)
 
 
+class _TapLogBuffer:
+    """Batched stdout sink behind :func:`tap_log`.
+
+    Records are appended to a list and written to ``sys.stdout`` with a
+    single ``write`` per flush. The first record of a batch schedules a
+    flush ``interval`` seconds later on the running event loop; with no
+    loop running, the record is written immediately. A batch that reaches
+    ``max_pending`` records is flushed on the spot rather than dropping
+    any. A flush scheduled on a loop that has since closed (``asyncio.run``
+    behind ``.ask()``) never fires, so the next record posted on another
+    loop writes the stranded batch at once. Pending records are flushed
+    at exit; the hook is registered with the first deferred flush.
+    """
+
+    __slots__ = ("_records", "_max_pending", "_interval", "_flush_loop", "_atexit_registered")
+
+    def __init__(self, *, max_pending: int = 4096, interval: float = 0.01) -> None:
+        self._records: list[str] = []
+        self._max_pending = max_pending
+        self._interval = interval
+        # Loop the pending flush is scheduled on, or None when none is pending
+        self._flush_loop: Any = None
+        self._atexit_registered = False
+
+    def post(self, text: str) -> None:
+        self._records.append(text)
+        if len(self._records) >= self._max_pending:
+            self.flush()
+            return
+        import asyncio
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        pending = self._flush_loop
+        if pending is loop:
+            return
+        if pending is not None:
+            # The batch was scheduled on another loop that may never run it
+            self.flush()
+            return
+        if not self._atexit_registered:
+            self._atexit_registered = True
+            atexit.register(self.flush)
+        self._flush_loop = loop
+        loop.call_later(self._interval, self.flush)
+
+    def flush(self) -> None:
+        self._flush_loop = None
+        batch = self._records
+        if not batch:
+            return
+        self._records = []
+        # Looked up per flush so redirected or captured stdout is honoured
+        sys.stdout.write("\n".join(batch) + "\n")
+        sys.stdout.flush()
+
+
+_tap_log = _TapLogBuffer()
+
+
+def tap_log(fn: Callable) -> BuilderBase:
+    """Create a tap whose ``fn(state)`` returns text to log instead of printing.
+
+    The text is buffered and written to stdout in batches, so observation
+    never blocks the step on terminal I/O. Returning ``None`` logs nothing.
+
+    Usage:
+        pipeline = researcher >> tap_log(lambda s: f"after research: {s['findings']}") >> writer
+    """
+
+    @functools.wraps(fn)
+    def _post(state):
+        text = fn(state)
+        if text is not None:
+            _tap_log.post(str(text))
+
+    return tap(_post)
+
+
 class _TapBuilder(PrimitiveBuilderBase):
     """Builder for a pure observation step. No state mutation, no LLM."""
 
@@ -381,16 +520,69 @@ class TimedAgent(PrimitiveBuilderBase):
 _gate_counter = itertools.count(1)
 
 
-def gate(predicate: Callable, *, message: str = "Approval required", gate_key: str | None = None) -> BuilderBase:
-    """Create a human-in-the-loop approval gate.
+class _Gate:
+    """Factory behind :data:`gate`: ``gate(predicate)`` plus single-key comparisons.
 
     Usage:
         gate(lambda s: s.get("risk") == "high", message="Approve high-risk action?")
+        gate.gt("deal_value_usd", 10_000_000, message="Approve large deal?")
+
+    ``gate.eq``/``gate.ne`` compare the raw state value. ``gate.gt``,
+    ``gate.gte``, ``gate.lt`` and ``gate.lte`` compare ``float(state[key])``
+    like ``Route.gt``; a missing key reads as ``0`` and a value that is not
+    a number requires approval. The gate evaluates these inline instead of
+    calling a lambda.
     """
-    name = f"gate_{next(_gate_counter)}"
-    if gate_key is None:
-        gate_key = f"_{name}"
-    return _GateBuilder(name, _predicate=predicate, _message=message, _gate_key=gate_key)
+
+    __slots__ = ()
+
+    def __call__(
+        self, predicate: Callable, *, message: str = "Approval required", gate_key: str | None = None
+    ) -> BuilderBase:
+        """Create a human-in-the-loop approval gate on ``predicate(state)``."""
+        name = f"gate_{next(_gate_counter)}"
+        if gate_key is None:
+            gate_key = f"_{name}"
+        return _GateBuilder(name, _predicate=predicate, _message=message, _gate_key=gate_key)
+
+    def eq(
+        self, key: str, value: Any, *, message: str = "Approval required", gate_key: str | None = None
+    ) -> BuilderBase:
+        """Gate when ``state[key] == value`` (a missing key reads as ``None``)."""
+        return self(_StateCheck(key, operator.eq, value), message=message, gate_key=gate_key)
+
+    def ne(
+        self, key: str, value: Any, *, message: str = "Approval required", gate_key: str | None = None
+    ) -> BuilderBase:
+        """Gate when ``state[key] != value`` (a missing key reads as ``None``)."""
+        return self(_StateCheck(key, operator.ne, value), message=message, gate_key=gate_key)
+
+    def gt(
+        self, key: str, value: float, *, message: str = "Approval required", gate_key: str | None = None
+    ) -> BuilderBase:
+        """Gate when ``float(state[key]) > value``."""
+        return self(_StateCheck(key, operator.gt, float(value), 0, float), message=message, gate_key=gate_key)
+
+    def gte(
+        self, key: str, value: float, *, message: str = "Approval required", gate_key: str | None = None
+    ) -> BuilderBase:
+        """Gate when ``float(state[key]) >= value``."""
+        return self(_StateCheck(key, operator.ge, float(value), 0, float), message=message, gate_key=gate_key)
+
+    def lt(
+        self, key: str, value: float, *, message: str = "Approval required", gate_key: str | None = None
+    ) -> BuilderBase:
+        """Gate when ``float(state[key]) < value``."""
+        return self(_StateCheck(key, operator.lt, float(value), 0, float), message=message, gate_key=gate_key)
+
+    def lte(
+        self, key: str, value: float, *, message: str = "Approval required", gate_key: str | None = None
+    ) -> BuilderBase:
+        """Gate when ``float(state[key]) <= value``."""
+        return self(_StateCheck(key, operator.le, float(value), 0, float), message=message, gate_key=gate_key)
+
+
+gate = _Gate()
 
 
 class _GateBuilder(PrimitiveBuilderBase):
@@ -424,11 +616,20 @@ class _GateBuilder(PrimitiveBuilderBase):
 # ======================================================================
 
 
-def race(*agents) -> BuilderBase:
+def race(*agents, accept: Callable[[str], bool] | None = None) -> BuilderBase:
     """Run agents concurrently, keep only the first to finish.
 
+    With ``accept``, a finished branch wins only if ``accept(text)`` holds
+    for its final response text; otherwise the race waits for the next
+    branch. Use it to take the first specialist that actually handles a
+    request rather than the first that answers at all. If every branch is
+    rejected, the race emits one event saying so. ``accept`` runs on the
+    adk and asyncio backends; the Temporal, DBOS and Prefect backends
+    refuse to compile a race that sets it.
+
     Usage:
         result = race(fast_agent, slow_agent, alternative_agent)
+        result = race(billing, technical, accept=lambda text: "CANNOT_HANDLE" not in text)
     """
     names = []
     for a in agents:
@@ -437,13 +638,13 @@ def race(*agents) -> BuilderBase:
         else:
             names.append("?")
     name = "race_" + "_".join(names)
-    return _RaceBuilder(name, _agents=list(agents))
+    return _RaceBuilder(name, _agents=list(agents), _accept=accept)
 
 
 class _RaceBuilder(PrimitiveBuilderBase):
     """Builder for a race: first sub-agent to finish wins."""
 
-    _CUSTOM_ATTRS = ("_agents",)
+    _CUSTOM_ATTRS = ("_agents", "_accept")
 
     def build(self):
         from adk_fluent._primitives import RaceAgent
@@ -458,6 +659,7 @@ class _RaceBuilder(PrimitiveBuilderBase):
         return RaceAgent(
             name=self._config["name"],
             sub_agents=built_agents,
+            accept=self._accept,
         )
 
     def to_ir(self):
@@ -467,6 +669,7 @@ class _RaceBuilder(PrimitiveBuilderBase):
         return RaceNode(
             name=self._config.get("name", "race"),
             children=children,
+            accept=self._accept,
         )
 
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 __all__ = ["Route", "Fallback"]
@@ -24,6 +26,56 @@ def _make_fallback_builder(children: list):
     return _FallbackBuilder(name, _children=children)
 
 
+class _KeyEquals:
+    """Predicate ``state[key] == value`` that keeps its operands inspectable.
+
+    ``Route.eq()`` (and therefore ``agent >> {...}``) emits these instead of
+    lambdas so :func:`_make_route_agent` can recognise an all-``eq`` route and
+    compile it into a dict lookup.
+    """
+
+    __slots__ = ("key", "value")
+
+    def __init__(self, key: str, value: Any):
+        self.key = key
+        self.value = value
+
+    def __call__(self, state) -> bool:
+        return state.get(self.key) == self.value
+
+    def __repr__(self) -> str:
+        return f"_KeyEquals({self.key!r}, {self.value!r})"
+
+
+def _compile_eq_table(rules) -> tuple[str, Mapping, tuple] | None:
+    """Compile the leading ``eq`` rules on one key into ``(key, {value: agent}, rest)``.
+
+    The longest prefix of hashable ``_KeyEquals`` rules sharing a key goes
+    into the table; ``rest`` holds the remaining ``(predicate, agent)`` rules,
+    evaluated in order only when the lookup misses. Because the table only
+    covers a prefix, first-match semantics are unchanged. Earlier rules win
+    on duplicate values, matching the linear scan. Returns None when the
+    first rule cannot be compiled. The table is a read-only
+    ``MappingProxyType`` since one route agent serves every concurrent
+    invocation.
+    """
+    key: str | None = None
+    table: dict = {}
+    n = 0
+    for pred, agent in rules:
+        if type(pred) is not _KeyEquals or (key is not None and pred.key != key):
+            break
+        try:
+            table.setdefault(pred.value, agent)
+        except TypeError:
+            break
+        key = pred.key
+        n += 1
+    if key is None:
+        return None
+    return key, MappingProxyType(table), tuple(rules[n:])
+
+
 class Route:
     """Deterministic state-based routing. No LLM call -- evaluates predicates against session state.
 
@@ -42,14 +94,15 @@ class Route:
     """
 
     def __init__(self, key: str | None = None):
-        self._key = key
+        # Every dispatch looks this key up in session state
+        self._key = sys.intern(key) if type(key) is str else key
         self._rules: list[tuple[Callable, Any]] = []
         self._default: Any = None
 
     def eq(self, value: Any, agent) -> Route:
         """Branch to agent when state[key] == value."""
         key = self._require_key("eq")
-        self._rules.append((lambda s, v=value, k=key: s.get(k) == v, agent))
+        self._rules.append((_KeyEquals(key, value), agent))
         return self
 
     def contains(self, substring: str, agent) -> Route:
@@ -179,71 +232,35 @@ class Route:
 def _make_route_agent(name, rules, default_agent, sub_agents):
     """Create a deterministic routing agent that evaluates predicates against session state.
 
-    Uses closure-based approach to avoid Pydantic extra='forbid' constraint on BaseAgent.
+    Leading ``eq`` rules on one key (all of them for ``agent >> {...}``)
+    are compiled here into a dict so they cost a single lookup per run.
+    Every route is an instance of the shared ``RouteAgent`` class rather
+    than a fresh class per build.
     """
-    from google.adk.agents.base_agent import BaseAgent
-
-    class _RouteAgent(BaseAgent):
-        """Internal deterministic routing agent. Zero LLM calls."""
-
-        async def _run_async_impl(self, ctx):
-            state = ctx.session.state
-            target = None
-
-            for predicate, agent in rules:
-                try:
-                    if predicate(state):
-                        target = agent
-                        break
-                except (KeyError, TypeError, ValueError):
-                    continue
+    from adk_fluent._primitives import RouteAgent
 
-            if target is None:
-                target = default_agent
-
-            if target is not None:
-                # Fire topology hook
-                from adk_fluent._primitives import _get_topology_hooks
-
-                hooks = _get_topology_hooks()
-                if hooks:
-                    fn = getattr(hooks, "on_route_selected", None)
-                    if fn is not None:
-                        await fn(ctx, name, getattr(target, "name", str(target)))
-
-                async for event in target.run_async(ctx):
-                    yield event
-
-    return _RouteAgent(name=name, sub_agents=sub_agents)
+    compiled = _compile_eq_table(rules)
+    table_key, table, scan = compiled if compiled is not None else (None, None, tuple(rules))
+    return RouteAgent(
+        name=name,
+        sub_agents=sub_agents,
+        table_key=table_key,
+        table=table,
+        scan=scan,
+        default_agent=default_agent,
+    )
 
 
 def _make_checkpoint_agent(name, predicate):
     """Create a tiny agent that checks a predicate and escalates to exit a loop.
 
     Used by loop_until() to implement conditional loop exit using ADK's native
-    escalate mechanism.
+    escalate mechanism. Every checkpoint is an instance of the shared
+    ``CheckpointAgent`` class rather than a fresh class per build.
     """
-    from google.adk.agents.base_agent import BaseAgent
-    from google.adk.events.event import Event
-    from google.adk.events.event_actions import EventActions
-
-    class _CheckpointAgent(BaseAgent):
-        """Internal checkpoint agent. Evaluates predicate, escalates if satisfied."""
-
-        async def _run_async_impl(self, ctx):
-            state = ctx.session.state
-            try:
-                if predicate(state):
-                    yield Event(
-                        invocation_id=ctx.invocation_id,
-                        author=self.name,
-                        branch=ctx.branch,
-                        actions=EventActions(escalate=True),
-                    )
-            except (KeyError, TypeError, ValueError):
-                pass  # Predicate evaluation failed -- don't escalate
-
-    return _CheckpointAgent(name=name)
+    from adk_fluent._primitives import CheckpointAgent
+
+    return CheckpointAgent(name=name, predicate=predicate)
 
 
 class Fallback:
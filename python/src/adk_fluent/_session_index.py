@@ -16,8 +16,8 @@ precomputes the data structures every hot provider needs:
 * ``non_user_mask`` — cached indices of non-user events
 
 Rebuild is incremental: the index syncs against ``len(session.events)``
-and appends only the new events. Rewinds (shorter list) trigger a full
-reset.
+and appends only the new events, so a turn costs O(new events) rather
+than O(session length). Rewinds (shorter list) trigger a full reset.
 
 Callers should not hold on to the index across await points — it is
 only consistent with respect to the session state at the moment it
@@ -97,9 +97,13 @@ class SessionEventIndex:
             # Session was rewound or replaced — full rebuild.
             self._reset()
 
-        # Append any new events to the index.
+        # Append any new events to the index. The private event list is
+        # extended in place rather than re-sliced from the session, so a
+        # long-lived session no longer pays a full copy on every turn.
+        events = self._events
         for i in range(self._len, current_len):
             ev = events_ref[i]
+            events.append(ev)
             author = getattr(ev, "author", None)
             bucket = self._by_author.get(author)
             if bucket is None:
@@ -110,18 +114,10 @@ class SessionEventIndex:
                 self._user_indices.append(i)
             else:
                 self._non_user_indices.append(i)
-
-        # Snapshot the events list. We always materialize a fresh list
-        # so callers can treat ``self._events`` as immutable for the
-        # lifetime of their provider call.
-        if isinstance(events_ref, list):
-            self._events = events_ref[:current_len]
-        else:
-            self._events = list(events_ref[:current_len])
         self._len = current_len
 
     def _reset(self) -> None:
-        self._events = []
+        self._events.clear()
         self._len = 0
         self._by_author.clear()
         self._user_indices.clear()
@@ -134,7 +130,7 @@ class SessionEventIndex:
     @property
     def events(self) -> list[Any]:
         """Materialized event snapshot (treat as read-only)."""
-        return self._events
+        return self._events[:]
 
     def user_events(self) -> list[Any]:
         """Return events authored by ``user``."""
@@ -42,6 +42,7 @@ Usage::
 
 from __future__ import annotations
 
+import operator
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -462,12 +463,19 @@ class S:
         >>> S.merge("a", "b", into="total", fn=lambda a, b: a + b)
         """
 
+        # Fetch every key in one C-level call when all are present (the
+        # usual case after a fan-out); fall back to skipping missing ones.
+        getter = operator.itemgetter(*keys) if len(keys) > 1 else None
+
         def _merge(state: dict) -> StateDelta:
-            values = [state[k] for k in keys if k in state]
+            try:
+                values = getter(state) if getter is not None else [state[k] for k in keys if k in state]
+            except KeyError:
+                values = [state[k] for k in keys if k in state]
             if fn is not None:
                 merged = fn(*values)
             else:
-                merged = "\n".join(str(v) for v in values)
+                merged = "\n".join(map(str, values))
             return StateDelta({into: merged})
 
         return STransform(
@@ -11,3 +11,17 @@ def safe_identifier(name: str) -> str:
     if result and result[0].isdigit():
         result = f"n_{result}"
     return result or "unnamed"
+
+
+def reject_race_accept(node: object, backend: str) -> None:
+    """Raise if a RaceNode carries an ``accept`` predicate *backend* cannot honour.
+
+    Durable backends compile races into generated workflow code, which
+    cannot carry an arbitrary Python callable; silently dropping it would
+    let the first branch to finish win even when ``accept`` rejects it.
+    """
+    if getattr(node, "accept", None) is not None:
+        raise NotImplementedError(
+            f"race(accept=...) is not supported by the {backend} backend (race '{getattr(node, 'name', '?')}'). "
+            "Drop accept= or run this race on the adk or asyncio backend."
+        )
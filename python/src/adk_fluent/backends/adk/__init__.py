@@ -44,6 +44,26 @@ class ADKBackend:
 
     name: str = "adk"
 
+    # Node type -> compiler method name, looked up once per node
+    _COMPILERS: dict[type, str] = {
+        AgentNode: "_compile_agent",
+        SequenceNode: "_compile_sequence",
+        ParallelNode: "_compile_parallel",
+        LoopNode: "_compile_loop",
+        TransformNode: "_compile_transform",
+        TapNode: "_compile_tap",
+        FallbackNode: "_compile_fallback",
+        RaceNode: "_compile_race",
+        GateNode: "_compile_gate",
+        MapOverNode: "_compile_mapover",
+        TimeoutNode: "_compile_timeout",
+        RouteNode: "_compile_route",
+        TransferNode: "_compile_transfer",
+        CaptureNode: "_compile_capture",
+        DispatchNode: "_compile_dispatch",
+        JoinNode: "_compile_join",
+    }
+
     @property
     def capabilities(self):
         from adk_fluent.compile import EngineCapabilities
@@ -143,31 +163,13 @@ class ADKBackend:
 
     def _compile_node(self, node: FullNode) -> Any:
         """Dispatch to the appropriate type-specific compiler."""
-        dispatch = {
-            AgentNode: self._compile_agent,
-            SequenceNode: self._compile_sequence,
-            ParallelNode: self._compile_parallel,
-            LoopNode: self._compile_loop,
-            TransformNode: self._compile_transform,
-            TapNode: self._compile_tap,
-            FallbackNode: self._compile_fallback,
-            RaceNode: self._compile_race,
-            GateNode: self._compile_gate,
-            MapOverNode: self._compile_mapover,
-            TimeoutNode: self._compile_timeout,
-            RouteNode: self._compile_route,
-            TransferNode: self._compile_transfer,
-            CaptureNode: self._compile_capture,
-            DispatchNode: self._compile_dispatch,
-            JoinNode: self._compile_join,
-        }
-        compiler = dispatch.get(type(node))
+        compiler = self._COMPILERS.get(type(node))
         if compiler is None:
             raise TypeError(
                 f"ADKBackend cannot compile node of type {type(node).__name__}. "
-                f"Supported: {', '.join(t.__name__ for t in dispatch)}"
+                f"Supported: {', '.join(t.__name__ for t in self._COMPILERS)}"
             )
-        return compiler(node)
+        return getattr(self, compiler)(node)
 
     def _compile_children(self, children: tuple) -> list:
         """Recursively compile a tuple of child IR nodes."""
@@ -343,6 +345,7 @@ class ADKBackend:
         return RaceAgent(
             name=node.name,
             sub_agents=self._compile_children(node.children),
+            accept=node.accept,
         )
 
     def _compile_gate(self, node: GateNode) -> Any:
@@ -385,7 +388,7 @@ class ADKBackend:
         )
 
     def _compile_route(self, node: RouteNode) -> Any:
-        """RouteNode -> _RouteAgent (via closure-based factory)."""
+        """RouteNode -> RouteAgent."""
         from adk_fluent._routing import _make_route_agent
 
         built_rules = []
@@ -403,35 +406,10 @@ class ADKBackend:
         return _make_route_agent(node.name, built_rules, built_default, sub_agents)
 
     def _compile_transfer(self, node: TransferNode) -> Any:
-        """TransferNode -> a minimal BaseAgent that performs transfer_to_agent."""
-        from google.adk.agents.base_agent import BaseAgent
-
-        target_name = node.target
-        condition_fn = node.condition
-
-        class _TransferAgent(BaseAgent):
-            """Compiled transfer agent. Delegates to target by name."""
-
-            async def _run_async_impl(self, ctx):
-                should_transfer = True
-                if condition_fn is not None:
-                    try:
-                        should_transfer = bool(condition_fn(dict(ctx.session.state)))
-                    except (KeyError, TypeError, ValueError):
-                        should_transfer = False
-
-                if should_transfer and target_name:
-                    from google.adk.events.event import Event
-                    from google.adk.events.event_actions import EventActions
-
-                    yield Event(
-                        invocation_id=ctx.invocation_id,
-                        author=self.name,
-                        branch=ctx.branch,
-                        actions=EventActions(transfer_to_agent=target_name),
-                    )
-
-        return _TransferAgent(name=node.name)
+        """TransferNode -> TransferAgent."""
+        from adk_fluent.backends.adk._primitives import TransferAgent
+
+        return TransferAgent(name=node.name, target_name=node.target, condition=node.condition)
 
     def _compile_capture(self, node: CaptureNode) -> Any:
         """CaptureNode -> CaptureAgent."""
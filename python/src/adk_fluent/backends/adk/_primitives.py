@@ -9,18 +9,23 @@ Extracted from ``_base.py`` to keep it focused on ``BuilderBase``.
 from __future__ import annotations
 
 import asyncio as _asyncio
+import contextlib
 import types
 from collections.abc import AsyncGenerator, Callable
 from contextvars import ContextVar
 from typing import Any, Protocol, runtime_checkable
 
+from cachetools import LRUCache
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.events.event import Event
 
 from adk_fluent._enums import ExecutionMode
+from adk_fluent._predicate_utils import _StateCheck
+from adk_fluent._transforms import _SCOPE_PREFIXES, StateDelta, StateReplacement
 
 __all__ = [
     "FnAgent",
+    "FusedFnAgent",
     "TapAgent",
     "CaptureAgent",
     "ArtifactAgent",
@@ -28,6 +33,9 @@ __all__ = [
     "MapOverAgent",
     "TimeoutAgent",
     "GateAgent",
+    "CheckpointAgent",
+    "RouteAgent",
+    "TransferAgent",
     "RaceAgent",
     "DispatchAgent",
     "JoinAgent",
@@ -120,6 +128,25 @@ _DEFAULT_TASK_BUDGET = _DEFAULT_MAX_TASKS
 # ======================================================================
 
 
+def _apply_fn_result(state: Any, result: Any) -> None:
+    """Merge a ``>> fn`` step's return value into session *state*."""
+    # Plain dicts are by far the most common return; check them first
+    # and merge in one call instead of a per-key Python loop.
+    if type(result) is dict:
+        state.update(result)
+    elif isinstance(result, StateReplacement):
+        # Only affect session-scoped (unprefixed) keys
+        current_session_keys = {k for k in state if not k.startswith(_SCOPE_PREFIXES)}
+        state.update(result.new_state)
+        for k in current_session_keys - result.new_state.keys():
+            state[k] = None
+    elif isinstance(result, StateDelta):
+        state.update(result.updates)
+    elif isinstance(result, dict):
+        for k, v in result.items():
+            state[k] = v
+
+
 class FnAgent(BaseAgent):
     """Zero-cost function agent. No LLM call."""
 
@@ -130,23 +157,30 @@ class FnAgent(BaseAgent):
         object.__setattr__(self, "_fn_ref", fn)
 
     async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
-        from adk_fluent._transforms import _SCOPE_PREFIXES, StateDelta, StateReplacement
-
-        result = self._fn_ref(dict(ctx.session.state))
-        if isinstance(result, StateReplacement):
-            # Only affect session-scoped (unprefixed) keys
-            current_session_keys = {k for k in ctx.session.state if not k.startswith(_SCOPE_PREFIXES)}
-            new_keys = set(result.new_state.keys())
-            for k, v in result.new_state.items():
-                ctx.session.state[k] = v
-            for k in current_session_keys - new_keys:
-                ctx.session.state[k] = None
-        elif isinstance(result, StateDelta):
-            for k, v in result.updates.items():
-                ctx.session.state[k] = v
-        elif isinstance(result, dict):
-            for k, v in result.items():
-                ctx.session.state[k] = v
+        state = ctx.session.state
+        _apply_fn_result(state, self._fn_ref(dict(state)))
+        return
+        yield  # noqa: RET504 -- required for async generator protocol
+
+
+class FusedFnAgent(BaseAgent):
+    """Runs consecutive ``>> fn`` steps as one agent. No LLM call.
+
+    Each function sees the state left by the previous one, exactly as
+    separate :class:`FnAgent` steps would, but the run pays for a single
+    agent invocation instead of one per function.
+    """
+
+    _fn_refs: tuple[Callable, ...]
+
+    def __init__(self, *, fns: tuple[Callable, ...], **kwargs: Any):
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_fn_refs", tuple(fns))
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        for fn in self._fn_refs:
+            _apply_fn_result(state, fn(dict(state)))
         return
         yield  # noqa: RET504 -- required for async generator protocol
 
@@ -191,6 +225,11 @@ class TapAgent(BaseAgent):
         yield  # noqa: RET504 -- required for async generator protocol
 
 
+def _joined_text(parts: list) -> str:
+    """Newline-join the non-empty text parts of a message."""
+    return "\n".join([p.text for p in parts if getattr(p, "text", None)])
+
+
 class CaptureAgent(BaseAgent):
     """Capture the most recent user message from session events into state."""
 
@@ -201,13 +240,23 @@ class CaptureAgent(BaseAgent):
         object.__setattr__(self, "_capture_key", key)
 
     async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
-        for event in reversed(ctx.session.events):
-            if getattr(event, "author", None) == "user":
-                parts = getattr(getattr(event, "content", None), "parts", None) or []
-                texts = [getattr(p, "text", "") for p in parts if getattr(p, "text", None)]
-                if texts:
-                    ctx.session.state[self._capture_key] = "\n".join(texts)
-                    break
+        # Fast path: the message that started this invocation is the latest
+        # user event, so no scan is needed. Skipped when it carries inline
+        # blobs -- the Runner may have rewritten those into artifact
+        # placeholders in the stored event -- or holds no text.
+        user_content = getattr(ctx, "user_content", None)
+        parts = getattr(user_content, "parts", None) or []
+        text = None
+        if all(getattr(p, "inline_data", None) is None for p in parts):
+            text = _joined_text(parts)
+        if not text:
+            for event in reversed(ctx.session.events):
+                if getattr(event, "author", None) == "user":
+                    text = _joined_text(getattr(getattr(event, "content", None), "parts", None) or [])
+                    if text:
+                        break
+        if text:
+            ctx.session.state[self._capture_key] = text
         return
         yield  # noqa: RET504 -- required for async generator protocol
 
@@ -417,40 +466,58 @@ class GateAgent(BaseAgent):
     """Human-in-the-loop approval gate."""
 
     _predicate: Callable
+    _check: _StateCheck | None
     _message: str
     _gate_key: str
+    _approved_key: str
+    _message_key: str
 
     def __init__(self, *, predicate: Callable, message: str, gate_key: str, **kwargs: Any):
         super().__init__(**kwargs)
         object.__setattr__(self, "_predicate", predicate)
+        # gate.eq()/gate.gt() predicates are compared inline in _needs_gate
+        object.__setattr__(self, "_check", predicate if type(predicate) is _StateCheck else None)
         object.__setattr__(self, "_message", message)
         object.__setattr__(self, "_gate_key", gate_key)
+        # Derived state keys are fixed per gate; build them once, not per check
+        object.__setattr__(self, "_approved_key", f"{gate_key}_approved")
+        object.__setattr__(self, "_message_key", f"{gate_key}_message")
+
+    def _needs_gate(self, state: Any) -> bool:
+        check = self._check
+        if check is not None:
+            actual = state.get(check.key, check.default)
+            try:
+                if check.coerce is not None:
+                    actual = check.coerce(actual)
+                return bool(check.op(actual, check.value))
+            except (TypeError, ValueError):
+                # A value the comparison cannot read fails closed: ask for approval
+                return True
+        try:
+            return bool(self._predicate(state))
+        except (KeyError, TypeError, ValueError):
+            return False
 
     async def _run_async_impl(self, ctx):
-        from google.adk.events.event import Event
-        from google.adk.events.event_actions import EventActions
-        from google.genai import types
-
         state = ctx.session.state
-        approved_key = f"{self._gate_key}_approved"
-
-        try:
-            needs_gate = self._predicate(state)
-        except (KeyError, TypeError, ValueError):
-            needs_gate = False
 
-        if not needs_gate:
+        # Gates are usually closed; this check is all a closed gate costs
+        if not self._needs_gate(state):
             return  # Condition not met, proceed
 
-        if state.get(approved_key):
+        if state.get(self._approved_key):
             # Already approved, clear and proceed
-            state[approved_key] = False
+            state[self._approved_key] = False
             state[self._gate_key] = False
             return
 
+        from google.adk.events.event_actions import EventActions
+        from google.genai import types
+
         # Need approval: set flag and escalate
         state[self._gate_key] = True
-        state[f"{self._gate_key}_message"] = self._message
+        state[self._message_key] = self._message
         yield Event(
             invocation_id=ctx.invocation_id,
             author=self.name,
@@ -460,34 +527,197 @@ class GateAgent(BaseAgent):
         )
 
 
+class CheckpointAgent(BaseAgent):
+    """Loop-exit checkpoint: escalates when the predicate holds. No LLM call."""
+
+    _predicate: Callable
+
+    def __init__(self, *, predicate: Callable, **kwargs: Any):
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_predicate", predicate)
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        try:
+            done = self._predicate(ctx.session.state)
+        except (KeyError, TypeError, ValueError):
+            return  # Predicate evaluation failed -- don't escalate
+        if done:
+            from google.adk.events.event_actions import EventActions
+
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                actions=EventActions(escalate=True),
+            )
+
+
+class RouteAgent(BaseAgent):
+    """Deterministic state-based router. No LLM call.
+
+    ``table`` maps ``state[table_key]`` straight to a branch (the compiled
+    leading ``eq`` rules); on a miss the ``scan`` rules are tried in order,
+    then ``default_agent``. Every route is an instance of this class rather
+    than a fresh class per build.
+    """
+
+    _table_key: Any
+    _table: Any
+    _scan: tuple
+    _default_agent: Any
+
+    def __init__(
+        self,
+        *,
+        table_key: Any = None,
+        table: Any = None,
+        scan: tuple = (),
+        default_agent: Any = None,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_table_key", table_key)
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_scan", scan)
+        object.__setattr__(self, "_default_agent", default_agent)
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        target = None
+
+        if self._table is not None:
+            # An unhashable state value raises TypeError -- no eq rule can match
+            with contextlib.suppress(TypeError):
+                target = self._table.get(state.get(self._table_key))
+        if target is None:
+            for predicate, agent in self._scan:
+                try:
+                    if predicate(state):
+                        target = agent
+                        break
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+        if target is None:
+            target = self._default_agent
+
+        if target is not None:
+            # Fire topology hook
+            hooks = _get_topology_hooks()
+            if hooks:
+                fn = getattr(hooks, "on_route_selected", None)
+                if fn is not None:
+                    await fn(ctx, self.name, getattr(target, "name", str(target)))
+
+            async for event in target.run_async(ctx):
+                yield event
+
+
+class TransferAgent(BaseAgent):
+    """Hands control to ``target_name`` via ``transfer_to_agent``. No LLM call.
+
+    With a ``condition``, transfers only when ``condition(state)`` holds.
+    Every compiled transfer is an instance of this class rather than a
+    fresh class per compile.
+    """
+
+    _target_name: str | None
+    _condition: Callable | None
+
+    def __init__(self, *, target_name: str | None, condition: Callable | None = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_target_name", target_name)
+        object.__setattr__(self, "_condition", condition)
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        should_transfer = True
+        if self._condition is not None:
+            try:
+                should_transfer = bool(self._condition(dict(ctx.session.state)))
+            except (KeyError, TypeError, ValueError):
+                should_transfer = False
+
+        if should_transfer and self._target_name:
+            from google.adk.events.event_actions import EventActions
+
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                actions=EventActions(transfer_to_agent=self._target_name),
+            )
+
+
+def _drain_task(task: _asyncio.Task) -> None:
+    """Done-callback: retrieve a discarded task's exception so asyncio doesn't log it."""
+    if not task.cancelled():
+        task.exception()
+
+
 class RaceAgent(BaseAgent):
-    """Runs sub-agents concurrently, keeps first to finish."""
+    """Runs sub-agents concurrently, keeps first to finish.
 
-    async def _run_async_impl(self, ctx):
-        import asyncio
+    Exactly one winner is chosen: if several branches finish in the same
+    loop iteration, the earliest-declared one wins. Losers are cancelled
+    and not awaited; a done-callback drains their exceptions instead.
+
+    With ``accept``, a finished branch only wins if ``accept(text)`` holds
+    for its final response text; rejected (or failed) branches drop out
+    and the race goes on. If every branch is rejected, a single event from
+    the race itself says so, so the caller never gets a silent empty turn.
+    """
+
+    _accept: Callable[[str], bool] | None
+
+    def __init__(self, *, accept: Callable[[str], bool] | None = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_accept", accept)
+
+    def _accepts(self, task: _asyncio.Task) -> bool:
+        if self._accept is None:
+            return True
+        if task.cancelled() or task.exception() is not None:
+            return False
+        from adk_fluent._context_providers import _extract_event_text
 
+        texts = (_extract_event_text(event) for event in reversed(task.result()))
+        return bool(self._accept(next((text for text in texts if text), "")))
+
+    async def _run_async_impl(self, ctx):
         async def _run_one(agent):
             events = []
             async for event in agent.run_async(ctx):
                 events.append(event)
             return events
 
-        tasks = {asyncio.create_task(_run_one(agent)): i for i, agent in enumerate(self.sub_agents)}
-
+        tasks = [_asyncio.create_task(_run_one(agent)) for agent in self.sub_agents]
+        winner = None
         try:
-            done, pending = await asyncio.wait(tasks.keys(), return_when=asyncio.FIRST_COMPLETED)
-            # Cancel remaining
-            for task in pending:
-                task.cancel()
-
-            # Yield events from the winner
-            winner = done.pop()
-            for event in winner.result():
-                yield event
+            running = tasks
+            while running and winner is None:
+                done, _ = await _asyncio.wait(running, return_when=_asyncio.FIRST_COMPLETED)
+                winner = next((t for t in running if t in done and self._accepts(t)), None)
+                running = [t for t in running if t not in done]
         finally:
             for task in tasks:
-                if not task.done():
-                    task.cancel()
+                task.add_done_callback(_drain_task)
+                task.cancel()
+
+        if winner is None:
+            if tasks:
+                from google.genai import types
+
+                text = f"No branch of race '{self.name}' produced an accepted response."
+                yield Event(
+                    invocation_id=ctx.invocation_id,
+                    author=self.name,
+                    branch=ctx.branch,
+                    content=types.Content(role="model", parts=[types.Part(text=text)]),
+                )
+            return
+        # Yield events from the winner
+        for event in winner.result():
+            yield event
 
 
 # ======================================================================
@@ -499,23 +729,26 @@ class _LoopHookAgent(BaseAgent):
     """Zero-cost agent injected at the start of each loop iteration.
 
     Reads _topology_hooks ContextVar and fires on_loop_iteration.
-    Tracks iteration count via a mutable dict (survives ADK state resets).
+    Tracks iteration counts per invocation (survives ADK state resets), so
+    one built loop can serve concurrent runs without sharing a counter.
     If LoopDirective(break_loop=True) is returned, yields escalate event.
     """
 
     _loop_name: str
-    _iteration_counter: dict[str, int]
+    _iteration_counts: LRUCache
 
     def __init__(self, *, loop_name: str, **kwargs: Any):
         super().__init__(**kwargs)
         object.__setattr__(self, "_loop_name", loop_name)
-        object.__setattr__(self, "_iteration_counter", {"n": 0})
+        # Bounded: finished invocations age out instead of accumulating
+        object.__setattr__(self, "_iteration_counts", LRUCache(maxsize=1024))
 
     async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
         from google.adk.events.event_actions import EventActions
 
-        iteration = self._iteration_counter["n"]
-        self._iteration_counter["n"] += 1
+        counts = self._iteration_counts
+        iteration = counts.get(ctx.invocation_id, 0)
+        counts[ctx.invocation_id] = iteration + 1
 
         hooks = _get_topology_hooks()
         if hooks:
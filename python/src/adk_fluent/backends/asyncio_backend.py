@@ -501,20 +501,35 @@ class AsyncioBackend:
 
             tasks.append(asyncio.create_task(_run_branch(child, child_events, child_state)))
 
-        # Wait for first to complete
-        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        accept = getattr(node, "accept", None)
+
+        def _accepted(i: int) -> bool:
+            if accept is None:
+                return True
+            if tasks[i].cancelled() or tasks[i].exception() is not None:
+                return False
+            text = next((e.content for e in reversed(branch_data[i][0]) if e.content), "")
+            return bool(accept(text))
+
+        # Wait for first to complete (and pass ``accept``, if given)
+        winner = None
+        running = set(tasks)
+        while running and winner is None:
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            winner = next((i for i, task in enumerate(tasks) if task in done and _accepted(i)), None)
 
         # Cancel remaining
-        for p in pending:
+        for p in running:
             p.cancel()
 
         # Collect events from the winner
-        for i, task in enumerate(tasks):
-            if task in done:
-                child_events, child_state = branch_data[i]
-                events.extend(child_events)
-                state.update(child_state)
-                break
+        if winner is not None:
+            child_events, child_state = branch_data[winner]
+            events.extend(child_events)
+            state.update(child_state)
+        else:
+            text = f"No branch of race '{node.name}' produced an accepted response."
+            events.append(AgentEvent(author=node.name, content=text))
 
     async def _run_mapover(
         self,
@@ -33,6 +33,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from adk_fluent._ir import AgentEvent, ExecutionConfig
+from adk_fluent.backends._utils import reject_race_accept
 from adk_fluent.compile import EngineCapabilities
 
 __all__ = ["DBOSBackend", "DBOSRunnable"]
@@ -403,6 +404,7 @@ class DBOSBackend:
 
     def _classify_race(self, node: Any) -> list[dict[str, Any]]:
         """RaceNode → asyncio.wait(FIRST_COMPLETED) in workflow."""
+        reject_race_accept(node, "DBOS")
         children_plans = []
         for child in getattr(node, "children", ()):
             children_plans.extend(self._walk_node(child))
@@ -31,6 +31,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from adk_fluent._ir import AgentEvent, ExecutionConfig
+from adk_fluent.backends._utils import reject_race_accept
 from adk_fluent.compile import EngineCapabilities
 
 __all__ = ["PrefectBackend", "PrefectRunnable"]
@@ -403,6 +404,7 @@ class PrefectBackend:
 
     def _classify_race(self, node: Any) -> list[dict[str, Any]]:
         """RaceNode → Submit tasks, wait for FIRST_COMPLETED."""
+        reject_race_accept(node, "Prefect")
         children_plans = []
         for child in getattr(node, "children", ()):
             children_plans.extend(self._walk_node(child))
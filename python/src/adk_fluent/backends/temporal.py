@@ -34,6 +34,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from adk_fluent._ir import AgentEvent, ExecutionConfig
+from adk_fluent.backends._utils import reject_race_accept
 from adk_fluent.compile import EngineCapabilities
 
 __all__ = ["TemporalBackend", "TemporalRunnable"]
@@ -356,6 +357,7 @@ class TemporalBackend:
 
     def _classify_race(self, node: Any) -> list[dict[str, Any]]:
         """RaceNode → First-completed over parallel activities."""
+        reject_race_accept(node, "Temporal")
         children_plans = []
         for child in getattr(node, "children", ()):
             children_plans.extend(self._walk_node(child))
@@ -7,6 +7,8 @@ IR trees — the originals are never mutated.
 Current passes:
 
 - ``fuse_transforms``: Merge adjacent TransformNodes into a single node.
+- ``parallelize_independent``: Run adjacent LLM steps with no data
+  dependency concurrently (opt-in).
 - ``validate_contracts``: Run static contract checks (delegates to
   ``testing.contracts``).
 
@@ -24,6 +26,7 @@ from adk_fluent._ir import TransformNode
 __all__ = [
     "run_passes",
     "fuse_transforms",
+    "parallelize_independent",
     "validate_contracts",
     "annotate_checkpoints",
 ]
@@ -122,6 +125,123 @@ def _compose_transform_fns(fns: list) -> Any:
     return _composed
 
 
+# ======================================================================
+# Pass: parallelize independent LLM steps
+# ======================================================================
+
+
+def parallelize_independent(ir: Any) -> Any:
+    """Group adjacent, provably independent LLM steps of a sequence into a ParallelNode.
+
+    Two adjacent ``AgentNode`` steps may overlap their model calls when the
+    later one cannot observe the earlier one:
+
+    * it reads no state key the earlier one writes (template variables,
+      ``.reads()``, ``.consumes()``), and neither writes a key the other
+      reads or writes;
+    * it ignores conversation history (``include_contents="none"``), so it
+      never saw the earlier step's reply anyway;
+    * neither has tools, callbacks, sub-agents or a dynamic instruction --
+      those can touch state in ways the IR does not describe.
+
+    Any other node (gates, routes, transforms, ...) ends a group, so it stays
+    ordered against its neighbours.
+
+    This pass is opt-in and not part of :func:`run_passes`. It assumes the
+    root runs on the invocation's main branch: steps inside a parallel or race
+    are left alone, since their later siblings could no longer see the moved
+    steps' events.
+    """
+    return _parallelize(ir, branched=False)
+
+
+def _parallelize(node: Any, *, branched: bool) -> Any:
+    children = _get_children(node)
+    if not children:
+        return node
+    kind = type(node).__name__
+    # Only sequences and loops run their children on the parent's branch
+    child_branched = branched or kind not in ("SequenceNode", "LoopNode")
+    new_children = tuple(_parallelize(c, branched=child_branched) for c in children)
+    if kind == "SequenceNode" and not branched:
+        new_children = _group_independent(new_children)
+    if new_children == children:
+        return node
+    return replace(node, children=new_children)
+
+
+def _group_independent(children: tuple) -> tuple:
+    from adk_fluent._ir_generated import ParallelNode
+    from adk_fluent.testing.contracts import _resolve_include_contents
+
+    out: list[Any] = []
+    group: list[Any] = []
+    group_reads: set[str] = set()
+    group_writes: set[str] = set()
+
+    def _flush() -> None:
+        if len(group) > 1:
+            out.append(
+                ParallelNode(
+                    name=f"_parallel_{'_'.join(g.name for g in group)}",
+                    children=tuple(group),
+                    writes_keys=frozenset().union(*(g.writes_keys for g in group)),
+                    reads_keys=frozenset().union(*(g.reads_keys for g in group)),
+                )
+            )
+        else:
+            out.extend(group)
+        group.clear()
+        group_reads.clear()
+        group_writes.clear()
+
+    for child in children:
+        if not _is_plain_llm_step(child):
+            _flush()
+            out.append(child)
+            continue
+        reads, writes = _step_reads(child), _step_writes(child)
+        joins = (
+            bool(group)
+            and _resolve_include_contents(child)[0] == "none"
+            and not reads & group_writes
+            and not writes & (group_reads | group_writes)
+        )
+        if not joins:
+            _flush()
+        group.append(child)
+        group_reads.update(reads)
+        group_writes.update(writes)
+    _flush()
+    return tuple(out)
+
+
+def _is_plain_llm_step(node: Any) -> bool:
+    """An AgentNode whose state effects are fully described by the IR."""
+    if type(node).__name__ != "AgentNode":
+        return False
+    if node.children or node.tools or any(node.callbacks.values()):
+        return False
+    if getattr(node.context_spec, "instruction_provider", None) is not None:
+        return False
+    return all(
+        v is None or isinstance(v, str) for v in (node.instruction, node.global_instruction, node.static_instruction)
+    )
+
+
+def _step_reads(node: Any) -> set[str]:
+    from adk_fluent.testing.contracts import _get_consumer_needs
+
+    return _get_consumer_needs(node) | node.reads_keys
+
+
+def _step_writes(node: Any) -> set[str]:
+    writes = set(node.writes_keys)
+    if node.output_key:
+        writes.add(node.output_key)
+    return writes
+
+
 # ======================================================================
 # Pass: validate contracts
 # ======================================================================
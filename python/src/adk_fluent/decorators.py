@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from typing import Any
 
@@ -12,14 +13,18 @@ def agent(name: str, **kwargs: Any) -> Callable:
     """Decorator that creates an Agent builder from a function.
 
     The decorated function's docstring becomes the agent's instruction.
+    Name and instruction are interned: decorated agents are defined at
+    import time and their strings live for the life of the process.
     """
+    name = sys.intern(name)
 
     def decorator(fn: Callable) -> Any:
         from adk_fluent.agent import Agent
 
         builder: Agent = Agent(name)
-        if fn.__doc__:
-            builder = builder.instruct(fn.__doc__.strip())
+        doc = fn.__doc__
+        if doc:
+            builder = builder.instruct(sys.intern(doc.strip()))
         for k, v in kwargs.items():
             method = getattr(builder, k, None)
             if method and callable(method):
@@ -8,6 +8,26 @@ from collections.abc import Callable
 from typing import Any
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_signature(fn: Callable) -> inspect.Signature:
+    """``inspect.signature`` memoized per function object.
+
+    Tool functions are module-level and immutable, so the same signature
+    is re-derived on every build and clone otherwise. Keyed on the function
+    object itself, so a rebound name (hot reload) gets a fresh entry.
+    """
+    return inspect.signature(fn)
+
+
+def _signature(fn: Callable) -> inspect.Signature:
+    """Return ``fn``'s signature, using the cache when ``fn`` is hashable."""
+    try:
+        return _cached_signature(fn)
+    except TypeError:
+        # Unhashable callable instance — introspect directly.
+        return inspect.signature(fn)
+
+
 def inject_resources(fn: Callable, resources: dict[str, Any]) -> Callable:
     """Wrap a tool function with resource injection.
 
@@ -22,8 +42,9 @@ def inject_resources(fn: Callable, resources: dict[str, Any]) -> Callable:
     Returns:
         Wrapped function with modified signature.
     """
-    sig = inspect.signature(fn)
-    resource_params = {name for name in sig.parameters if name in resources and name != "tool_context"}
+    sig = _signature(fn)
+    # Resolved once here; each call then only fills in the missing names
+    resource_params = tuple(name for name in sig.parameters if name in resources and name != "tool_context")
 
     if not resource_params:
         return fn
@@ -32,7 +53,9 @@ def inject_resources(fn: Callable, resources: dict[str, Any]) -> Callable:
 
     @functools.wraps(fn)
     async def wrapped(**kwargs):
-        kwargs.update({k: resources[k] for k in resource_params if k not in kwargs})
+        for k in resource_params:
+            if k not in kwargs:
+                kwargs[k] = resources[k]
         if is_async:
             return await fn(**kwargs)
         return fn(**kwargs)
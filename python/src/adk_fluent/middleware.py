@@ -21,7 +21,10 @@ from __future__ import annotations
 
 import asyncio as _asyncio
 import contextlib as _contextlib
+import hashlib as _hashlib
+import json as _json
 import logging as _logging
+import os as _os
 import re as _re
 import time as _time
 from collections.abc import Callable
@@ -929,20 +932,18 @@ class RetryMiddleware:
         self.max_attempts = max_attempts
         self.backoff_base = backoff_base
         self._max_backoff = max_backoff
-        # tenacity computes: min(initial * 2**(attempt-1), max) + uniform(0, jitter)
+        # tenacity computes: min(initial * 2**(attempt-1) + uniform(0, jitter), max)
         self._wait = _wait_exponential_jitter(
             initial=backoff_base,
             max=max_backoff,
             jitter=jitter,
         )
+        self._retry_states = _retry_states(max_attempts)
         self._attempts: dict[str, int] = {}
 
     def _compute_delay(self, attempt_number: int) -> float:
         """Delegate delay computation to tenacity's jittered exponential strategy."""
-        # tenacity's wait strategies take a RetryCallState but only read attempt_number.
-        # We construct a minimal duck-typed shim to avoid the full RetryCallState setup.
-        state = _TenacityRetryState(attempt_number=attempt_number)
-        return float(self._wait(state))  # type: ignore[arg-type]
+        return float(self._wait(_retry_state_for(self._retry_states, attempt_number)))  # type: ignore[arg-type]
 
     async def on_model_error(self, ctx, request, error):
         key = f"model_{id(request)}"
@@ -963,7 +964,7 @@ class RetryMiddleware:
         return None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _TenacityRetryState:
     """Minimal duck-type of tenacity.RetryCallState for wait strategies.
 
@@ -975,6 +976,89 @@ class _TenacityRetryState:
     attempt_number: int
 
 
+def _retry_states(max_attempts: int) -> tuple[_TenacityRetryState, ...]:
+    """One shim per retryable attempt, built once per middleware instance."""
+    return tuple(_TenacityRetryState(attempt_number=n) for n in range(1, max_attempts))
+
+
+def _retry_state_for(states: tuple[_TenacityRetryState, ...], attempt_number: int) -> _TenacityRetryState:
+    """Look up the shim for ``attempt_number``; the retry path allocates nothing."""
+    if 0 < attempt_number <= len(states):
+        return states[attempt_number - 1]
+    return _TenacityRetryState(attempt_number=attempt_number)
+
+
+class _PrefixFull(Exception):
+    """Raised by :func:`_str_prefix` once enough text has been produced."""
+
+
+def _str_prefix(obj: Any, limit: int) -> str:
+    """Return ``str(obj)[:limit]`` without rendering the rest of ``obj``.
+
+    ``str()`` of an ``LlmRequest`` renders the whole conversation history --
+    tens of kilobytes -- only for the log to keep the first ``limit``
+    characters. Pydantic models (with pydantic's own ``__str__``/``__repr__``),
+    lists, tuples and dicts are rendered piece by piece, the way pydantic and
+    the builtins would, stopping once ``limit`` characters exist. Anything
+    else is rendered with its own ``repr``.
+    """
+    from pydantic import BaseModel
+
+    parts: list[str] = []
+    size = 0
+
+    def emit(text: str) -> None:
+        nonlocal size
+        parts.append(text)
+        size += len(text)
+        if size >= limit:
+            raise _PrefixFull
+
+    def fields(model: Any, sep: str) -> None:
+        for i, (name, value) in enumerate(model.__repr_args__()):
+            if i:
+                emit(sep)
+            if name is not None:
+                emit(f"{name}=")
+            value_repr(value)
+
+    def value_repr(value: Any) -> None:
+        cls = type(value)
+        if cls is list or cls is tuple:
+            emit("[" if cls is list else "(")
+            for i, item in enumerate(value):
+                if i:
+                    emit(", ")
+                value_repr(item)
+            emit("]" if cls is list else ",)" if len(value) == 1 else ")")
+        elif cls is dict:
+            emit("{")
+            for i, (key, item) in enumerate(value.items()):
+                emit(f"{', ' if i else ''}{key!r}: ")
+                value_repr(item)
+            emit("}")
+        elif isinstance(value, BaseModel) and cls.__repr__ is BaseModel.__repr__ and _pydantic_repr_hooks(cls):
+            emit(f"{value.__repr_name__()}(")
+            fields(value, ", ")
+            emit(")")
+        else:
+            emit(repr(value))
+
+    cls = type(obj)
+    if not (isinstance(obj, BaseModel) and cls.__str__ is BaseModel.__str__ and _pydantic_repr_hooks(cls)):
+        return str(obj)[:limit]
+    with _contextlib.suppress(_PrefixFull):
+        fields(obj, " ")
+    return "".join(parts)[:limit]
+
+
+def _pydantic_repr_hooks(cls: type) -> bool:
+    """Whether ``cls`` renders through pydantic's default repr hooks."""
+    from pydantic import BaseModel
+
+    return cls.__repr_str__ is BaseModel.__repr_str__ and cls.__repr_args__ is BaseModel.__repr_args__
+
+
 class StructuredLogMiddleware:
     """Observability middleware that captures structured event logs.
 
@@ -986,16 +1070,14 @@ class StructuredLogMiddleware:
         self.log: list[dict] = []
 
     def _record(self, event, **kwargs):
-        entry = {"event": event, "timestamp": _time.time()}
-        entry.update(kwargs)
-        self.log.append(entry)
+        self.log.append({"event": event, "timestamp": _time.time(), **kwargs})
 
     async def before_model(self, ctx, request):
-        self._record("before_model", request=str(request)[:200])
+        self._record("before_model", request=_str_prefix(request, 200))
         return None
 
     async def after_model(self, ctx, response):
-        self._record("after_model", response=str(response)[:200])
+        self._record("after_model", response=_str_prefix(response, 200))
         return None
 
     async def on_model_error(self, ctx, request, error):
@@ -1326,26 +1408,143 @@ class ModelCacheMiddleware:
     Backed by ``cachetools.TTLCache`` which evicts expired entries lazily
     *and* enforces a max-size bound — preventing the unbounded-dict memory
     leak of the previous hand-rolled implementation.
+
+    Keys are exact: a retry inside a loop hits only when its request is
+    identical, never on a merely similar prompt. The key for a miss is
+    computed once in ``before_model`` and reused by the matching
+    ``after_model`` (same request object), so the request is stringified
+    once per model call rather than twice.
+
+    With ``path`` set, complete responses are also written to a SQLite
+    file, so re-runs (iterative development, CI) hit across processes.
+    The default key is then a JSON dump of the request, which — unlike
+    ``str(request)`` — carries no per-process object addresses. File I/O
+    runs in a worker thread so it never blocks the event loop.
     """
 
-    def __init__(self, ttl: float = 300, key_fn: Any = None, *, max_size: int = 1024):
+    def __init__(self, ttl: float = 300, key_fn: Any = None, *, max_size: int = 1024, path: str | None = None):
         self._ttl = ttl
-        self._key_fn = key_fn or (lambda req: str(req))
+        if key_fn is None:
+            key_fn = _json_request_key if path is not None else str
+        self._key_fn = key_fn
         self._cache: _TTLCache[str, Any] = _TTLCache(maxsize=max_size, ttl=ttl)
+        # id(request) -> key for calls between before_model and after_model.
+        # Bounded so calls that error out never leak entries.
+        self._pending: _LRUCache[int, Any] = _LRUCache(maxsize=256)
+        self._path = _os.path.expanduser(path) if path is not None else None
 
     async def before_model(self, ctx: Any, request: Any) -> Any:
         key = self._key_fn(request)
         # TTLCache raises KeyError on expired / missing; __contains__ handles
         # expiry checking for us.
         if key in self._cache:
+            self._pending.pop(id(request), None)
             return self._cache[key]
+        if self._path is not None:
+            response = await _asyncio.to_thread(self._load, self._path, key)
+            if response is not None:
+                self._pending.pop(id(request), None)
+                self._cache[key] = response
+                return response
+        self._pending[id(request)] = key
         return None
 
     async def after_model(self, ctx: Any, request: Any, response: Any) -> Any:
-        key = self._key_fn(request)
+        key = self._pending.pop(id(request), None)
+        if key is None:
+            key = self._key_fn(request)
         self._cache[key] = response
+        if self._path is not None:
+            await _asyncio.to_thread(self._store, self._path, key, response)
         return None
 
+    # -- persistent store -------------------------------------------------
+
+    @staticmethod
+    def _connect(path: str) -> Any:
+        import sqlite3
+
+        # One short-lived connection per lookup: safe across threads and
+        # event loops, and cheap next to the model call it stands in for.
+        # The file may be deleted or replaced between calls, so the table
+        # is ensured on every connection rather than once per instance.
+        _os.makedirs(_os.path.dirname(path) or ".", exist_ok=True)
+        conn = sqlite3.connect(path, timeout=5)
+        conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, body TEXT)")
+        return conn
+
+    def _load(self, path: str, key: str) -> Any:
+        import sqlite3
+
+        try:
+            with _contextlib.closing(self._connect(path)) as conn:
+                row = conn.execute(
+                    "SELECT body FROM responses WHERE key = ? AND expires > ?",
+                    (_digest(key), _time.time()),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as exc:
+            _log.warning("Model cache read from %s failed: %s; treating as a miss", path, exc)
+            return None
+        if row is None:
+            return None
+        from google.adk.models.llm_response import LlmResponse
+
+        return LlmResponse.model_validate_json(row[0])
+
+    def _store(self, path: str, key: str, response: Any) -> None:
+        import sqlite3
+
+        from google.adk.models.llm_response import LlmResponse
+
+        # Only complete, successful responses are worth replaying later
+        if not isinstance(response, LlmResponse) or response.partial or response.error_code:
+            return
+        try:
+            with _contextlib.closing(self._connect(path)) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (_digest(key), _time.time() + self._ttl, response.model_dump_json(exclude_none=True)),
+                )
+        except (sqlite3.Error, OSError) as exc:
+            _log.warning("Model cache write to %s failed: %s; response not persisted", path, exc)
+
+
+def _json_request_key(request: Any) -> str:
+    """Process-independent cache key for an ``LlmRequest``.
+
+    ``set_output_schema()`` stores the schema *class* in
+    ``config.response_schema``, which pydantic cannot serialize, so the
+    schema is keyed by its qualified name and JSON schema instead. Requests
+    that still fail to serialize fall back to ``str(request)``.
+    """
+    from pydantic_core import PydanticSerializationError
+
+    dump = getattr(request, "model_dump", None)
+    if dump is None:
+        return str(request)
+    config = getattr(request, "config", None)
+    schema = getattr(config, "response_schema", None)
+    try:
+        body = dump(mode="json", exclude_none=True, exclude={"config": {"response_schema"}})
+        if schema is not None:
+            body["response_schema"] = _schema_key(schema)
+        return _json.dumps(body, sort_keys=True)
+    except (TypeError, ValueError, PydanticSerializationError):
+        return str(request)
+
+
+def _schema_key(schema: Any) -> Any:
+    """JSON-safe identity for a ``response_schema`` value."""
+    if isinstance(schema, type) and hasattr(schema, "model_json_schema"):
+        return [f"{schema.__module__}.{schema.__qualname__}", schema.model_json_schema()]
+    if hasattr(schema, "model_dump"):
+        return schema.model_dump(mode="json", exclude_none=True)
+    return schema
+
+
+def _digest(key: Any) -> str:
+    return _hashlib.sha256(str(key).encode()).hexdigest()
+
 
 # ---------------------------------------------------------------------------
 # Fallback model
@@ -1553,11 +1752,12 @@ class A2ARetryMiddleware:
             max=max_backoff,
             jitter=jitter,
         )
+        self._retry_states = _retry_states(max_attempts)
         self._attempts: dict[str, int] = {}
         self._log = _logging.getLogger(f"{__name__}.A2ARetryMiddleware")
 
     def _compute_delay(self, attempt_number: int) -> float:
-        return float(self._wait(_TenacityRetryState(attempt_number=attempt_number)))  # type: ignore[arg-type]
+        return float(self._wait(_retry_state_for(self._retry_states, attempt_number)))  # type: ignore[arg-type]
 
     def _should_retry(self, error: Exception) -> bool:
         """Determine if an error is retryable (A2A-specific heuristics)."""
@@ -233,8 +233,17 @@ def chain(*steps: Any) -> Any:
     """
     if len(steps) < 2:
         raise ValueError("chain() requires at least 2 steps")
-    result = steps[0]
-    for step in steps[1:]:
+    from adk_fluent.workflow import Pipeline
+
+    result = steps[0] >> steps[1]
+    for step in steps[2:]:
+        # ``result`` was created by ``>>`` above and does not escape until
+        # returned, so extend it in place instead of forking on every step.
+        if isinstance(result, Pipeline):
+            extended = result._rshift(step, in_place=True)
+            if extended is not NotImplemented:
+                result = extended
+                continue
         result = result >> step
     return result
 
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import difflib
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 __all__ = ["Preset"]
@@ -73,11 +74,17 @@ class Preset:
     Raises ``ValueError`` for unrecognised field names, with
     ``difflib.get_close_matches`` suggestions when a likely typo is
     detected.
+
+    A preset is treated as immutable once constructed: ``.use()`` replays
+    settings resolved once per builder class (see :meth:`_resolve_for`).
     """
 
+    __slots__ = ("_fields", "_callbacks", "_resolved")
+
     def __init__(self, **kwargs: Any) -> None:
         self._fields: dict[str, Any] = {}
         self._callbacks: dict[str, list[Callable]] = defaultdict(list)
+        self._resolved: dict[type, tuple[Mapping[str, Any], tuple[tuple[str, tuple[Callable, ...]], ...]]] = {}
 
         for key, value in kwargs.items():
             if key not in _KNOWN_FIELDS:
@@ -91,3 +98,23 @@ class Preset:
                 self._callbacks[key].append(value)
             else:
                 self._fields[key] = value
+
+    def _resolve_for(self, builder_cls: type) -> tuple[Mapping[str, Any], tuple[tuple[str, tuple[Callable, ...]], ...]]:
+        """Return ``(values, callbacks)`` resolved for *builder_cls*.
+
+        Field and callback names are resolved through the builder class's
+        ``_ALIASES`` / ``_CALLBACK_ALIASES`` on first use and cached, so
+        applying a preset to many agents of one class skips re-resolution.
+        ``values`` is one read-only mapping shared by every builder the
+        preset is applied to, merged in a single ``dict.update``; each
+        callbacks entry carries every callback for that field, ready to
+        ``extend`` the builder's list in one call.
+        """
+        resolved = self._resolved.get(builder_cls)
+        if resolved is None:
+            aliases = getattr(builder_cls, "_ALIASES", {})
+            cb_aliases = getattr(builder_cls, "_CALLBACK_ALIASES", {})
+            values = MappingProxyType({aliases.get(key, key): value for key, value in self._fields.items()})
+            callbacks = tuple((cb_aliases.get(key, key), tuple(fns)) for key, fns in self._callbacks.items() if fns)
+            resolved = self._resolved[builder_cls] = (values, callbacks)
+        return resolved
@@ -54,10 +54,32 @@ Checks SequenceNode, ParallelNode, and LoopNode IR trees:
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from typing import Any
 
+from adk_fluent._helpers import _schema_field_names
+
+# {var} / {var?} placeholders in instructions, with the optional marker
+_TEMPLATE_VAR_RE = re.compile(r"\{(\w+)(\??)\}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _template_refs(instruction: str) -> tuple[tuple[str, bool], ...]:
+    """Return ``(name, optional)`` for each placeholder in ``instruction``.
+
+    Memoized on the instruction text: several passes, and every repeated
+    ``check_contracts`` call, read the same (often multi-KB) prompts.
+    """
+    return tuple((name, marker == "?") for name, marker in _TEMPLATE_VAR_RE.findall(instruction))
+
+
+@functools.lru_cache(maxsize=1024)
+def _template_names(instruction: str) -> frozenset[str]:
+    """Return the placeholder names referenced by ``instruction``."""
+    return frozenset(name for name, _ in _template_refs(instruction))
+
 
 def _context_description(context_spec: Any) -> str:
     """Return a human-readable description of a CTransform context spec."""
@@ -135,6 +157,11 @@ def _resolve_include_contents(child: Any) -> tuple[str, Any]:
     return getattr(child, "include_contents", "default"), context_spec
 
 
+def _produced_before(first_produced: dict[str, int], key: str, idx: int) -> bool:
+    """Whether a child before position ``idx`` produces ``key``."""
+    return first_produced.get(key, idx) < idx
+
+
 def _get_transform_writes(child: Any) -> set[str]:
     """Extract the keys written by a TransformNode, using affected_keys."""
     affected = getattr(child, "affected_keys", None)
@@ -192,26 +219,24 @@ def _check_sequence_contracts(
     # =================================================================
     # Pass 2: Output key tracking with transform tracing
     # =================================================================
-    produced_keys: set[str] = set()
-    produced_at: list[set[str]] = []
-    for child in children:
+    # First position each key is produced at, instead of a snapshot of the
+    # growing key set per position (quadratic on long sequences).
+    first_produced: dict[str, int] = {}
+    for idx, child in enumerate(children):
         child_type = type(child).__name__
 
         output_key = getattr(child, "output_key", None)
         if output_key:
-            produced_keys.add(output_key)
+            first_produced.setdefault(output_key, idx)
 
         if child_type == "CaptureNode":
             capture_key = getattr(child, "key", None)
             if capture_key:
-                produced_keys.add(capture_key)
+                first_produced.setdefault(capture_key, idx)
 
         if child_type == "TransformNode":
-            transform_writes = _get_transform_writes(child)
-            if transform_writes:
-                produced_keys |= transform_writes
-
-        produced_at.append(set(produced_keys))
+            for key in _get_transform_writes(child):
+                first_produced.setdefault(key, idx)
 
     # =================================================================
     # Pass 3: Template variable resolution
@@ -223,18 +248,16 @@ def _check_sequence_contracts(
         if not isinstance(instruction, str) or not instruction:
             continue
 
-        # Capture (name, optional_marker) pairs: {var} → ("var", ""), {var?} → ("var", "?")
-        template_matches = re.findall(r"\{(\w+)(\??)\}", instruction)
+        # (name, optional) pairs: {var} → ("var", False), {var?} → ("var", True)
+        template_matches = _template_refs(instruction)
         if not template_matches:
             continue
 
         child_name = getattr(child, "name", "?")
-        upstream_keys = produced_at[idx - 1] if idx > 0 else set()
 
-        for var, opt_marker in template_matches:
+        for var, is_optional in template_matches:
             consumed_keys_by_idx[idx].add(var)
-            is_optional = opt_marker == "?"
-            if var not in upstream_keys:
+            if not _produced_before(first_produced, var, idx):
                 if is_optional:
                     # Optional vars get an advisory, not an error
                     issues.append(
@@ -276,6 +299,14 @@ def _check_sequence_contracts(
     # =================================================================
     # Pass 4: Channel duplication detection (context-spec aware)
     # =================================================================
+    # Where each output_key is written, so an agent only visits the
+    # predecessors its template names rather than all of them.
+    output_key_positions: dict[str, list[int]] = {}
+    for idx, child in enumerate(children):
+        output_key = getattr(child, "output_key", None)
+        if output_key:
+            output_key_positions.setdefault(output_key, []).append(idx)
+
     for idx, child in enumerate(children):
         if idx == 0:
             continue
@@ -290,29 +321,28 @@ def _check_sequence_contracts(
             continue
 
         child_name = getattr(child, "name", "?")
-        template_vars = set(re.findall(r"\{(\w+)\??\}", instruction))
+        template_vars = _template_names(instruction)
 
-        for prev_idx in range(idx):
-            prev = children[prev_idx]
-            prev_output_key = getattr(prev, "output_key", None)
-            if prev_output_key and prev_output_key in template_vars:
-                ctx_desc = _context_description(context_spec)
-                issues.append(
-                    {
-                        "level": "info",
-                        "agent": _scoped(child_name),
-                        "message": (
-                            f"Agent '{child_name}' reads '{prev_output_key}' via both "
-                            f"state (template) and conversation history "
-                            f"({ctx_desc}) — potential channel duplication"
-                        ),
-                        "hint": (
-                            f"Consider using .context(C.none()) on '{child_name}' to read "
-                            f"only from state, or remove '{{{prev_output_key}}}' from "
-                            f"the instruction to rely solely on conversation."
-                        ),
-                    }
-                )
+        prev_idxs = sorted(p for var in template_vars for p in output_key_positions.get(var, ()) if p < idx)
+        for prev_idx in prev_idxs:
+            prev_output_key = children[prev_idx].output_key
+            ctx_desc = _context_description(context_spec)
+            issues.append(
+                {
+                    "level": "info",
+                    "agent": _scoped(child_name),
+                    "message": (
+                        f"Agent '{child_name}' reads '{prev_output_key}' via both "
+                        f"state (template) and conversation history "
+                        f"({ctx_desc}) — potential channel duplication"
+                    ),
+                    "hint": (
+                        f"Consider using .context(C.none()) on '{child_name}' to read "
+                        f"only from state, or remove '{{{prev_output_key}}}' from "
+                        f"the instruction to rely solely on conversation."
+                    ),
+                }
+            )
 
     # =================================================================
     # Pass 5: Route key validation
@@ -327,10 +357,9 @@ def _check_sequence_contracts(
             continue
 
         child_name = getattr(child, "name", "?")
-        upstream_keys = produced_at[idx - 1] if idx > 0 else set()
         consumed_keys_by_idx[idx].add(route_key)
 
-        if route_key not in upstream_keys:
+        if not _produced_before(first_produced, route_key, idx):
             issues.append(
                 {
                     "level": "error",
@@ -466,6 +495,13 @@ def _check_sequence_contracts(
     # =================================================================
     # Pass 8: Dead key detection (produced but never consumed)
     # =================================================================
+    # Last position each key is consumed at: a key is dead at idx when no
+    # later child consumes it. Linear, unlike per-child suffix unions.
+    last_consumed: dict[str, int] = {}
+    for idx, consumed in enumerate(consumed_keys_by_idx):
+        for key in consumed:
+            last_consumed[key] = idx
+
     for idx, child in enumerate(children):
         child_name = getattr(child, "name", "?")
         child_type = type(child).__name__
@@ -486,11 +522,7 @@ def _check_sequence_contracts(
         if not produced_by_child:
             continue
 
-        downstream_consumed: set[str] = set()
-        for later_idx in range(idx + 1, len(children)):
-            downstream_consumed |= consumed_keys_by_idx[later_idx]
-
-        dead = produced_by_child - downstream_consumed
+        dead = {key for key in produced_by_child if last_consumed.get(key, -1) <= idx}
         if dead and idx < len(children) - 1:
             for key in sorted(dead):
                 issues.append(
@@ -512,28 +544,15 @@ def _check_sequence_contracts(
     # =================================================================
     # Pass 9: Type compatibility (produces_type vs consumes_type)
     # =================================================================
-    for idx, child in enumerate(children):
+    # One forward sweep: each consumer is checked against the nearest
+    # upstream producer with fields, tracked as we go.
+    nearest_producer: tuple[str, Any, frozenset[str]] | None = None
+    for child in children:
         consumes_type = getattr(child, "consumes_type", None)
-        if not consumes_type:
-            continue
-
-        child_name = getattr(child, "name", "?")
-        consumes_fields = set(consumes_type.model_fields.keys()) if hasattr(consumes_type, "model_fields") else set()
-        if not consumes_fields:
-            continue
-
-        for prev_idx in range(idx - 1, -1, -1):
-            prev = children[prev_idx]
-            produces_type = getattr(prev, "produces_type", None)
-            if not produces_type:
-                continue
-            prev_name = getattr(prev, "name", "?")
-            produces_fields = (
-                set(produces_type.model_fields.keys()) if hasattr(produces_type, "model_fields") else set()
-            )
-            if not produces_fields:
-                continue
-            missing_fields = consumes_fields - produces_fields
+        if consumes_type is not None and nearest_producer is not None:
+            child_name = getattr(child, "name", "?")
+            prev_name, upstream_type, upstream_fields = nearest_producer
+            missing_fields = _schema_field_names(consumes_type) - upstream_fields
             if missing_fields:
                 issues.append(
                     {
@@ -541,16 +560,21 @@ def _check_sequence_contracts(
                         "agent": _scoped(child_name),
                         "message": (
                             f"Agent '{child_name}' consumes {consumes_type.__name__} "
-                            f"but upstream '{prev_name}' produces {produces_type.__name__} "
+                            f"but upstream '{prev_name}' produces {upstream_type.__name__} "
                             f"which is missing fields: {', '.join(sorted(missing_fields))}"
                         ),
                         "hint": (
-                            f"Add the missing fields to {produces_type.__name__} or "
+                            f"Add the missing fields to {upstream_type.__name__} or "
                             f"remove them from {consumes_type.__name__}."
                         ),
                     }
                 )
-            break
+
+        produces_type = getattr(child, "produces_type", None)
+        if produces_type:
+            produces_fields = _schema_field_names(produces_type)
+            if produces_fields:
+                nearest_producer = (getattr(child, "name", "?"), produces_type, produces_fields)
 
     # =================================================================
     # Pass 10: Transform reads validation
@@ -565,9 +589,7 @@ def _check_sequence_contracts(
             continue  # opaque — can't validate
 
         child_name = getattr(child, "name", "?")
-        upstream_keys = produced_at[idx - 1] if idx > 0 else set()
-
-        missing = transform_reads - upstream_keys
+        missing = {key for key in transform_reads if not _produced_before(first_produced, key, idx)}
         if missing:
             for key in sorted(missing):
                 consumed_keys_by_idx[idx].add(key)
@@ -781,7 +803,7 @@ def _check_sequence_contracts(
         child_name = getattr(child, "name", "?")
 
         if not isinstance(child, ArtifactNode):
-            # Non-artifact nodes may still produce state keys (tracked in produced_keys already)
+            # Non-artifact nodes may still produce state keys (tracked in first_produced already)
             continue
 
         # Check consumed artifacts are available upstream
@@ -799,9 +821,8 @@ def _check_sequence_contracts(
 
         # Check consumed state keys (bridge ops like publish reading from_key)
         if child.bridges_state:
-            upstream_keys = produced_at[idx - 1] if idx > 0 else set()
             for key in child.consumes_state:
-                if key not in upstream_keys:
+                if not _produced_before(first_produced, key, idx):
                     issues.append(
                         {
                             "level": "error",
@@ -814,10 +835,6 @@ def _check_sequence_contracts(
         for artifact_name in child.produces_artifact:
             artifacts_available.add(artifact_name)
 
-        # Promote produced state keys (so downstream state checks see them)
-        for key in child.produces_state:
-            produced_keys.add(key)
-
     # =================================================================
     # Pass 16: ArtifactSchema dependency validation
     # =================================================================
@@ -889,9 +906,9 @@ def _check_sequence_contracts(
         # --- Inference: successor reads state but predecessor has no output_key ---
         # Check template vars in successor instruction
         succ_instruction = getattr(successor, "instruction", "")
-        succ_template_vars: set[str] = set()
+        succ_template_vars: frozenset[str] = frozenset()
         if isinstance(succ_instruction, str) and succ_instruction:
-            succ_template_vars = set(re.findall(r"\{(\w+)\??\}", succ_instruction))
+            succ_template_vars = _template_names(succ_instruction)
 
         # Check successor .reads() keys (from context spec)
         succ_reads: set[str] = set()
@@ -906,14 +923,13 @@ def _check_sequence_contracts(
             succ_route_key = getattr(successor, "key", None)
 
         # Collect all state keys the successor needs
-        succ_needs_keys = succ_template_vars | succ_reads
+        succ_needs_keys = succ_reads | succ_template_vars  # set first: result stays mutable
         if succ_route_key:
             succ_needs_keys.add(succ_route_key)
 
         if not output_key and succ_needs_keys:
             # Predecessor has no output_key but successor needs state data.
-            upstream_keys = produced_at[idx - 1] if idx > 0 else set()
-            unresolved = succ_needs_keys - upstream_keys
+            unresolved = {key for key in succ_needs_keys if not _produced_before(first_produced, key, idx)}
 
             if unresolved:
                 hint_keys = ", ".join(f"'{k}'" for k in sorted(unresolved))
@@ -1186,23 +1202,27 @@ def infer_data_flow(ir_node: Any) -> list[DataFlowSuggestion]:
     children = ir_node.children
     suggestions: list[DataFlowSuggestion] = []
 
-    # Build produced_keys map at each position
-    produced_keys: set[str] = set()
-    produced_at: list[set[str]] = []
-    for child in children:
+    # First position each key is produced at
+    first_produced: dict[str, int] = {}
+    for idx, child in enumerate(children):
         child_type = type(child).__name__
         output_key = getattr(child, "output_key", None)
         if output_key:
-            produced_keys.add(output_key)
+            first_produced.setdefault(output_key, idx)
         if child_type == "CaptureNode":
             capture_key = getattr(child, "key", None)
             if capture_key:
-                produced_keys.add(capture_key)
+                first_produced.setdefault(capture_key, idx)
         if child_type == "TransformNode":
-            tw = _get_transform_writes(child)
-            if tw:
-                produced_keys |= tw
-        produced_at.append(set(produced_keys))
+            for key in _get_transform_writes(child):
+                first_produced.setdefault(key, idx)
+
+    # State keys each child needs, and the last position each key is needed at
+    needs_at = [_get_consumer_needs(child) for child in children]
+    last_needed: dict[str, int] = {}
+    for idx, needs in enumerate(needs_at):
+        for key in needs:
+            last_needed[key] = idx
 
     # Analyze each agent's data flow needs
     for idx, child in enumerate(children):
@@ -1216,9 +1236,8 @@ def infer_data_flow(ir_node: Any) -> list[DataFlowSuggestion]:
             succ_name = getattr(successor, "name", "?")
 
             # What does successor need from state?
-            needed_keys = _get_consumer_needs(successor)
-            upstream_keys = produced_at[idx - 1] if idx > 0 else set()
-            unresolved = needed_keys - upstream_keys
+            needed_keys = needs_at[idx + 1]
+            unresolved = {key for key in needed_keys if not _produced_before(first_produced, key, idx)}
 
             if unresolved:
                 # Suggest the most plausible key name
@@ -1239,26 +1258,18 @@ def infer_data_flow(ir_node: Any) -> list[DataFlowSuggestion]:
                 )
 
         # --- Suggestion 2: Unused writes ---
-        if output_key and idx < len(children) - 1:
-            consumed_downstream = False
-            for later_idx in range(idx + 1, len(children)):
-                later = children[later_idx]
-                later_needs = _get_consumer_needs(later)
-                if output_key in later_needs:
-                    consumed_downstream = True
-                    break
-            if not consumed_downstream:
-                suggestions.append(
-                    DataFlowSuggestion(
-                        agent=child_name,
-                        action="remove_writes",
-                        key=output_key,
-                        reason=(
-                            f"output_key='{output_key}' is not read by any downstream agent — the write has no consumer"
-                        ),
-                        channel="state",
-                    )
+        if output_key and idx < len(children) - 1 and last_needed.get(output_key, -1) <= idx:
+            suggestions.append(
+                DataFlowSuggestion(
+                    agent=child_name,
+                    action="remove_writes",
+                    key=output_key,
+                    reason=(
+                        f"output_key='{output_key}' is not read by any downstream agent — the write has no consumer"
+                    ),
+                    channel="state",
                 )
+            )
 
         # --- Suggestion 3: Context recommendations ---
         if child_type == "AgentNode" and output_key and idx < len(children) - 1:
@@ -1306,7 +1317,7 @@ def _get_consumer_needs(node: Any) -> set[str]:
     # Template variables in instruction
     instruction = getattr(node, "instruction", "")
     if isinstance(instruction, str) and instruction:
-        needs |= set(re.findall(r"\{(\w+)\??\}", instruction))
+        needs |= _template_names(instruction)
 
     # .reads() / context spec keys
     context_spec = getattr(node, "context_spec", None)
@@ -1323,7 +1334,7 @@ def _get_consumer_needs(node: Any) -> set[str]:
 
     # consumes_type keys
     consumes_type = getattr(node, "consumes_type", None)
-    if consumes_type is not None and hasattr(consumes_type, "model_fields"):
-        needs |= set(consumes_type.model_fields.keys())
+    if consumes_type is not None:
+        needs |= _schema_field_names(consumes_type)
 
     return needs
@@ -9,8 +9,11 @@ Generates Mermaid diagrams with:
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
+_TEMPLATE_VAR_RE = re.compile(r"\{(\w+)\??\}")
+
 
 def ir_to_mermaid(
     node: Any,
@@ -30,6 +33,24 @@ def ir_to_mermaid(
     Returns:
         Mermaid graph source text.
     """
+    from adk_fluent._ir import (
+        ArtifactNode,
+        CaptureNode,
+        DispatchNode,
+        FallbackNode,
+        GateNode,
+        JoinNode,
+        MapOverNode,
+        RaceNode,
+        RouteNode,
+        TapNode,
+        TimeoutNode,
+        TransferNode,
+        TransformNode,
+        UINode,
+    )
+    from adk_fluent._ir_generated import AgentNode, LoopNode, ParallelNode, SequenceNode
+
     lines = ["graph TD"]
     edges: list[str] = []
     contract_notes: list[str] = []
@@ -50,24 +71,6 @@ def ir_to_mermaid(
         return text.replace('"', "'").replace("\n", " ")
 
     def _walk(n: Any) -> str:
-        from adk_fluent._ir import (
-            ArtifactNode,
-            CaptureNode,
-            DispatchNode,
-            FallbackNode,
-            GateNode,
-            JoinNode,
-            MapOverNode,
-            RaceNode,
-            RouteNode,
-            TapNode,
-            TimeoutNode,
-            TransferNode,
-            TransformNode,
-            UINode,
-        )
-        from adk_fluent._ir_generated import AgentNode, LoopNode, ParallelNode, SequenceNode
-
         nid = _id()
         name = getattr(n, "name", "?")
         children = getattr(n, "children", ())
@@ -161,10 +164,7 @@ def ir_to_mermaid(
             # Track what this node consumes (from template vars and reads_keys)
             instruction = getattr(n, "instruction", "")
             if isinstance(instruction, str) and instruction:
-                import re
-
-                template_vars = re.findall(r"\{(\w+)\??\}", instruction)
-                for var in template_vars:
+                for var in _TEMPLATE_VAR_RE.findall(instruction):
                     _consumers.setdefault(var, []).append(nid)
 
             reads = getattr(n, "reads_keys", frozenset())
@@ -236,12 +236,12 @@ def ir_to_mermaid(
 
     # Build data flow edges: producer --"key"--> consumer
     if show_data_flow:
-        seen_flow_edges: set[str] = set()
-        for key in sorted(set(_producers.keys()) & set(_consumers.keys())):
+        seen_flow_edges: set[tuple[str, str, str]] = set()
+        for key in sorted(_producers.keys() & _consumers.keys()):
             for prod_id in _producers[key]:
                 for cons_id in _consumers[key]:
                     if prod_id != cons_id:
-                        edge_key = f"{prod_id}-{key}-{cons_id}"
+                        edge_key = (prod_id, key, cons_id)
                         if edge_key not in seen_flow_edges:
                             seen_flow_edges.add(edge_key)
                             data_flow_edges.append(f'    {prod_id} -. "{key}" .-> {cons_id}')
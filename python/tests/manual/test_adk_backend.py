@@ -68,6 +68,37 @@ def test_compile_loop_node(backend):
     assert agent.sub_agents[1].name == "step"
 
 
+def test_loop_hook_counts_iterations_per_invocation():
+    import asyncio
+    import types
+
+    from adk_fluent._primitives import _LoopHookAgent, _topology_hooks
+
+    seen = []
+
+    class Hooks:
+        async def on_loop_iteration(self, ctx, loop_name, iteration):
+            seen.append((ctx.invocation_id, iteration))
+
+    agent = _LoopHookAgent(name="_loop_hook", loop_name="loop")
+
+    async def run(invocation_id):
+        ctx = types.SimpleNamespace(invocation_id=invocation_id, branch=None)
+        async for _ in agent._run_async_impl(ctx):
+            pass
+
+    async def main():
+        token = _topology_hooks.set(Hooks())
+        try:
+            for inv in ("a", "b", "a", "b", "a"):
+                await run(inv)
+        finally:
+            _topology_hooks.reset(token)
+
+    asyncio.run(main())
+    assert seen == [("a", 0), ("b", 0), ("a", 1), ("b", 1), ("a", 2)]
+
+
 def test_compile_transform_node(backend):
     from adk_fluent._primitives import FnAgent
 
@@ -78,6 +109,42 @@ def test_compile_transform_node(backend):
     assert isinstance(agent, FnAgent)
 
 
+def _drain_fn_agent(fn, state):
+    import asyncio
+    import types
+
+    from adk_fluent._primitives import FnAgent
+
+    agent = FnAgent(name="t", fn=fn)
+    ctx = types.SimpleNamespace(session=types.SimpleNamespace(state=state))
+
+    async def _run():
+        async for _ in agent._run_async_impl(ctx):
+            pass
+
+    asyncio.run(_run())
+    return state
+
+
+def test_fn_agent_merges_dict_result():
+    state = _drain_fn_agent(lambda s: {"total": s["a"] + 1}, {"a": 1, "b": 2})
+    assert state == {"a": 1, "b": 2, "total": 2}
+
+
+def test_fn_agent_state_replacement_clears_session_keys_only():
+    from adk_fluent._transforms import StateReplacement
+
+    state = _drain_fn_agent(lambda s: StateReplacement({"a": 9}), {"a": 1, "b": 2, "app:x": 3})
+    assert state == {"a": 9, "b": None, "app:x": 3}
+
+
+def test_fn_agent_state_delta_and_none():
+    from adk_fluent._transforms import StateDelta
+
+    assert _drain_fn_agent(lambda s: StateDelta({"k": 1}), {}) == {"k": 1}
+    assert _drain_fn_agent(lambda s: None, {"k": 1}) == {"k": 1}
+
+
 def test_compile_tap_node(backend):
     from adk_fluent._primitives import TapAgent
 
@@ -145,6 +212,46 @@ def test_compile_gate_node(backend):
     assert isinstance(agent, GateAgent)
 
 
+def test_gate_agent_escalates_then_passes_once_approved():
+    import asyncio
+    import types
+
+    from adk_fluent._primitives import GateAgent
+
+    agent = GateAgent(name="gate", predicate=lambda s: s.get("risk") == "high", message="Approve?", gate_key="_gate")
+    state = {"risk": "high"}
+    ctx = types.SimpleNamespace(session=types.SimpleNamespace(state=state), invocation_id="inv", branch=None)
+
+    async def _events():
+        return [e async for e in agent._run_async_impl(ctx)]
+
+    (event,) = asyncio.run(_events())
+    assert event.actions.escalate
+    assert state == {"risk": "high", "_gate": True, "_gate_message": "Approve?"}
+
+    state["_gate_approved"] = True
+    assert asyncio.run(_events()) == []
+    assert state["_gate"] is False and state["_gate_approved"] is False
+
+
+def test_gate_agent_closed_gate_yields_nothing():
+    import asyncio
+    import types
+
+    from adk_fluent._primitives import GateAgent
+
+    agent = GateAgent(name="gate", predicate=lambda s: s["risk"] == "high", message="Approve?", gate_key="_gate")
+
+    async def _events(state):
+        ctx = types.SimpleNamespace(session=types.SimpleNamespace(state=state))
+        return [e async for e in agent._run_async_impl(ctx)]
+
+    state = {"risk": "low"}
+    assert asyncio.run(_events(state)) == []
+    assert state == {"risk": "low"}
+    assert asyncio.run(_events({})) == []  # failing predicates count as closed
+
+
 def test_compile_mapover_node(backend):
     from adk_fluent._ir import MapOverNode
     from adk_fluent._primitives import MapOverAgent
@@ -179,12 +286,92 @@ def test_compile_race_node(backend):
     assert len(agent.sub_agents) == 2
 
 
+def test_race_agent_single_winner_and_losers_cancelled():
+    import asyncio
+    import types
+
+    from google.adk.agents.base_agent import BaseAgent
+
+    from adk_fluent._primitives import RaceAgent
+
+    cancelled = []
+
+    class _Racer(BaseAgent):
+        delay: float = 0.0
+        fail: bool = False
+
+        async def run_async(self, ctx):
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                cancelled.append(self.name)
+                raise
+            if self.fail:
+                raise RuntimeError(self.name)
+            yield self.name
+
+    async def race(*racers):
+        agent = RaceAgent(name="race", sub_agents=list(racers))
+        events = [e async for e in agent._run_async_impl(types.SimpleNamespace())]
+        await asyncio.sleep(0)  # let cancellations land
+        return events
+
+    slow = _Racer(name="slow", delay=1.0)
+    fast = _Racer(name="fast")
+    assert asyncio.run(race(slow, fast)) == ["fast"]
+    assert cancelled == ["slow"]
+
+    # Ties resolve to the earliest-declared branch, never to both
+    assert asyncio.run(race(_Racer(name="first"), _Racer(name="second"))) == ["first"]
+
+
+def test_race_agent_accept_skips_rejected_branches(backend):
+    import asyncio
+    import types
+
+    from google.adk.agents.base_agent import BaseAgent
+    from google.adk.events.event import Event
+    from google.genai import types as genai_types
+
+    from adk_fluent._ir import RaceNode
+    from adk_fluent._primitives import RaceAgent
+
+    accept = lambda text: "CANNOT_HANDLE" not in text
+    node = RaceNode(name="race", children=(AgentNode(name="a"), AgentNode(name="b")), accept=accept)
+    assert backend.compile(node).root_agent._accept is accept
+
+    class _Specialist(BaseAgent):
+        delay: float = 0.0
+        reply: str = ""
+
+        async def run_async(self, ctx):
+            await asyncio.sleep(self.delay)
+            yield Event(author=self.name, content=genai_types.Content(parts=[genai_types.Part(text=self.reply)]))
+
+    def race(*specialists):
+        agent = RaceAgent(name="race", sub_agents=list(specialists), accept=accept)
+
+        async def _run():
+            ctx = types.SimpleNamespace(invocation_id="inv", branch=None)
+            return [e async for e in agent._run_async_impl(ctx)]
+
+        return asyncio.run(_run())
+
+    billing = _Specialist(name="billing", reply="CANNOT_HANDLE")
+    technical = _Specialist(name="technical", delay=0.01, reply="Restart the router.")
+    assert [e.author for e in race(billing, technical)] == ["technical"]
+
+    # Every branch rejected: the race says so rather than yielding nothing
+    (event,) = race(_Specialist(name="a", reply="CANNOT_HANDLE"), _Specialist(name="b", reply="CANNOT_HANDLE"))
+    assert event.author == "race"
+    assert "no branch" in event.content.parts[0].text.lower()
+
+
 def test_compile_route_node(backend):
     pred = lambda s: s.get("intent") == "book"
     target = AgentNode(name="booker")
     node = RouteNode(name="router", key="intent", rules=((pred, target),), default=None)
     result = backend.compile(node)
-    # RouteAgent is created via closure, check it has sub_agents
     agent = result.root_agent
     assert agent.name == "router"
     assert len(agent.sub_agents) == 1
@@ -199,6 +386,28 @@ def test_compile_transfer_node(backend):
     assert agent.name == "xfer"
 
 
+def test_transfer_agent_transfers_when_condition_holds(backend):
+    import asyncio
+    import types
+
+    from adk_fluent._ir import TransferNode
+    from adk_fluent._primitives import TransferAgent
+
+    node = TransferNode(name="xfer", target="billing", condition=lambda s: s["intent"] == "billing")
+    agent = backend.compile(node).root_agent
+    assert type(agent) is TransferAgent
+    assert type(backend.compile(TransferNode(name="other", target="x")).root_agent) is TransferAgent
+
+    async def _events(state):
+        ctx = types.SimpleNamespace(session=types.SimpleNamespace(state=state), invocation_id="inv", branch=None)
+        return [e async for e in agent._run_async_impl(ctx)]
+
+    (event,) = asyncio.run(_events({"intent": "billing"}))
+    assert event.actions.transfer_to_agent == "billing"
+    assert asyncio.run(_events({"intent": "support"})) == []
+    assert asyncio.run(_events({})) == []  # failing conditions don't transfer
+
+
 def test_backend_satisfies_protocol(backend):
     from adk_fluent.backends._protocol import Backend
 
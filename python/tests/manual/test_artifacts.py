@@ -561,6 +561,30 @@ class TestContentTransformsPre:
         assert "<h1>" in result["report"] or "<h1" in result["report"] or "<pre>" in result["report"]
         assert "Hello" in result["report"]
 
+    def test_from_markdown_reuses_one_converter(self, monkeypatch):
+        import sys
+        import types
+
+        from adk_fluent import A
+
+        built = []
+
+        class FakeMarkdown:
+            def __init__(self):
+                built.append(self)
+
+            def reset(self):
+                return self
+
+            def convert(self, text):
+                return f"<p>{text}</p>"
+
+        monkeypatch.setitem(sys.modules, "markdown", types.SimpleNamespace(Markdown=FakeMarkdown))
+        t = A.from_markdown("report")
+        assert t({"report": "one"})["report"] == "<p>one</p>"
+        assert t({"report": "two"})["report"] == "<p>two</p>"
+        assert len(built) == 1
+
     def test_from_json_reads_writes_keys(self):
         from adk_fluent import A
 
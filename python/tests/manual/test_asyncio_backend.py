@@ -2,7 +2,7 @@
 
 import asyncio
 
-from adk_fluent._ir import FallbackNode, TapNode, TransformNode
+from adk_fluent._ir import FallbackNode, RaceNode, TapNode, TransformNode
 from adk_fluent._ir_generated import AgentNode, LoopNode, ParallelNode, SequenceNode
 from adk_fluent.backends.asyncio_backend import AsyncioBackend
 from adk_fluent.compute._protocol import GenerateResult
@@ -271,6 +271,40 @@ class TestAsyncioBackendFallback:
         asyncio.run(_test())
 
 
+class TestAsyncioBackendRace:
+    def test_race_accept_skips_rejected_branch(self):
+        """RaceNode with accept keeps the first branch whose reply passes."""
+        provider = FakeModelProvider(responses={"Billing": "CANNOT_HANDLE", "Tech": "Restart the router."})
+        backend = AsyncioBackend(model_provider=provider)
+
+        async def _test():
+            race = RaceNode(
+                name="race",
+                children=(AgentNode(name="billing", instruction="Billing"), AgentNode(name="tech", instruction="Tech")),
+                accept=lambda text: "CANNOT_HANDLE" not in text,
+            )
+            events = await backend.run(backend.compile(race), "My internet is down")
+            return [e.content for e in events if e.content]
+
+        assert asyncio.run(_test()) == ["Restart the router."]
+
+    def test_race_reports_when_every_branch_is_rejected(self):
+        provider = FakeModelProvider(responses={"Billing": "CANNOT_HANDLE", "Tech": "CANNOT_HANDLE"})
+        backend = AsyncioBackend(model_provider=provider)
+
+        async def _test():
+            race = RaceNode(
+                name="race",
+                children=(AgentNode(name="billing", instruction="Billing"), AgentNode(name="tech", instruction="Tech")),
+                accept=lambda text: "CANNOT_HANDLE" not in text,
+            )
+            return await backend.run(backend.compile(race), "My internet is down")
+
+        (event,) = asyncio.run(_test())
+        assert event.author == "race"
+        assert event.content == "No branch of race 'race' produced an accepted response."
+
+
 class TestAsyncioBackendRegistry:
     def test_registered(self):
         from adk_fluent.backends import available_backends
@@ -140,6 +140,47 @@ class TestResolveGuardTupleJson:
             )
 
 
+class TestResolveGuardTupleOutput:
+    @pytest.mark.asyncio
+    async def test_pydantic_schema_validates_json_directly(self):
+        from pydantic import BaseModel
+
+        from adk_fluent._base import _resolve_guard_tuple
+        from adk_fluent._exceptions import GuardViolation
+
+        class Report(BaseModel):
+            title: str
+            score: float
+
+        fn = _resolve_guard_tuple(("guard:output", Report))
+        ok = await fn(
+            callback_context=_make_callback_context(),
+            llm_response=_make_llm_response('{"title": "t", "score": 0.5}'),
+        )
+        assert ok is None
+        for bad in ('{"title": "t"}', "not json"):
+            with pytest.raises(GuardViolation, match="schema validation failed"):
+                await fn(callback_context=_make_callback_context(), llm_response=_make_llm_response(bad))
+
+    @pytest.mark.asyncio
+    async def test_schema_without_validate_json_uses_model_validate(self):
+        from adk_fluent._base import _resolve_guard_tuple
+        from adk_fluent._exceptions import GuardViolation
+
+        seen = []
+
+        class Schema:
+            @classmethod
+            def model_validate(cls, data):
+                seen.append(data)
+
+        fn = _resolve_guard_tuple(("guard:output", Schema))
+        await fn(callback_context=_make_callback_context(), llm_response=_make_llm_response('{"a": 1}'))
+        assert seen == [{"a": 1}]
+        with pytest.raises(GuardViolation):
+            await fn(callback_context=_make_callback_context(), llm_response=_make_llm_response("{"))
+
+
 class TestResolveGuardTupleLength:
     @pytest.mark.asyncio
     async def test_within_bounds_passes(self):
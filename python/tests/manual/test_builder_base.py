@@ -28,6 +28,22 @@ class TestBuilderBaseInheritance:
         assert result is agent
         assert agent._config["instruction"] == "Do stuff."
 
+    def test_core_storage_in_slots(self):
+        import copy
+        import weakref
+
+        agent = Agent("test").instruct("Do stuff.")
+        assert not {"_config", "_callbacks", "_lists", "_frozen"} & vars(agent).keys()
+        assert weakref.ref(agent)() is agent
+        assert copy.deepcopy(agent)._config["instruction"] == "Do stuff."
+
+    def test_name_is_interned(self):
+        import sys
+
+        name = "".join(["dyn", "amic_agent"])
+        assert Agent(name)._config["name"] is sys.intern("dynamic_agent")
+        assert Pipeline(name)._config["name"] is sys.intern("dynamic_agent")
+
 
 class TestCloneFromBuilderBase:
     """clone() is defined on BuilderBase and works for all builder types."""
@@ -190,3 +206,62 @@ def test_getattr_handles_init_signature_mode():
 
     with pytest.raises(AttributeError, match="not a recognized"):
         _ = t.not_a_param
+
+
+def test_getattr_installs_forwarder_on_class():
+    """A validated forwarded field becomes a real method, skipping __getattr__ next time."""
+    from adk_fluent import Agent
+
+    a = Agent("a").instruction("first")
+    assert a._config["instruction"] == "first"
+    assert "instruction" in Agent.__dict__
+    b = Agent("b").instruction("second")
+    assert b._config["instruction"] == "second"
+    assert a._config["instruction"] == "first"
+
+
+def test_installed_forwarder_keeps_additive_fields():
+    """Forwarded callback fields still accumulate rather than overwrite."""
+    from adk_fluent import Agent
+
+    def f1(ctx):
+        return None
+
+    def f2(ctx):
+        return None
+
+    a = Agent("a").before_agent_callback(f1).before_agent_callback(f2)
+    assert a._callbacks["before_agent_callback"] == [f1, f2]
+
+
+def test_installed_forwarder_respects_subclass_tables():
+    """An inherited forwarder resolves against the subclass's own alias tables."""
+    from adk_fluent import Agent
+
+    class AliasedAgent(Agent):
+        _ALIASES = {**Agent._ALIASES, "instruction": "global_instruction"}
+
+    Agent("a").instruction("base")
+    sub = AliasedAgent("s").instruction("sub")
+    assert sub._config["global_instruction"] == "sub"
+    assert "instruction" not in sub._config
+
+
+def test_accept_any_builder_does_not_install_forwarder():
+    """Builders without a field table accept any name but never grow class attributes."""
+
+    class LooseBuilder(BuilderBase):
+        _ALIASES: dict[str, str] = {}
+        _CALLBACK_ALIASES: dict[str, str] = {}
+        _ADDITIVE_FIELDS: set[str] = set()
+        _ADK_TARGET_CLASS = None
+        _KNOWN_PARAMS = None
+
+        def __init__(self):
+            self._config = {}
+            self._callbacks = {}
+            self._lists = {}
+
+    b = LooseBuilder().typo(1)
+    assert b._config["typo"] == 1
+    assert "typo" not in LooseBuilder.__dict__
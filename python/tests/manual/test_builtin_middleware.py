@@ -41,6 +41,12 @@ def test_retry_middleware_on_tool_error_returns_none():
     assert asyncio.run(run()) is None
 
 
+def test_retry_middleware_reuses_precomputed_retry_states():
+    mw = RetryMiddleware(max_attempts=4, backoff_base=0.5, max_backoff=10.0, jitter=0.0)
+    assert [s.attempt_number for s in mw._retry_states] == [1, 2, 3]
+    assert [mw._compute_delay(n) for n in (1, 2, 3, 5)] == [0.5, 1.0, 2.0, 8.0]
+
+
 def test_structured_log_is_middleware():
     from adk_fluent.middleware import Middleware
 
@@ -75,6 +81,38 @@ def test_structured_log_never_short_circuits():
     assert all(r is None for r in asyncio.run(run()))
 
 
+def test_structured_log_truncates_requests_like_str():
+    from google.adk.models.llm_request import LlmRequest
+    from google.genai import types
+
+    request = LlmRequest(
+        model="gemini-2.5-flash",
+        contents=[types.Content(role="user", parts=[types.Part(text="hello " * 100)]) for _ in range(20)],
+    )
+    mw = StructuredLogMiddleware()
+    asyncio.run(mw.before_model(ctx=None, request=request))
+    assert mw.log[0]["request"] == str(request)[:200]
+
+
+def test_str_prefix_matches_str_for_nested_models():
+    from pydantic import BaseModel
+
+    from adk_fluent.middleware import _str_prefix
+
+    class Inner(BaseModel):
+        a: int = 1
+        b: list = [1, (2,), {"x": (3, 4)}]
+
+    class Outer(BaseModel):
+        name: str = "outer"
+        inner: Inner = Inner()
+        items: tuple = (Inner(), Inner())
+
+    for limit in (0, 7, 30, 80, 1000):
+        assert _str_prefix(Outer(), limit) == str(Outer())[:limit]
+    assert _str_prefix("plain text", 5) == "plain"
+
+
 def test_middleware_importable_from_top_level():
     from adk_fluent import Middleware, RetryMiddleware, StructuredLogMiddleware
 
@@ -125,3 +125,57 @@ class TestPipelineWithCapture:
         assert isinstance(ir, SequenceNode)
         assert isinstance(ir.children[0], CaptureNode)
         assert ir.children[0].key == "user_input"
+
+
+class TestCaptureAgentRuntime:
+    """CaptureAgent reads the invocation's message, falling back to a session scan."""
+
+    @staticmethod
+    def _run(user_content, events):
+        import asyncio
+        from types import SimpleNamespace
+
+        ctx = SimpleNamespace(user_content=user_content, session=SimpleNamespace(events=events, state={}))
+        agent = CaptureAgent(name="cap", key="user_input")
+
+        async def drain():
+            async for _ in agent._run_async_impl(ctx):
+                pass
+
+        asyncio.run(drain())
+        return ctx.session.state.get("user_input")
+
+    @staticmethod
+    def _event(author, *parts):
+        from google.adk.events.event import Event
+        from google.genai import types
+
+        return Event(author=author, content=types.Content(role="user", parts=list(parts)))
+
+    def test_uses_invocation_message_without_scanning(self):
+        from google.genai import types
+
+        class Unscannable(list):
+            def __reversed__(self):
+                raise AssertionError("session events scanned")
+
+        content = types.Content(role="user", parts=[types.Part(text="hello"), types.Part(text="world")])
+        assert self._run(content, Unscannable()) == "hello\nworld"
+
+    def test_falls_back_to_latest_user_event(self):
+        from google.genai import types
+
+        events = [
+            self._event("user", types.Part(text="older")),
+            self._event("user", types.Part(text="latest")),
+            self._event("writer", types.Part(text="reply")),
+        ]
+        assert self._run(None, events) == "latest"
+
+    def test_inline_blobs_fall_back_to_stored_event(self):
+        from google.genai import types
+
+        blob = types.Part(inline_data=types.Blob(mime_type="image/png", data=b"x"))
+        content = types.Content(role="user", parts=[types.Part(text="see image"), blob])
+        stored = self._event("user", types.Part(text="see image"), types.Part(text="[Uploaded Artifact: img]"))
+        assert self._run(content, [stored]) == "see image\n[Uploaded Artifact: img]"
@@ -37,6 +37,28 @@ class TestDeepCloneBuilder:
         cloned._config["description"] = "cloned desc"
         assert original._config["description"] == "original desc"
 
+    def test_clone_shares_instruction_string(self):
+        """Large prompt strings are shared by reference, not duplicated per clone."""
+        prompt = "You are a helpful agent. " * 200
+        original = Agent("original").instruct(prompt)
+        cloned = deep_clone_builder(original, "cloned")
+        assert cloned._config["instruction"] is original._config["instruction"]
+
+    def test_clone_copies_nested_mutable_values(self):
+        """Non-atomic config values (e.g. .inject() resources) are still deep-copied."""
+        original = Agent("original").inject(db="primary")
+        cloned = deep_clone_builder(original, "cloned")
+        cloned.inject(db="replica")
+        assert original._config["_resources"] == {"db": "primary"}
+        assert cloned._config["_resources"] == {"db": "replica"}
+
+    def test_clone_containers_stay_defaultdicts(self):
+        """Cloned _callbacks/_lists still auto-create missing keys."""
+        cloned = deep_clone_builder(Agent("original"), "cloned")
+        cloned._callbacks["after_model_callback"].append(print)
+        cloned._lists["tools"].append("tool_a")
+        assert cloned._lists["tools"] == ["tool_a"]
+
     def test_clone_copies_callbacks(self):
         """Modifying clone callbacks does not affect original."""
         fn1 = lambda ctx: None
@@ -66,3 +88,38 @@ class TestDeepCloneBuilder:
         original = Agent("original")
         cloned = deep_clone_builder(original, "cloned")
         assert type(cloned) is Agent
+
+
+class TestShallowCopy:
+    def test_copy_has_independent_containers(self):
+        """copy.copy() forks the containers and shares the values."""
+        import copy
+
+        sub = Agent("sub")
+        original = Agent("original").instruct("Hi").sub_agent(sub)
+        copied = copy.copy(original)
+        copied.instruct("Bye").before_model(lambda ctx: None)
+
+        assert original._config["instruction"] == "Hi"
+        assert original._callbacks["before_model_callback"] == []
+        assert copied._lists["sub_agents"][0] is sub
+
+    def test_copy_keeps_primitive_attributes(self):
+        """copy.copy() on a primitive builder carries its custom attributes."""
+        import copy
+
+        from adk_fluent import gate
+
+        def pred(state):
+            return True
+
+        original = gate(pred)
+        copied = copy.copy(original)
+        assert copied._predicate is pred
+        assert copied.build().name == original.build().name
+
+    def test_operator_fork_accepts_new_callbacks(self):
+        """A pipeline extended by >> keeps defaultdict containers."""
+        pipeline = (Agent("a") >> Agent("b")) >> Agent("c")
+        pipeline.after_agent(lambda ctx: None)
+        assert len(pipeline._callbacks["after_agent_callback"]) == 1
@@ -8,6 +8,7 @@ from adk_fluent.compile import CompilationResult, EngineCapabilities, compile
 from adk_fluent.compile.passes import (
     annotate_checkpoints,
     fuse_transforms,
+    parallelize_independent,
     run_passes,
     validate_contracts,
 )
@@ -153,6 +154,58 @@ class TestFuseTransforms:
         assert result.children[0] is t1  # Unchanged
 
 
+class TestParallelizeIndependent:
+    @staticmethod
+    def _isolated(name, **kw):
+        from adk_fluent._context import C
+
+        return AgentNode(name=name, context_spec=C.none(), **kw)
+
+    def test_groups_independent_steps(self):
+        from adk_fluent._ir_generated import ParallelNode
+
+        a = AgentNode(name="a", instruction="Summarize.", output_key="summary")
+        b = self._isolated("b", instruction="Translate.", output_key="tr")
+        c = AgentNode(name="c", instruction="Use {summary} and {tr}.")
+        result = parallelize_independent(SequenceNode(name="p", children=(a, b, c)))
+
+        group, last = result.children
+        assert isinstance(group, ParallelNode)
+        assert group.children == (a, b)
+        assert group.writes_keys == frozenset()
+        assert last is c
+
+    def test_state_dependency_stays_sequential(self):
+        a = AgentNode(name="a", output_key="summary")
+        b = self._isolated("b", instruction="Critique {summary}.")
+        seq = SequenceNode(name="p", children=(a, b))
+        assert parallelize_independent(seq) is seq
+
+    def test_history_reader_stays_sequential(self):
+        seq = SequenceNode(name="p", children=(AgentNode(name="a"), AgentNode(name="b")))
+        assert parallelize_independent(seq) is seq
+
+    def test_non_agent_nodes_break_groups(self):
+        t = TransformNode(name="t", fn=lambda s: s)
+        seq = SequenceNode(name="p", children=(AgentNode(name="a"), t, self._isolated("b")))
+        assert parallelize_independent(seq) is seq
+
+    def test_steps_with_tools_stay_sequential(self):
+        seq = SequenceNode(name="p", children=(AgentNode(name="a"), self._isolated("b", tools=(print,))))
+        assert parallelize_independent(seq) is seq
+
+    def test_branched_sequences_untouched(self):
+        from adk_fluent._ir_generated import ParallelNode
+
+        inner = SequenceNode(name="inner", children=(AgentNode(name="a"), self._isolated("b")))
+        fan = ParallelNode(name="fan", children=(inner, AgentNode(name="c")))
+        assert parallelize_independent(fan) is fan
+
+    def test_not_run_by_default(self):
+        seq = SequenceNode(name="p", children=(AgentNode(name="a"), self._isolated("b")))
+        assert len(run_passes(seq).children) == 2
+
+
 class TestAnnotateCheckpoints:
     def test_returns_unchanged(self):
         """Placeholder pass returns IR unchanged."""
@@ -181,6 +181,26 @@ class TestWindow:
         assert isinstance(t, CWindow)
         assert t.n == 5
 
+    def test_session_index_tracks_appends_and_rewinds(self):
+        from types import SimpleNamespace
+
+        from adk_fluent._session_index import get_session_index
+
+        class Session:
+            events: list
+
+        session = Session()
+        session.events = [SimpleNamespace(author="user"), SimpleNamespace(author="bot")]
+        snapshot = get_session_index(session).events
+        session.events.append(SimpleNamespace(author="user"))
+        idx = get_session_index(session)
+        assert len(snapshot) == 2  # earlier snapshots don't grow
+        assert idx.window_tail(1) == session.events[2:]
+        assert idx.window_tail(5) == session.events
+
+        session.events = session.events[:1]
+        assert get_session_index(session).events == session.events
+
 
 # ======================================================================
 # C.user_only()
@@ -374,3 +394,17 @@ class TestCompileContextSpec:
         result = _compile_context_spec("Review.", C.window(n=3))
         assert result["include_contents"] == "none"
         assert callable(result["instruction"])
+
+    def test_dynamic_instruction_template_compiled_once(self):
+        import asyncio
+        from types import SimpleNamespace
+
+        from adk_fluent._context_providers import _compile_template
+
+        result = _compile_context_spec(lambda ctx: "Analyze {topic} for {user}.", C.from_state("topic"))
+        ctx = SimpleNamespace(state={"topic": "AI", "user": "ann"})
+        _compile_template.cache_clear()
+        for _ in range(3):
+            text = asyncio.run(result["instruction"](ctx))
+        assert text.startswith("Analyze AI for ann.")
+        assert _compile_template.cache_info().misses == 1
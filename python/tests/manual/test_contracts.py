@@ -41,6 +41,33 @@ def test_produces_and_consumes_together():
     assert ir.writes_keys == frozenset({"ticket_id", "status"})
 
 
+def test_schema_field_names_cached_per_class():
+    from adk_fluent import Agent
+
+    first = Agent("a").produces(Intent).to_ir().writes_keys
+    second = Agent("b").consumes(Intent).to_ir().reads_keys
+    assert first is second
+
+
+def test_schema_field_names_handles_non_models():
+    from adk_fluent._helpers import _schema_field_names
+
+    assert _schema_field_names(None) == frozenset()
+    assert _schema_field_names({"a": 1}) == frozenset()
+
+
+def test_template_refs_parsed_once_per_instruction():
+    from adk_fluent import Agent
+    from adk_fluent.testing.contracts import _template_refs, check_contracts
+
+    assert _template_refs("Use {topic} and {notes?}.") == (("topic", False), ("notes", True))
+    pipeline = Agent("a").writes("topic") >> Agent("b").instruct("Summarize {topic} with {extra?}.")
+    check_contracts(pipeline.to_ir())
+    before = _template_refs.cache_info().misses
+    check_contracts(pipeline.to_ir())
+    assert _template_refs.cache_info().misses == before
+
+
 def test_produces_returns_self():
     from adk_fluent import Agent
 
@@ -77,6 +77,27 @@ def test_dead_key_with_writes_keys():
     assert "confidence" in dead_keys
 
 
+def test_dead_key_ignores_upstream_consumers():
+    """Only consumers after the producer count, however far downstream."""
+    from adk_fluent import Agent
+
+    pipeline = (
+        Agent("a").instruct("Start from {draft?}.")
+        >> Agent("b").instruct("Draft.").writes("draft")
+        >> Agent("c").instruct("Redraft.").writes("draft")
+        >> Agent("d").instruct("Polish {draft}.")
+        >> Agent("e").instruct("Done.")
+    )
+    issues = check_contracts(pipeline.to_ir())
+    dead = [i["agent"] for i in issues if isinstance(i, dict) and "not consumed" in i.get("message", "")]
+    assert dead == []
+
+    pipeline = Agent("a").instruct("Use {draft?}.") >> Agent("b").writes("draft") >> Agent("c").instruct("Done.")
+    issues = check_contracts(pipeline.to_ir())
+    dead = [i["agent"] for i in issues if isinstance(i, dict) and "not consumed" in i.get("message", "")]
+    assert dead == ["b"]
+
+
 # ======================================================================
 # Pass 9: Type compatibility
 # ======================================================================
@@ -97,6 +118,20 @@ def test_type_mismatch_detected():
     assert "confidence" in type_issues[0]["message"]
 
 
+def test_type_check_uses_nearest_upstream_producer():
+    """Only the closest producer is compared; intervening plain agents are skipped."""
+    from adk_fluent import Agent
+
+    pipeline = (
+        Agent("a").produces(PartialIntent)
+        >> Agent("b").produces(Intent)
+        >> Agent("mid").instruct("Think.")
+        >> Agent("c").consumes(Intent)
+    )
+    issues = check_contracts(pipeline.to_ir())
+    assert not [i for i in issues if isinstance(i, dict) and "missing fields" in i.get("message", "")]
+
+
 def test_type_match_clean():
     """Matching produces_type and consumes_type triggers no type error."""
     from adk_fluent import Agent
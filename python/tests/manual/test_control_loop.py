@@ -65,6 +65,18 @@ class TestDelegateMethod:
         coordinator = Agent("router").model("gemini-2.5-flash").agent_tool(a).agent_tool(b)
         assert len(coordinator._lists.get("tools", [])) == 2
 
+    def test_specialist_built_once_at_agent_tool_time(self):
+        """The specialist is built when wrapped; coordinator builds reuse that AgentTool."""
+        from google.adk.tools.agent_tool import AgentTool
+
+        specialist = Agent("spec").model("gemini-2.5-flash")
+        coordinator = Agent("coord").model("gemini-2.5-flash").agent_tool(specialist)
+        tool = coordinator._lists["tools"][0]
+        assert isinstance(tool, AgentTool)
+
+        first, second = coordinator.build(), coordinator.build()
+        assert first.tools[0] is second.tools[0] is tool
+
 
 class TestDictRouting:
     """Tests for dict >> conditional routing syntax (deterministic Route)."""
@@ -112,3 +112,16 @@ class TestAgentDecorator:
         assert len(solver._lists["tools"]) == 2
         assert add in solver._lists["tools"]
         assert multiply in solver._lists["tools"]
+
+    def test_name_and_instruction_are_interned(self):
+        import sys
+
+        def solver():
+            pass
+
+        # Padded explicitly: a formatter would strip it from a literal docstring.
+        solver.__doc__ = "  Solve things.  "
+        solver = agent("".join(["sol", "ver"]))(solver)
+
+        assert solver._config["name"] is sys.intern("solver")
+        assert solver._config["instruction"] is sys.intern("Solve things.")
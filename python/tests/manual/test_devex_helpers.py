@@ -87,6 +87,29 @@ class TestStateKey:
         key.append(state, "b")
         assert state["items"] == ["a", "b"]
 
+    def test_increment_resolves_state_once(self):
+        """increment() reads and writes through a single state() call."""
+        key = StateKey("count", scope="temp", type=int, default=0)
+        state = {}
+        calls = []
+
+        class ReadonlyCtx:
+            def state(self):
+                calls.append(1)
+                return state
+
+        assert key.increment(ReadonlyCtx()) == 1
+        assert state == {"temp:count": 1}
+        assert len(calls) == 1
+
+    def test_key_is_interned_and_slotted(self):
+        """The scoped key is built once, interned, and instances carry no __dict__."""
+        import sys
+
+        key = StateKey("count", scope="temp")
+        assert key.key is sys.intern("temp:count")
+        assert not hasattr(key, "__dict__")
+
     def test_repr(self):
         """repr is readable."""
         key = StateKey("count", scope="temp", type=int, default=0)
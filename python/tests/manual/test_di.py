@@ -41,6 +41,20 @@ def test_inject_resources_async_fn():
     assert result == "Hello World, db=fake_db"
 
 
+def test_inject_resources_caller_value_wins_and_reads_live():
+    """Explicit kwargs are not overwritten; resources are read at call time."""
+    from adk_fluent.di import inject_resources
+
+    def lookup(query: str, db: object) -> str:
+        return f"{query}:{db}"
+
+    resources = {"db": "prod"}
+    wrapped = inject_resources(lookup, resources)
+    assert asyncio.run(wrapped(query="q", db="override")) == "q:override"
+    resources["db"] = "replica"
+    assert asyncio.run(wrapped(query="q")) == "q:replica"
+
+
 def test_inject_preserves_tool_context():
     """tool_context param is never injected even if in resources."""
     from adk_fluent.di import inject_resources
@@ -65,6 +79,39 @@ def test_inject_no_overlap_passthrough():
     assert wrapped is greet
 
 
+def test_inject_resources_reuses_signature(monkeypatch):
+    """Wrapping the same function twice introspects its signature once."""
+    from adk_fluent import di
+
+    def lookup(query: str, db: object) -> str:
+        return query
+
+    calls = []
+    real_signature = inspect.signature
+    monkeypatch.setattr(di.inspect, "signature", lambda fn: calls.append(fn) or real_signature(fn))
+    di._cached_signature.cache_clear()
+
+    first = di.inject_resources(lookup, {"db": "a"})
+    second = di.inject_resources(lookup, {"db": "b"})
+    assert calls == [lookup]
+    assert list(inspect.signature(first).parameters) == list(inspect.signature(second).parameters) == ["query"]
+
+
+def test_inject_resources_unhashable_callable():
+    """Unhashable callable objects fall back to direct introspection."""
+    from adk_fluent.di import inject_resources
+
+    class Tool:
+        __hash__ = None
+
+        def __call__(self, query: str, db: object) -> str:
+            return f"{query}:{db}"
+
+    wrapped = inject_resources(Tool(), {"db": "fake"})
+    assert "db" not in inspect.signature(wrapped).parameters
+    assert asyncio.run(wrapped(query="q")) == "q:fake"
+
+
 def test_builder_inject_method():
     """Agent.inject(key=value) stores resources for DI."""
     from adk_fluent import Agent
@@ -1,5 +1,7 @@
 """Tests for P0/P1 DX improvements: validate, mock, doctor, operators."""
 
+import itertools
+
 import pytest
 
 from adk_fluent import Agent, Pipeline
@@ -121,6 +123,24 @@ class TestMockByName:
         agent.mock(["response"])
         assert len(agent._callbacks["before_model_callback"]) == 1
 
+    def test_mock_list_cycles_with_fresh_responses(self):
+        """List mocks wrap around and hand out a new LlmResponse per call."""
+        agent = Agent("test", "gemini-2.5-flash").mock(["a", 2])
+        cb = agent._callbacks["before_model_callback"][0]
+        responses = [cb(None, None) for _ in range(3)]
+        assert [r.content.parts[0].text for r in responses] == ["a", "2", "a"]
+        assert responses[0] is not responses[2]
+
+    def test_mock_endless_generator_is_consumed_lazily(self):
+        """Generators are drawn from per call, so an endless one is fine."""
+        agent = Agent("test", "gemini-2.5-flash").mock(f"turn {i}" for i in itertools.count())
+        cb = agent._callbacks["before_model_callback"][0]
+        assert [cb(None, None).content.parts[0].text for _ in range(3)] == ["turn 0", "turn 1", "turn 2"]
+
+    def test_mock_empty_list_raises(self):
+        with pytest.raises(ValueError, match="at least one response"):
+            Agent("test", "gemini-2.5-flash").mock([])
+
     def test_mock_callable_still_works(self):
         """Original callable mock still works."""
         agent = Agent("test", "gemini-2.5-flash")
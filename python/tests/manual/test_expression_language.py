@@ -320,6 +320,33 @@ class TestProceedIf:
         agent = Agent("a").model("gemini-2.5-flash").proceed_if(lambda s: s.get("x")).proceed_if(lambda s: s.get("y"))
         assert len(agent._callbacks["before_agent_callback"]) == 2
 
+    def test_proceed_if_keeps_registration_order(self):
+        """Gates run in registration order alongside user before_agent callbacks."""
+        first = lambda s: s.get("x")  # noqa: E731
+        second = lambda s: s.get("y")  # noqa: E731
+
+        def user_cb(callback_context):
+            return None
+
+        agent = Agent("a").model("gemini-2.5-flash").before_agent(user_cb).proceed_if(first).proceed_if(second)
+        cbs = agent._callbacks["before_agent_callback"]
+        assert cbs[0] is user_cb
+
+        class FakeContext:
+            state = {"x": 1}
+
+        assert cbs[1](callback_context=FakeContext()) is None
+        assert cbs[2](callback_context=FakeContext()) is not None
+
+    def test_proceed_if_sees_state_from_earlier_callbacks(self):
+        """A gate registered after a before_agent callback sees that callback's writes."""
+
+        def set_ok(callback_context):
+            callback_context.state["ok"] = True
+
+        agent = Agent("a").before_agent(set_ok).proceed_if(lambda s: s.get("ok")).mock(["RAN"])
+        assert agent.ask("x") == "RAN"
+
     def test_proceed_if_in_pipeline(self):
         """proceed_if works with >> pipeline composition."""
         validator = Agent("validate").model("gemini-2.5-flash").writes("valid")
@@ -465,6 +492,31 @@ class TestCheckpointAgent:
         agent = _make_checkpoint_agent("my_check", lambda s: True)
         assert agent.name == "my_check"
 
+    def test_checkpoint_agents_share_one_class(self):
+        """Checkpoints reuse one agent class instead of defining one per build."""
+        a = _make_checkpoint_agent("_until_check", lambda s: True)
+        b = _make_checkpoint_agent("_until_check", lambda s: False)
+        assert type(a) is type(b)
+
+    def test_checkpoint_agent_escalates_only_when_predicate_holds(self):
+        """Escalates on a true predicate; stays silent on false or failing ones."""
+        import asyncio
+        import types
+
+        def events(pred, state):
+            agent = _make_checkpoint_agent("check", pred)
+            ctx = types.SimpleNamespace(session=types.SimpleNamespace(state=state), invocation_id="i", branch=None)
+
+            async def _collect():
+                return [e async for e in agent._run_async_impl(ctx)]
+
+            return asyncio.run(_collect())
+
+        (event,) = events(lambda s: s["done"], {"done": True})
+        assert event.actions.escalate
+        assert events(lambda s: s["done"], {"done": False}) == []
+        assert events(lambda s: s["done"], {}) == []
+
 
 # ======================================================================
 # _make_route_agent -- Internal
@@ -492,6 +544,78 @@ class TestRouteAgent:
         agent = _make_route_agent("route_key", [(lambda s: True, a)], b, [a, b])
         assert len(agent.sub_agents) == 2
 
+    def test_route_agents_share_one_class(self):
+        """Routes reuse one agent class instead of defining one per build."""
+        a = _make_route_agent("route_a", Route("k").eq("x", None)._rules, None, [])
+        b = _make_route_agent("route_b", [(lambda s: True, None)], None, [])
+        assert type(a) is type(b)
+
+    def test_eq_rules_compile_to_table(self):
+        """All-eq routes on one key compile to a value -> agent dict."""
+        from adk_fluent._routing import _compile_eq_table
+
+        route = Route("intent").eq("a", "A").eq("b", "B").eq("a", "A2")
+        key, table, rest = _compile_eq_table(route._rules)
+        assert key == "intent"
+        assert rest == ()
+        assert table == {"a": "A", "b": "B"}  # first rule wins, like the linear scan
+        with pytest.raises(TypeError):
+            table["c"] = "C"  # shared across invocations, so read-only
+
+    def test_mixed_rules_compile_leading_eq_prefix(self):
+        """Only the leading run of hashable eq rules is tabled; the rest stay predicates."""
+        from adk_fluent._routing import _compile_eq_table
+
+        route = Route("k").eq("a", "A").eq("b", "B").gt(1, "C").eq("d", "D")
+        _key, table, rest = _compile_eq_table(route._rules)
+        assert table == {"a": "A", "b": "B"}
+        assert [agent for _, agent in rest] == ["C", "D"]
+
+        _key, table, rest = _compile_eq_table(Route("k").eq("a", "A").eq(["b"], "B")._rules)
+        assert table == {"a": "A"} and len(rest) == 1
+
+        assert _compile_eq_table(Route("k").gt(1, "A").eq("a", "B")._rules) is None
+        assert _compile_eq_table(Route("k").eq(["a"], "A")._rules) is None
+        assert _compile_eq_table([]) is None
+
+    def test_table_route_dispatches_like_predicates(self):
+        """A compiled route picks the same branch as evaluating eq predicates."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from google.adk.agents.base_agent import BaseAgent
+
+        ran = []
+
+        class _Recorder(BaseAgent):
+            async def run_async(self, ctx):
+                ran.append(self.name)
+                return
+                yield
+
+        a, b, d = _Recorder(name="a"), _Recorder(name="b"), _Recorder(name="d")
+        route = Route("intent").eq("x", a).eq("y", b)
+        agent = _make_route_agent("route_intent", route._rules, d, [a, b, d])
+
+        async def run(state):
+            ctx = MagicMock()
+            ctx.session.state = state
+            async for _ in agent._run_async_impl(ctx):
+                pass
+
+        for state in ({"intent": "y"}, {"intent": "x"}, {"intent": "z"}, {}, {"intent": ["x"]}):
+            asyncio.run(run(state))
+        assert ran == ["b", "a", "d", "d", "d"]
+
+        # Table misses fall through to the remaining predicates, in order
+        ran.clear()
+        a, b, c, d = (_Recorder(name=n) for n in "abcd")
+        route = Route("intent").eq("x", a).contains("ur", c).eq("y", b)
+        agent = _make_route_agent("route_intent", route._rules, d, [a, b, c, d])
+        for state in ({"intent": "x"}, {"intent": "urgent"}, {"intent": "y"}, {"intent": "z"}):
+            asyncio.run(run(state))
+        assert ran == ["a", "c", "b", "d"]
+
 
 # ======================================================================
 # Full Expression Language Composition
@@ -15,6 +15,50 @@ class TestIRFirstBuildPath:
         assert built is not None
         assert built.name == "a"
 
+    def test_leaf_agent_build_skips_ir_lowering(self, monkeypatch):
+        """Builders without sub-agents cannot yield contract issues, so to_ir() is not called."""
+        a = Agent("a").model("gemini-2.5-flash").instruct("Hi")
+
+        def fail():
+            raise AssertionError("to_ir() called for a leaf build")
+
+        monkeypatch.setattr(a, "to_ir", fail)
+        assert a.build().name == "a"
+
+    def test_nested_builds_reuse_parent_lowering(self, monkeypatch):
+        """A nested compound builder is lowered once per build, by its parent."""
+        inner = Agent("critic").model("m").instruct("Score.") >> Agent("reviser").model("m").instruct("Revise.")
+        loop = inner * 3
+        pipeline = Agent("writer").model("m").instruct("Write.") >> loop
+        calls = []
+        original = type(loop).to_ir
+
+        def counting(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(type(loop), "to_ir", counting)
+        pipeline.build()
+        assert len(calls) == 1
+        pipeline.build()  # the memo does not outlive a build
+        assert len(calls) == 2
+
+    def test_validate_reuses_build_lowering(self, monkeypatch):
+        """validate() lowers each sub-builder once across its build and contract phases."""
+        inner = Agent("critic").model("m").instruct("Score.") >> Agent("reviser").model("m").instruct("Revise.")
+        loop = inner * 3
+        pipeline = Agent("writer").model("m").instruct("Write.") >> loop
+        calls = []
+        original = type(loop).to_ir
+
+        def counting(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(type(loop), "to_ir", counting)
+        pipeline.validate()
+        assert calls == [loop]
+
     def test_pipeline_builds_via_ir(self):
         """Pipeline.build() runs contracts by default (advisory mode)."""
         pipeline = Agent("a").model("m").instruct("Classify.").writes("intent") >> Agent("b").model("m").instruct(
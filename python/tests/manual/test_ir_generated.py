@@ -35,6 +35,17 @@ def test_agent_node_is_frozen():
         node.name = "changed"
 
 
+def test_all_ir_nodes_are_frozen_and_slotted():
+    import typing
+
+    from adk_fluent._ir_generated import AgentNode, FullNode
+
+    for cls in typing.get_args(FullNode):
+        assert cls.__dataclass_params__.frozen, cls.__name__
+        assert "__slots__" in cls.__dict__, cls.__name__
+    assert not hasattr(AgentNode(name="test"), "__dict__")
+
+
 def test_agent_node_has_model_field():
     from adk_fluent._ir_generated import AgentNode
 
@@ -13,3 +13,17 @@ class TestMap:
         a = Agent("test")
         assert hasattr(a, "map_async")
         assert callable(a.map_async)
+
+    def test_map_builds_agent_once_per_batch(self, monkeypatch):
+        """All prompts share one built agent and runner (mocked LLM, no network)."""
+        a = Agent("test").model("gemini-2.5-flash").mock(lambda req: "ok")
+        builds = []
+        original = a.build
+
+        def counting_build():
+            builds.append(1)
+            return original()
+
+        monkeypatch.setattr(a, "build", counting_build)
+        assert a.map(["one", "two", "three"], concurrency=2) == ["ok", "ok", "ok"]
+        assert len(builds) == 1
@@ -45,6 +45,135 @@ class TestModelCache:
         mw = mc.to_stack()[0]
         assert mw._ttl == 300
 
+    def test_key_computed_once_per_call(self):
+        import asyncio
+
+        calls = []
+
+        def key_fn(req):
+            calls.append(req)
+            return req["prompt"]
+
+        mw = M.cache(key_fn=key_fn).to_stack()[0]
+        req = {"prompt": "draft"}
+
+        async def run():
+            assert await mw.before_model(None, req) is None
+            await mw.after_model(None, req, "response")
+            return await mw.before_model(None, {"prompt": "draft"})
+
+        assert asyncio.run(run()) == "response"
+        assert len(calls) == 2  # one miss + one hit, no re-keying in after_model
+
+    def test_path_persists_across_instances(self, tmp_path):
+        import asyncio
+
+        from google.adk.models.llm_request import LlmRequest
+        from google.adk.models.llm_response import LlmResponse
+        from google.genai import types
+
+        path = str(tmp_path / "cache" / "responses.db")
+        content = types.Content(role="model", parts=[types.Part(text="cached answer")])
+
+        def request():
+            prompt = types.Content(role="user", parts=[types.Part(text="hi")])
+            return LlmRequest(model="gemini-2.5-flash", contents=[prompt])
+
+        async def run():
+            first = M.cache(path=path).to_stack()[0]
+            assert await first.before_model(None, request()) is None
+            await first.after_model(None, request(), LlmResponse(content=content))
+            await first.after_model(None, request(), LlmResponse(error_code="500"))  # never persisted
+
+            second = M.cache(path=path).to_stack()[0]  # empty in-memory cache
+            return await second.before_model(None, request())
+
+        hit = asyncio.run(run())
+        assert isinstance(hit, LlmResponse)
+        assert hit.content.parts[0].text == "cached answer"
+
+    def test_path_keys_requests_with_output_schema(self, tmp_path):
+        import asyncio
+
+        from google.adk.models.llm_request import LlmRequest
+        from google.adk.models.llm_response import LlmResponse
+        from google.genai import types
+        from pydantic import BaseModel
+
+        class Report(BaseModel):
+            title: str
+
+        class Summary(BaseModel):
+            text: str
+
+        path = str(tmp_path / "responses.db")
+        content = types.Content(role="model", parts=[types.Part(text='{"title": "t"}')])
+
+        def request(schema):
+            prompt = types.Content(role="user", parts=[types.Part(text="hi")])
+            req = LlmRequest(model="gemini-2.5-flash", contents=[prompt])
+            req.set_output_schema(schema)
+            return req
+
+        async def run():
+            first = M.cache(path=path).to_stack()[0]
+            assert await first.before_model(None, request(Report)) is None
+            await first.after_model(None, request(Report), LlmResponse(content=content))
+
+            second = M.cache(path=path).to_stack()[0]
+            return await second.before_model(None, request(Report)), await second.before_model(None, request(Summary))
+
+        hit, other_schema = asyncio.run(run())
+        assert hit.content.parts[0].text == '{"title": "t"}'
+        assert other_schema is None
+
+    def test_path_respects_ttl(self, tmp_path):
+        import asyncio
+
+        from google.adk.models.llm_response import LlmResponse
+
+        path = str(tmp_path / "responses.db")
+
+        async def run():
+            await M.cache(ttl=-1, path=path).to_stack()[0].after_model(None, "req", LlmResponse())
+            return await M.cache(path=path).to_stack()[0].before_model(None, "req")
+
+        assert asyncio.run(run()) is None
+
+    def test_path_errors_are_misses(self, tmp_path, caplog):
+        import asyncio
+
+        from google.adk.models.llm_response import LlmResponse
+
+        path = tmp_path / "responses.db"
+        path.write_bytes(b"not a sqlite database" * 100)
+        cache = M.cache(path=str(path)).to_stack()[0]
+
+        async def run():
+            miss = await cache.before_model(None, "req")
+            await cache.after_model(None, "req", LlmResponse())
+            return miss
+
+        assert asyncio.run(run()) is None
+        assert "treating as a miss" in caplog.text
+        assert "not persisted" in caplog.text
+
+    def test_path_recreates_a_deleted_file(self, tmp_path):
+        import asyncio
+
+        from google.adk.models.llm_response import LlmResponse
+
+        path = tmp_path / "responses.db"
+        cache = M.cache(path=str(path)).to_stack()[0]
+
+        async def run():
+            await cache.after_model(None, "req", LlmResponse())
+            path.unlink()
+            await cache.after_model(None, "req", LlmResponse())
+            return await M.cache(path=str(path)).to_stack()[0].before_model(None, "req")
+
+        assert isinstance(asyncio.run(run()), LlmResponse)
+
 
 class TestFallbackModel:
     def test_creates_composite(self):
@@ -42,6 +42,25 @@ class TestRshift:
         built = p2.build()
         assert len(built.sub_agents) == 3
 
+    def test_bare_right_pipeline_is_spliced(self):
+        a, b, c = (Agent(n).model("gemini-2.5-flash") for n in "abc")
+        p = a >> (b >> c)
+        assert p._lists["sub_agents"] == [a, b, c]
+        assert p._config["name"] == "a_then_b_then_c"
+
+    def test_named_right_pipeline_stays_nested(self):
+        a, b, c = Agent("a"), Agent("b"), Agent("c")
+        inner = Pipeline("review").step(b).step(c)
+        p = a >> inner
+        assert p._lists["sub_agents"] == [a, inner]
+        assert [sub.name for sub in p.build().sub_agents] == ["a", "review"]
+
+    def test_configured_right_pipeline_stays_nested(self):
+        a, b = Agent("a"), Agent("b")
+        inner = Pipeline("review").step(b).describe("Review stage")
+        p = a >> inner
+        assert p._lists["sub_agents"] == [a, inner]
+
 
 class TestOr:
     def test_two_agents_creates_fanout(self):
@@ -71,6 +90,18 @@ class TestOr:
         built = f.build()
         assert len(built.sub_agents) == 3
 
+    def test_bare_right_fanout_is_spliced(self):
+        a, b, c = (Agent(n).model("gemini-2.5-flash") for n in "abc")
+        f = FanOut("f").branch(a) | (b | c)
+        assert f._lists["sub_agents"] == [a, b, c]
+        assert [sub.name for sub in f.build().sub_agents] == ["a", "b", "c"]
+
+    def test_named_right_fanout_stays_nested(self):
+        a, b, c = Agent("a"), Agent("b"), Agent("c")
+        inner = FanOut("research").branch(b).branch(c)
+        f = a | inner
+        assert f._lists["sub_agents"] == [a, inner]
+
 
 class TestMul:
     def test_agent_mul_int_creates_loop(self):
@@ -128,6 +128,25 @@ def test_chain_mixed():
     assert result is not None
 
 
+def test_chain_matches_rshift():
+    """chain produces the same pipeline as folding with >>."""
+    steps = [Agent(f"s{i}", "gemini-2.0-flash") for i in range(6)]
+    via_chain = chain(*steps)
+    via_rshift = steps[0] >> steps[1] >> steps[2] >> steps[3] >> steps[4] >> steps[5]
+    assert via_chain._config["name"] == via_rshift._config["name"]
+    assert via_chain._lists["sub_agents"] == via_rshift._lists["sub_agents"]
+
+
+def test_chain_does_not_mutate_input_pipeline():
+    """chain extends its own intermediates, never a pipeline passed in."""
+    a = Agent("a", "gemini-2.0-flash")
+    b = Agent("b", "gemini-2.0-flash")
+    head = a >> b
+    result = chain(head, Agent("c", "gemini-2.0-flash"), Agent("d", "gemini-2.0-flash"))
+    assert len(head._lists["sub_agents"]) == 2
+    assert len(result._lists["sub_agents"]) == 4
+
+
 def test_chain_requires_two():
     """chain raises ValueError with fewer than 2 steps."""
     with pytest.raises(ValueError, match="at least 2"):
@@ -1,5 +1,7 @@
 """Tests for Preset class and .use() method."""
 
+import pytest
+
 from adk_fluent.agent import Agent
 from adk_fluent.presets import Preset
 
@@ -61,3 +63,34 @@ class TestUse:
         # model should be in _fields, not _callbacks
         assert "model" in p._fields
         assert "model" not in p._callbacks
+
+    def test_resolution_cached_per_builder_class(self):
+        """Applying one preset to many agents resolves its ops once per class."""
+        p = Preset(model="gemini-2.5-flash", before_model_callback=_log_before)
+        a = Agent("a").use(p)
+        b = Agent("b").use(p)
+        assert list(p._resolved) == [Agent]
+        assert b._config["model"] == a._config["model"] == "gemini-2.5-flash"
+        assert b._callbacks["before_model_callback"] == [_log_before]
+
+    def test_resolved_values_shared_read_only(self):
+        """The resolved value mapping is shared across uses and cannot be mutated."""
+        p = Preset(model="gemini-2.5-flash", instruction="Be brief.")
+        Agent("a").use(p)
+        values, _callbacks = p._resolve_for(Agent)
+        assert p._resolve_for(Agent)[0] is values
+        with pytest.raises(TypeError):
+            values["model"] = "other"  # type: ignore[index]
+
+    def test_callbacks_extend_existing_in_order(self):
+        """Preset callbacks extend, after any already registered on the builder."""
+
+        def _existing(ctx, req):
+            pass
+
+        def _alias_cb(ctx, req):
+            pass
+
+        p = Preset(before_model_callback=_log_before, before_model=_alias_cb)
+        agent = Agent("math").before_model(_existing).use(p)
+        assert agent._callbacks["before_model_callback"] == [_existing, _log_before, _alias_cb]
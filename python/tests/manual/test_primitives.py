@@ -16,6 +16,7 @@ from adk_fluent._primitive_builders import (
     map_over,
     race,
     tap,
+    tap_log,
 )
 from adk_fluent.agent import Agent
 from adk_fluent.workflow import Loop, Pipeline
@@ -73,6 +74,72 @@ class TestTap:
         p2 = a >> t
         assert isinstance(p2, Pipeline)
 
+    def test_tap_log_keeps_tap_naming(self):
+        def after_research(s):
+            return "done"
+
+        t = tap_log(after_research)
+        assert isinstance(t, _TapBuilder)
+        assert t._config["name"] == "after_research"
+
+    def test_tap_log_batches_writes_on_the_event_loop(self, monkeypatch):
+        import asyncio
+        import io
+        import sys
+
+        from adk_fluent import _primitive_builders
+
+        monkeypatch.setattr(_primitive_builders, "_tap_log", _primitive_builders._TapLogBuffer())
+        out = io.StringIO()
+        writes = []
+        monkeypatch.setattr(out, "write", lambda data: writes.append(data) or len(data))
+        monkeypatch.setattr(sys, "stdout", out)
+        agent = tap_log(lambda s: f"n={s['n']}" if s["n"] else None).build()
+
+        async def run():
+            for n in (0, 1, 2, 3):
+                agent._fn_ref({"n": n})
+            assert writes == []  # nothing written on the hot path
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+        assert writes == ["n=1\nn=2\nn=3\n"]  # one write per batch
+
+    def test_tap_log_flushes_a_full_batch_instead_of_dropping(self, monkeypatch, capsys):
+        import asyncio
+
+        from adk_fluent import _primitive_builders
+
+        buffer = _primitive_builders._TapLogBuffer(max_pending=2, interval=60)
+        monkeypatch.setattr(_primitive_builders, "_tap_log", buffer)
+        agent = tap_log(lambda s: f"n={s['n']}").build()
+
+        async def run():
+            for n in (1, 2, 3):
+                agent._fn_ref({"n": n})
+
+        asyncio.run(run())
+        assert capsys.readouterr().out == "n=1\nn=2\n"
+        buffer.flush()
+        assert capsys.readouterr().out == "n=3\n"
+
+    def test_tap_log_recovers_from_a_closed_loop(self, monkeypatch, capsys):
+        import asyncio
+
+        from adk_fluent import _primitive_builders
+
+        buffer = _primitive_builders._TapLogBuffer(interval=60)
+        monkeypatch.setattr(_primitive_builders, "_tap_log", buffer)
+        agent = tap_log(lambda s: f"n={s['n']}").build()
+
+        async def post(n):
+            agent._fn_ref({"n": n})
+
+        asyncio.run(post(1))  # loop closes before its flush fires
+        asyncio.run(post(2))
+        assert capsys.readouterr().out == "n=1\nn=2\n"
+        assert buffer._flush_loop is None
+
 
 # ======================================================================
 # Primitive 2: expect
@@ -355,6 +422,22 @@ class TestGate:
         g = gate(lambda s: True)
         assert g._gate_key.startswith("_gate_")
 
+    def test_structured_gates_compare_state(self):
+        big_deal = gate.gt("deal_value_usd", 10_000_000, message="Approve large deal?").build()
+        assert big_deal._message == "Approve large deal?"
+        assert big_deal._needs_gate({"deal_value_usd": 20_000_000})
+        assert not big_deal._needs_gate({"deal_value_usd": 5})
+        assert not big_deal._needs_gate({})  # missing numeric key reads as 0
+        assert big_deal._needs_gate({"deal_value_usd": "20000000"})  # numeric strings compare as numbers
+        assert big_deal._needs_gate({"deal_value_usd": "n/a"})  # unreadable values ask for approval
+        assert big_deal._needs_gate({"deal_value_usd": None})
+
+        risky = gate.eq("liability_risk", "high", gate_key="_legal").build()
+        assert risky._gate_key == "_legal"
+        assert risky._needs_gate({"liability_risk": "high"})
+        assert not risky._needs_gate({"liability_risk": "low"})
+        assert risky._predicate({"liability_risk": "high"}) is True  # still a plain predicate
+
 
 # ======================================================================
 # Primitive 8: race
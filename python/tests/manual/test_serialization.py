@@ -67,3 +67,10 @@ class TestYaml:
         result = agent.to_yaml()
         assert "gemini-2.5-flash" in result
         assert "Do math." in result
+
+    def test_to_yaml_matches_pure_python_dumper(self):
+        import yaml
+
+        agent = Agent("math").model("gemini-2.5-flash").instruct("Do math.\nShow work.").before_model(_my_callback)
+        expected = yaml.dump(agent.to_dict(), Dumper=yaml.Dumper, default_flow_style=False)
+        assert agent.to_yaml() == expected
@@ -9,3 +9,51 @@ class TestSessionMechanics:
         builder = Agent("test").instruct("test")
         assert hasattr(builder, "session")
         assert callable(builder.session)
+
+    def test_session_defers_runner_until_send(self):
+        """Entering and leaving a session builds the agent but no Runner."""
+        import asyncio
+
+        from adk_fluent._helpers import ChatSession
+
+        async def enter_and_exit():
+            async with Agent("test").model("gemini-2.5-flash").instruct("test").session() as chat:
+                return chat
+
+        chat = asyncio.run(enter_and_exit())
+        assert isinstance(chat, ChatSession)
+        assert chat._runner is None
+        assert chat._session is None
+        assert chat._agent.name == "test"
+
+    def test_concurrent_first_sends_share_one_runner(self, monkeypatch):
+        """Two sends racing to start the session create one Runner and one session."""
+        import asyncio
+
+        import google.adk.runners as runners
+
+        created = []
+        real_runner = runners.InMemoryRunner
+
+        def counting_runner(**kwargs):
+            runner = real_runner(**kwargs)
+            created.append(runner)
+            create_session = runner.session_service.create_session
+
+            async def slow_create_session(**kw):
+                await asyncio.sleep(0)  # yield so the second start can interleave
+                return await create_session(**kw)
+
+            runner.session_service.create_session = slow_create_session
+            return runner
+
+        monkeypatch.setattr(runners, "InMemoryRunner", counting_runner)
+
+        async def start_twice():
+            async with Agent("test").model("gemini-2.5-flash").instruct("test").session() as chat:
+                await asyncio.gather(chat._ensure_started(), chat._ensure_started())
+                return chat
+
+        chat = asyncio.run(start_twice())
+        assert len(created) == 1
+        assert chat._runner is created[0]
@@ -112,6 +112,40 @@ class TestJsonlBackend:
         data = path.read_text().strip().splitlines()
         assert json.loads(data[0])["seq"] == 0
 
+    def test_batch_buffers_until_full(self, tmp_path: Path):
+        path = tmp_path / "tape.jsonl"
+        b = JsonlBackend(path, batch=3)
+        b.append({"seq": 0, "kind": "k", "type": "X"})
+        b.append({"seq": 1, "kind": "k", "type": "X"})
+        assert not path.exists()  # still buffered
+        assert b.head() == 2
+        b.append({"seq": 2, "kind": "k", "type": "X"})
+        assert len(path.read_text().splitlines()) == 3
+
+    def test_batch_reads_see_buffered_entries(self, tmp_path: Path):
+        path = tmp_path / "tape.jsonl"
+        b = JsonlBackend(path, batch=10)
+        b.append({"seq": 0, "kind": "k", "type": "X"})
+        assert [e["seq"] for e in b.read_since(0)] == [0]
+
+    def test_batch_flushed_when_collected(self, tmp_path: Path):
+        import gc
+
+        path = tmp_path / "tape.jsonl"
+        b = JsonlBackend(path, batch=10)
+        b.append({"seq": 0, "kind": "k", "type": "X"})
+        del b
+        gc.collect()
+        assert json.loads(path.read_text())["seq"] == 0
+
+    def test_batch_clear_drops_buffered(self, tmp_path: Path):
+        path = tmp_path / "tape.jsonl"
+        b = JsonlBackend(path, batch=10)
+        b.append({"seq": 0, "kind": "k", "type": "X"})
+        b.clear()
+        b.flush()
+        assert not path.exists()
+
 
 class TestChainBackend:
     def test_broadcasts_to_all(self, tmp_path: Path):
@@ -127,6 +127,16 @@ class TestTemporalCompile:
         result = backend.compile(node)
         assert result.ir is node
 
+    def test_compile_race_rejects_accept(self):
+        """A race accept predicate cannot reach generated workflow code."""
+        from adk_fluent._ir import RaceNode
+
+        backend = TemporalBackend()
+        children = (AgentNode(name="a"), AgentNode(name="b"))
+        assert backend.compile(RaceNode(name="race", children=children)).node_plan[0]["node_type"] == "RaceNode"
+        with pytest.raises(NotImplementedError, match="accept"):
+            backend.compile(RaceNode(name="race", children=children, accept=lambda text: True))
+
 
 class TestTemporalRun:
     def test_run_without_client_raises(self):
@@ -113,6 +113,10 @@ class TestMerge:
         assert isinstance(result, StateDelta)
         assert result.updates == {"c": "only"}
 
+    def test_single_key_and_key_order(self):
+        assert S.merge("a", into="c")({"a": 1}).updates == {"c": "1"}
+        assert S.merge("b", "a", "c", into="d")({"a": 1, "b": 2, "c": 3}).updates == {"d": "2\n1\n3"}
+
     def test_name(self):
         fn = S.merge("a", "b", into="c")
         assert fn.__name__ == "merge_a_b_into_c"
@@ -251,3 +255,50 @@ class TestCompositionWithPipeline:
         assert isinstance(pipeline, Pipeline)
         built = pipeline.build()
         assert len(built.sub_agents) == 5  # fanout, merge, default, writer, loop
+
+
+class TestFnStepFusion:
+    @staticmethod
+    def _run(agent, state):
+        import asyncio
+        import types
+
+        ctx = types.SimpleNamespace(session=types.SimpleNamespace(state=state))
+
+        async def _drain():
+            async for _ in agent._run_async_impl(ctx):
+                pass
+
+        asyncio.run(_drain())
+        return state
+
+    def test_adjacent_fn_steps_fuse_in_order(self):
+        from adk_fluent._primitives import FnAgent, FusedFnAgent
+
+        def double(s):
+            return {"n": s["n"] * 2}
+
+        def incr(s):
+            return {"n": s["n"] + 1}
+
+        built = (Agent("a").model("gemini-2.5-flash") >> double >> incr >> Agent("b") >> double).fused().build()
+        fused = built.sub_agents[1]
+        assert isinstance(fused, FusedFnAgent)
+        assert fused.name == "double__incr"
+        assert isinstance(built.sub_agents[3], FnAgent)  # a lone step is left as is
+        assert self._run(fused, {"n": 3}) == {"n": 7}  # each fn sees its predecessor's writes
+
+    def test_fused_steps_keep_replacement_semantics(self):
+        built = (Agent("a").model("gemini-2.5-flash") >> S.pick("x") >> S.default(y=1)).fused().build()
+        state = self._run(built.sub_agents[1], {"x": 1, "z": 2, "app:k": 3})
+        assert state == {"x": 1, "z": None, "app:k": 3, "y": 1}
+
+    def test_fan_out_branches_are_not_fused(self):
+        from adk_fluent._primitive_builders import _fn_step
+
+        built = (_fn_step(S.default(a=1)) | _fn_step(S.default(b=2))).fused().build()
+        assert len(built.sub_agents) == 2
+
+    def test_fn_steps_are_not_fused_by_default(self):
+        built = (Agent("a").model("gemini-2.5-flash") >> S.pick("x") >> S.default(y=1)).build()
+        assert len(built.sub_agents) == 3
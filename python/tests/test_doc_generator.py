@@ -396,3 +396,36 @@ class TestGenNamespaceReference:
         assert "STransform" in md
         assert "StateDelta" in md
         assert "StateReplacement" in md
+
+
+# ---------------------------------------------------------------------------
+# Incremental output
+# ---------------------------------------------------------------------------
+
+
+class TestWriteIfChanged:
+    def test_creates_missing_file(self, tmp_path):
+        from shared import write_if_changed
+
+        path = tmp_path / "page.md"
+        assert write_if_changed(path, "# Page\n") is True
+        assert path.read_text() == "# Page\n"
+
+    def test_unchanged_content_keeps_mtime(self, tmp_path):
+        import os
+
+        from shared import write_if_changed
+
+        path = tmp_path / "page.md"
+        path.write_text("# Page\n")
+        os.utime(path, (1_000_000, 1_000_000))
+        assert write_if_changed(path, "# Page\n") is False
+        assert path.stat().st_mtime == 1_000_000
+
+    def test_changed_content_is_written(self, tmp_path):
+        from shared import write_if_changed
+
+        path = tmp_path / "page.md"
+        path.write_text("old")
+        assert write_if_changed(path, "new") is True
+        assert path.read_text() == "new"
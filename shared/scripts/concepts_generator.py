@@ -2,6 +2,8 @@ import re
 import sys
 from pathlib import Path
 
+from shared import write_if_changed
+
 
 def _extract_three_channels(lines: list[str]) -> list[str]:
     """Extract the '## The Three Channels' H2 block up to the next H1.
@@ -125,7 +127,7 @@ def main():
     # Strip trailing empty strings to avoid double newlines at EOF
     while content and content[-1] == "":
         content.pop()
-    output_path.write_text("\n".join(content) + "\n")
+    write_if_changed(output_path, "\n".join(content) + "\n")
     print(f"Generated {output_path}")
 
     # Inject into user-guide/index.md toctree (idempotent, format-tolerant)
@@ -33,6 +33,7 @@ with contextlib.suppress(ImportError):
 # Import BuilderSpec resolution from generator (same directory)
 sys.path.insert(0, str(Path(__file__).parent))
 from generator import BuilderSpec, parse_manifest, parse_seed, resolve_builder_specs
+from shared import write_if_changed
 
 # ---------------------------------------------------------------------------
 # NAMESPACE MODULE SPECS (P, C, S, A, M, T)
@@ -1651,7 +1652,7 @@ def generate_docs(
         for module_name, module_specs in sorted(by_module.items()):
             md = gen_api_reference_module(module_specs, module_name)
             filepath = api_dir / f"{module_name}.md"
-            filepath.write_text(md)
+            write_if_changed(filepath, md)
             print(f"  Generated: {filepath}")
 
         # --- Namespace Module References (P, C, S, A, M, T) ---
@@ -1660,7 +1661,7 @@ def generate_docs(
             ns_methods = _introspect_namespace(ns)
             md = gen_namespace_reference(ns, ns_methods)
             filepath = api_dir / f"{ns.output_stem}.md"
-            filepath.write_text(md)
+            write_if_changed(filepath, md)
             namespace_stems.add(ns.output_stem)
             print(f"  Generated: {filepath}")
 
@@ -1716,7 +1717,7 @@ def generate_docs(
             index_md = "\n".join(new_lines)
 
         index_path = api_dir / "index.md"
-        index_path.write_text(index_md)
+        write_if_changed(index_path, index_md)
         print(f"  Generated: {index_path}")
 
     # --- Cookbook ---
@@ -1760,7 +1761,7 @@ def generate_docs(
                         continue
 
                 md = cookbook_to_markdown(parsed)
-                md_file.write_text(md)
+                write_if_changed(md_file, md)
                 print(f"  Generated: {md_file}")
 
             # Pick up hand-written .md files already in the output dir
@@ -1777,7 +1778,7 @@ def generate_docs(
             # Generate cookbook index
             index_md = gen_cookbook_index(all_parsed)
             index_path = cookbook_out / "index.md"
-            index_path.write_text(index_md)
+            write_if_changed(index_path, index_md)
             print(f"  Generated: {index_path}")
         else:
             print(f"  Cookbook directory {cookbook_dir} not found, skipping.")
@@ -1789,7 +1790,7 @@ def generate_docs(
 
         md = gen_migration_guide(specs, by_module)
         filepath = migration_dir / "from-native-adk.md"
-        filepath.write_text(md)
+        write_if_changed(filepath, md)
         print(f"  Generated: {filepath}")
 
     # --- Summary ---
@@ -29,6 +29,7 @@ from pathlib import Path
 # Import BuilderSpec resolution from generator (same directory)
 sys.path.insert(0, str(Path(__file__).parent))
 from generator import BuilderSpec, parse_manifest, parse_seed, resolve_builder_specs
+from shared import write_if_changed
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -2067,7 +2068,7 @@ def main():
         for relpath, wrapper in targets:
             outpath = root / relpath
             outpath.parent.mkdir(parents=True, exist_ok=True)
-            outpath.write_text(wrapper(content))
+            write_if_changed(outpath, wrapper(content))
             print(f"  Generated {relpath}")
             written += 1
 
@@ -2076,7 +2077,7 @@ def main():
         for relpath, wrapper in TS_TARGETS:
             outpath = root / relpath
             outpath.parent.mkdir(parents=True, exist_ok=True)
-            outpath.write_text(wrapper(ts_content))
+            write_if_changed(outpath, wrapper(ts_content))
             print(f"  Generated {relpath}")
             written += 1
 
@@ -79,6 +79,29 @@ def write_toml_or_json(
     return "TOML"
 
 
+# ---------------------------------------------------------------------------
+# File Output
+# ---------------------------------------------------------------------------
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` to ``path`` only if it differs from what is on disk.
+
+    Generated docs are rewritten on every ``just docs`` run. Leaving
+    unchanged files alone keeps their mtimes stable, so Sphinx's incremental
+    build skips re-reading those pages.
+
+    Returns True if the file was written.
+    """
+    try:
+        if path.read_text() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(content)
+    return True
+
+
 # ---------------------------------------------------------------------------
 # String Utilities
 # ---------------------------------------------------------------------------